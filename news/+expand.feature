@@ -0,0 +1 @@
+Added ``Calendar.expand(start, end)`` to yield the occurrences of all events, to-dos and journal entries in the order of their start. Components with a ``RECURRENCE-ID`` replace the occurrences that they modify, also with ``RANGE=THISANDFUTURE``.
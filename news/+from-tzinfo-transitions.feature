@@ -0,0 +1 @@
+``Timezone.from_tzinfo`` reads the transitions of :mod:`zoneinfo` and :mod:`pytz` timezones instead of searching for them, which is much faster and finds short periods of summer time. This intentionally changes the VTIMEZONE components of timezones with such periods, for example ``Egypt``, ``Africa/Casablanca`` and ``America/Argentina/La_Rioja``.
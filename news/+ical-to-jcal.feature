@@ -0,0 +1 @@
+Added :func:`~icalendar.parser.jcal.ical_to_jcal` to convert iCalendar data to jCal without creating components.
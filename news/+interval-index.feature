@@ -0,0 +1 @@
+Added ``Calendar.interval_index(start, end)`` to find the occurrences of events and to-dos that overlap with a time range or happen at a time, as the CalDAV ``time-range`` filter does. The index is kept with the calendar and ``Calendar.add_component()`` updates it.
@@ -0,0 +1 @@
+Added :meth:`Component.iter_jcal() <icalendar.cal.component.Component.iter_jcal>` and :class:`~icalendar.parser.jcal.JCalStreamParser` to parse large jCal files incrementally, one subcomponent at a time.
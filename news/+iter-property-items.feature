@@ -0,0 +1 @@
+Added :meth:`Component.iter_property_items() <icalendar.cal.component.Component.iter_property_items>` to iterate over the properties of a component tree without building a list. Serialization and :meth:`Calendar.get_used_tzids() <icalendar.cal.calendar.Calendar.get_used_tzids>` use it.
@@ -0,0 +1 @@
+Added :func:`~icalendar.parser.jcal.jcal_to_ical` and :func:`~icalendar.parser.jcal.iter_jcal_to_ical` to convert jCal to iCalendar without creating components.
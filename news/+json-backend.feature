@@ -0,0 +1 @@
+Added :data:`icalendar.config.JSON_BACKEND` and the ``json_backend`` parameter to plug another JSON library into the jCal conversion.
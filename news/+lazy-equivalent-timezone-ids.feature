@@ -0,0 +1 @@
+Load the equivalent timezone ids when they are first needed and store them as a compact string table, so that ``icalendar`` imports faster.
@@ -0,0 +1 @@
+Added :meth:`LazyCalendar.from_jcal() <icalendar.cal.lazy.LazyCalendar.from_jcal>` which keeps the jCal of the subcomponents until they are accessed.
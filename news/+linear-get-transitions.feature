@@ -0,0 +1 @@
+``Timezone.get_transitions`` computes the DST offsets in linear time and creates the rules of ``VTIMEZONE`` components without parsing them again, which is faster for components with many transitions.
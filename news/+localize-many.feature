@@ -0,0 +1 @@
+Added ``TZP.localize_many()`` and ``TZP.localize_utc_many()`` to localize many datetimes with one lookup of the timezone. ``RDATE`` and ``EXDATE`` values with a ``TZID`` are localized with them.
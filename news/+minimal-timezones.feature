@@ -0,0 +1 @@
+Added ``Calendar.get_tzid_date_ranges()`` and the ``minimal`` parameter of ``Calendar.add_missing_timezones()`` to add VTIMEZONE components that only cover the dates used in the calendar.
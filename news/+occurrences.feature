@@ -0,0 +1 @@
+Added ``occurrences(start, end)`` to ``Event``, ``Todo`` and ``Journal`` to compute the start of each occurrence from ``DTSTART``, ``RRULE``, ``RDATE`` and ``EXDATE`` in the timezone of ``DTSTART``. The compiled rules are kept with the component until these properties change.
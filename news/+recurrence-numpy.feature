@@ -0,0 +1 @@
+Added ``icalendar.recurrence_numpy.occurrence_array()`` to compute the occurrences of simple daily, weekly and monthly rules as NumPy ``datetime64`` arrays. NumPy is optional and only needed for this module.
@@ -0,0 +1 @@
+Add :data:`icalendar.config.SUBSTITUTE_TIMEZONES_SINCE` to use IANA timezones instead of equivalent custom ``VTIMEZONE`` components.
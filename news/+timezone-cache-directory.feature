@@ -0,0 +1 @@
+Set ``icalendar.config.TIMEZONE_CACHE_DIRECTORY`` to store compiled timezones and generated VTIMEZONE components on disk for other processes.
@@ -0,0 +1 @@
+Added the ``workers`` parameter to :meth:`Component.to_ical() <icalendar.cal.component.Component.to_ical>` to serialize the subcomponents of large calendars in a process pool.
@@ -0,0 +1 @@
+The ``zoneinfo`` provider creates timezones from VTIMEZONE components with a table of transitions instead of parsing them again with :mod:`dateutil`.
@@ -0,0 +1 @@
+VTIMEZONE components with the same content share one timezone, also across ``TZP.scope()``. See ``icalendar.timezone.tzinfo_cache``.
@@ -0,0 +1 @@
+Add ``TZP.scope()`` to cache the timezones of parsed ``VTIMEZONE`` components only for the current context.
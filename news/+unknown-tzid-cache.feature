@@ -0,0 +1 @@
+``TZP.timezone`` remembers timezone IDs that cannot be found so that unknown TZIDs are not looked up again for every property.
@@ -0,0 +1 @@
+``Timezone.from_tzid`` and ``Calendar.add_missing_timezones`` cache the generated VTIMEZONE components in ``icalendar.timezone.vtimezone_cache``, a bounded and thread-safe cache with statistics.
@@ -0,0 +1 @@
+Added :meth:`Component.write_jcal() <icalendar.cal.component.Component.write_jcal>` to write jCal JSON to a file component by component. :meth:`Component.to_json() <icalendar.cal.component.Component.to_json>` uses it.
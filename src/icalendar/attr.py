@@ -107,7 +107,8 @@ def _get_rdates(
         Modifying the returned list does not change the RDATE value. Assign to
         :attr:`rdates` or use :func:`icalendar.cal.Component.add` instead.
 
-        If you want to compute recurrences, have a look at
+        Use ``occurrences()`` to compute the recurrences within a time range.
+        For more features, have a look at
         `Related Projects <https://github.com/collective/icalendar/blob/main/README.rst#related-projects>`_.
 
     """
@@ -214,7 +215,8 @@ def _get_exdates(self: Component) -> list[date | datetime]:
         Modifying the returned list does not change the EXDATE value. Assign to
         :attr:`exdates` or use :func:`icalendar.cal.Component.add` instead.
 
-        If you want to compute recurrences, have a look at
+        Use ``occurrences()`` to compute the recurrences within a time range.
+        For more features, have a look at
         `Related Projects <https://github.com/collective/icalendar/blob/main/README.rst#related-projects>`_.
 
     """
@@ -349,7 +351,8 @@ def _get_rrules(self: Component) -> list[vRecur]:
         You cannot modify the RRULE value by modifying the result.
         Use :func:`icalendar.cal.Component.add` to add values.
 
-        If you want to compute recurrences, have a look at
+        Use ``occurrences()`` to compute the recurrences within a time range.
+        For more features, have a look at
         `Related Projects <https://github.com/collective/icalendar/blob/main/README.rst#related-projects>`_.
 
     """  # noqa: E501
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from datetime import timedelta
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Literal, cast, overload
 
 from icalendar.attr import (
@@ -23,11 +23,11 @@ from icalendar.cal.examples import get_example
 from icalendar.cal.timezone import Timezone
 from icalendar.error import IncompleteComponent
 from icalendar.parser.ical.calendar import CalendarIcalParser
+from icalendar.parser_tools import SEQUENCE_TYPES
 from icalendar.version import __version__
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
-    from datetime import date, datetime
+    from collections.abc import Iterable, Iterator, Sequence
     from pathlib import Path
 
     from icalendar.cal import (
@@ -38,7 +38,9 @@ if TYPE_CHECKING:
         Todo,
     )
     from icalendar.compatibility import Self
+    from icalendar.interval_index import IntervalIndex
     from icalendar.parser.ical.component import ComponentIcalParser
+    from icalendar.recurrence import Occurrence
 
 
 DEFAULT_PRODID = f"-//collective//icalendar//{__version__}//EN"
@@ -167,6 +169,114 @@ class Calendar(Component):
         """
         return self.walk("VJOURNAL")
 
+    def expand(self, start: date, end: date) -> Iterator[Occurrence]:
+        """Yield the occurrences of events, to-dos and journal entries.
+
+        The occurrences are yielded in the order of their start.
+        Each series is expanded once.
+        Components with a RECURRENCE-ID and the same UID replace
+        the occurrences that they modify.
+        With ``RANGE=THISANDFUTURE``, they also modify the later occurrences.
+
+        Parameters:
+            start: The occurrences end after this time.
+            end: The occurrences start before this time.
+                Dates and floating times are in the timezone of ``start``.
+
+        >>> from datetime import date
+        >>> from icalendar import Calendar
+        >>> calendar = Calendar.from_ical('''BEGIN:VCALENDAR
+        ... BEGIN:VEVENT
+        ... UID:daily
+        ... SUMMARY:Stand-up
+        ... DTSTART:20250106T090000Z
+        ... DURATION:PT15M
+        ... RRULE:FREQ=DAILY;COUNT=3
+        ... END:VEVENT
+        ... BEGIN:VEVENT
+        ... UID:daily
+        ... SUMMARY:Late stand-up
+        ... RECURRENCE-ID:20250107T090000Z
+        ... DTSTART:20250107T110000Z
+        ... DURATION:PT15M
+        ... END:VEVENT
+        ... END:VCALENDAR''')
+        >>> for occurrence in calendar.expand(date(2025, 1, 1), date(2025, 2, 1)):
+        ...     print(occurrence.start, occurrence.component["SUMMARY"])
+        2025-01-06 09:00:00+00:00 Stand-up
+        2025-01-07 11:00:00+00:00 Late stand-up
+        2025-01-08 09:00:00+00:00 Stand-up
+        """
+        from icalendar.recurrence import expand
+
+        return expand(self.subcomponents, start, end)
+
+    def interval_index(
+        self,
+        start: date,
+        end: date,
+        *,
+        validate: bool = False,
+        rebuild: bool = False,
+    ) -> IntervalIndex:
+        """Return an index of the occurrences of events and to-dos.
+
+        The index answers which occurrences overlap with a time range
+        and which happen at a time.
+        It is kept with the calendar and updated by :meth:`add_component`.
+        If subcomponents are added or removed otherwise,
+        a new index is created.
+        Subcomponents that are replaced or changed are only noticed
+        with ``validate=True``.
+        Changes inside property values, like ``event["DTSTART"].dt = ...``,
+        are never noticed; use ``rebuild=True`` after them.
+
+        Parameters:
+            start: The occurrences end after this time.
+            end: The occurrences start before this time.
+                Dates and floating times are in the timezone of ``start``.
+            validate: Compare each subcomponent with the index.
+                This takes time for large calendars.
+            rebuild: Create a new index and compile the recurrences
+                of the subcomponents again.
+
+        >>> from datetime import date, datetime
+        >>> from icalendar import Calendar, Event
+        >>> calendar = Calendar()
+        >>> index = calendar.interval_index(date(2025, 1, 1), date(2026, 1, 1))
+        >>> event = Event()
+        >>> event.start = date(2025, 5, 1)
+        >>> calendar.add_component(event)
+        >>> index.at(datetime(2025, 5, 1, 12))
+        [<Occurrence VEVENT 2025-05-01 - 2025-05-02>]
+        >>> index.overlapping(date(2025, 6, 1), date(2025, 7, 1))
+        []
+        """
+        from icalendar.interval_index import IntervalIndex
+
+        return IntervalIndex.of(self, start, end, validate=validate, rebuild=rebuild)
+
+    def add_component(self, component: Component) -> None:
+        """Add a subcomponent to this calendar.
+
+        The :meth:`interval_index` is updated.
+        """
+        super().add_component(component)
+        self._add_last_component_to_interval_index()
+
+    def _add_last_component_to_interval_index(self) -> None:
+        """Add the last subcomponent to the :meth:`interval_index`.
+
+        If the subcomponents were changed otherwise,
+        :meth:`interval_index` checks them when it is called next time.
+        """
+        index = self.__dict__.get("_interval_index")
+        if index is None:
+            return
+        subcomponents = self.subcomponents
+        if index.components == len(subcomponents) - 1:
+            index.add(subcomponents[-1])
+
     @property
     def availabilities(self) -> list[Availability]:
         """All :class:`Availability` components in the calendar.
@@ -201,7 +311,7 @@ class Calendar(Component):
         Even if you use UTC, this will not show up.
         """
         result = set()
-        for _name, value in self.property_items(sorted=False):
+        for _name, value in self.iter_property_items(sorted=False):
             if hasattr(value, "params"):
                 result.add(value.params.get("TZID"))
         return result - {None}
@@ -237,10 +347,88 @@ class Calendar(Component):
         """
         return self.walk("VTIMEZONE")
 
+    def get_tzid_date_ranges(
+        self, last_date: date = Timezone.DEFAULT_LAST_DATE
+    ) -> dict[str, tuple[date, date]]:
+        """The dates that are used with each TZID.
+
+        This goes through the date and time values with a TZID parameter,
+        like DTSTART, DTEND, RDATE, EXDATE and RECURRENCE-ID.
+        The end of a DURATION and the UNTIL of an RRULE
+        count for the TZID of DTSTART.
+
+        Parameters:
+            last_date: The end of recurrences without UNTIL.
+
+        Returns:
+            The first date and the day after the last date for each TZID.
+
+        Example:
+
+            .. code-block:: pycon
+
+                >>> from icalendar import Calendar
+                >>> calendar = Calendar.example("timezone_rdate")
+                >>> calendar.get_tzid_date_ranges()["posix/Europe/Vaduz"]
+                (datetime.date(2012, 2, 13), datetime.date(2012, 2, 14))
+        """
+        first_dates: dict[str, date] = {}
+        last_dates: dict[str, date] = {}
+
+        def use(tzid: str, dt: date | datetime) -> None:
+            day = dt.date() if isinstance(dt, datetime) else dt
+            if tzid not in first_dates or day < first_dates[tzid]:
+                first_dates[tzid] = day
+            day += timedelta(days=1)
+            if tzid not in last_dates or day > last_dates[tzid]:
+                last_dates[tzid] = day
+
+        for component in self.walk():
+            if component.name in ("VTIMEZONE", "STANDARD", "DAYLIGHT"):
+                continue
+            for value in component.values():
+                for prop in value if isinstance(value, list) else [value]:
+                    tzid = getattr(prop, "params", {}).get("TZID")
+                    if tzid is None:
+                        continue
+                    for ddd in getattr(prop, "dts", ()):
+                        dts = ddd.dt if isinstance(ddd.dt, tuple) else (ddd.dt,)
+                        for dt in dts:
+                            if isinstance(dt, date):
+                                use(tzid, dt)
+                            elif isinstance(dt, timedelta):
+                                # a PERIOD with a duration
+                                use(tzid, dts[0] + dt)
+            start = component.get("DTSTART")
+            tzid = getattr(start, "params", {}).get("TZID")
+            if tzid is None or not isinstance(start.dt, date):
+                continue
+            duration = component.get("DURATION")
+            if duration is not None and isinstance(duration.dt, timedelta):
+                use(tzid, start.dt + duration.dt)
+            for rrule in component.rrules:
+                until = rrule.get("UNTIL")
+                if isinstance(until, SEQUENCE_TYPES):
+                    until = until[0] if until else None
+                if (
+                    isinstance(until, datetime)
+                    and until.tzinfo is not None
+                    and isinstance(start.dt, datetime)
+                    and start.dt.tzinfo is not None
+                ):
+                    # a UTC UNTIL can be on another day in the timezone
+                    until = until.astimezone(start.dt.tzinfo)
+                if isinstance(until, date):
+                    use(tzid, until)
+                else:
+                    use(tzid, last_date - timedelta(days=1))
+        return {tzid: (first_dates[tzid], last_dates[tzid]) for tzid in first_dates}
+
     def add_missing_timezones(
         self,
         first_date: date = Timezone.DEFAULT_FIRST_DATE,
         last_date: date = Timezone.DEFAULT_LAST_DATE,
+        minimal: bool = False,
     ):
         """Add all missing VTIMEZONE components.
 
@@ -255,6 +443,10 @@ class Calendar(Component):
         Parameters:
             first_date: Earlier than anything that happens in the calendar.
             last_date: Later than anything happening in the calendar.
+            minimal: Whether each VTIMEZONE should only cover the dates
+                that are used with its TZID, see :meth:`get_tzid_date_ranges`.
+                These components are smaller and faster to create.
+                Recurrences without UNTIL are covered until ``last_date``.
 
         >>> from icalendar import Calendar, Event
         >>> from datetime import datetime
@@ -276,12 +468,12 @@ class Calendar(Component):
             return
 
         existing_timezone_count = len(self.timezones)
+        date_ranges = self.get_tzid_date_ranges(last_date) if minimal else {}
 
         for tzid in missing_tzids:
+            first, last = date_ranges.get(tzid, (first_date, last_date))
             try:
-                timezone = Timezone.from_tzid(
-                    tzid, first_date=first_date, last_date=last_date
-                )
+                timezone = Timezone.from_tzid(tzid, first_date=first, last_date=last)
             except ValueError:
                 continue
             self.subcomponents.insert(existing_timezone_count, timezone)
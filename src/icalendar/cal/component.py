@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta, timezone
+from io import StringIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, overload
+from typing import IO, TYPE_CHECKING, Any, ClassVar, Literal, TextIO, overload
 
 from icalendar.attr import (
     CONCEPTS_TYPE_SETTER,
@@ -23,6 +24,7 @@ from icalendar.attr import (
 )
 from icalendar.cal.component_factory import ComponentFactory
 from icalendar.caselessdict import CaselessDict
+from icalendar.config import _get_json_backend
 from icalendar.error import InvalidCalendar, JCalParsingError
 from icalendar.parser import (
     Contentline,
@@ -31,16 +33,19 @@ from icalendar.parser import (
     q_join,
     q_split,
 )
+from icalendar.parser.content_line import _parts_to_ical
 from icalendar.parser.ical.component import ComponentIcalParser
+from icalendar.parser.jcal import JCalStreamParser
 from icalendar.parser_tools import DEFAULT_ENCODING
 from icalendar.prop import VPROPERTY, TypesFactory, vDDDLists, vText, vUnknown
 from icalendar.timezone import tzp
 from icalendar.tools import is_date
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
     from icalendar.compatibility import Self
+    from icalendar.config import JSONBackend
 
 _marker = []
 
@@ -489,40 +494,66 @@ class Component(CaselessDict):
         """Returns properties in this component and subcomponents as a list.
 
         The list contains ``(name, value)`` tuples.
+        See :meth:`iter_property_items` to iterate without creating the list.
+        """
+        return list(self.iter_property_items(recursive=recursive, sorted=sorted))
+
+    def iter_property_items(
+        self,
+        recursive: bool = True,
+        sorted: bool = True,
+    ) -> Iterator[tuple[str, object]]:
+        """Iterate over the properties in this component and subcomponents.
+
+        This yields the same ``(name, value)`` tuples as
+        :meth:`property_items`, one after the other, so that the memory
+        used does not grow with the number of properties.
+
+        Example:
+
+            .. code-block:: pycon
+
+                >>> from icalendar import Event
+                >>> event = Event()
+                >>> event.add("summary", "Meeting")
+                >>> for name, value in event.iter_property_items():
+                ...     print(name, repr(value))
+                BEGIN b'VEVENT'
+                SUMMARY vText(b'Meeting')
+                END b'VEVENT'
+
         """
         # Iterative implementation to avoid RecursionError
-        result = []
         v_text = self.types_factory["text"]
-        # Stack stores (component, state)
-        # state: True means we are processing the END of the component
-        # state: False means we are processing the BEGIN and properties of the component
-        stack = [(self, False)]
+        # Stack stores (component, name)
+        # name is None while we process the BEGIN and properties of the component
+        # name is the encoded name when we process the END of the component
+        stack: list[tuple[Component, bytes | None]] = [(self, None)]
         while stack:
-            comp, is_end = stack.pop()
-            if is_end:
-                result.append(("END", v_text(comp.name).to_ical()))
-            else:
-                result.append(("BEGIN", v_text(comp.name).to_ical()))
-                property_names = comp.sorted_keys() if sorted else comp.keys()
-
-                for name in property_names:
-                    values = comp[name]
-                    if isinstance(values, list):
-                        # normally one property is one line
-                        for value in values:
-                            result.append((name, value))
-                    else:
-                        result.append((name, values))
+            comp, end_name = stack.pop()
+            if end_name is not None:
+                yield ("END", end_name)
+                continue
+            name = v_text(comp.name).to_ical()
+            yield ("BEGIN", name)
+            property_names = comp.sorted_keys() if sorted else comp.keys()
+
+            for property_name in property_names:
+                values = comp[property_name]
+                if isinstance(values, list):
+                    # normally one property is one line
+                    for value in values:
+                        yield (property_name, value)
+                else:
+                    yield (property_name, values)
 
-                # Push the END marker for this component
-                stack.append((comp, True))
-                # Push subcomponents if recursion is enabled
-                if recursive:
-                    # Push in reverse order to maintain original order in result
-                    for subcomponent in reversed(comp.subcomponents):
-                        stack.append((subcomponent, False))
-
-        return result
+            # Push the END marker for this component
+            stack.append((comp, name))
+            # Push subcomponents if recursion is enabled
+            if recursive:
+                # Push in reverse order to maintain original order in result
+                for subcomponent in reversed(comp.subcomponents):
+                    stack.append((subcomponent, None))
 
     @overload
     @classmethod
@@ -611,20 +642,66 @@ class Component(CaselessDict):
     def content_lines(self, sorted: bool = True):
         """Converts the Component and subcomponents into content lines."""
         contentlines = Contentlines()
-        for name, value in self.property_items(sorted=sorted):
+        for name, value in self.iter_property_items(sorted=sorted):
             cl = self.content_line(name, value, sorted=sorted)
             contentlines.append(cl)
         contentlines.append("")  # remember the empty string in the end
         return contentlines
 
-    def to_ical(self, sorted: bool = True):
-        """
-        :param sorted: Whether parameters and properties should be
-                       lexicographically sorted.
+    def to_ical(self, sorted: bool = True, workers: int | None = None) -> bytes:
+        """Serialize the component and its subcomponents to iCalendar bytes.
+
+        Parameters:
+            sorted: Whether parameters and properties should be
+                lexicographically sorted.
+            workers: If this is a number greater than ``1``, the direct
+                subcomponents are serialized in a pool of this many processes
+                and the results are joined in order.
+                The result is the same as with ``workers=None``.
+                This only pays off for very large calendars because the
+                subcomponents have to be pickled to reach the processes.
+                Timezones that ``pytz`` creates from a ``VTIMEZONE``
+                component can not be pickled.
+
+        Example:
+
+            .. code-block:: pycon
+
+                >>> from icalendar import Calendar
+                >>> calendar = Calendar.example()
+                >>> calendar.to_ical(workers=2) == calendar.to_ical()
+                True
+
         """
+        if workers is not None and workers > 1 and len(self.subcomponents) > 1:
+            return self._to_ical_in_processes(sorted, workers)
+        return _components_to_ical([self], sorted)
+
+    def _to_ical_in_processes(self, sorted: bool, workers: int) -> bytes:
+        """Serialize the subcomponents in a process pool.
 
-        content_lines = self.content_lines(sorted=sorted)
-        return content_lines.to_ical()
+        The subcomponents are split into a few chunks per worker so that
+        each process receives a few large pickles instead of many small ones.
+        """
+        subcomponents = self.subcomponents
+        chunk_count = min(len(subcomponents), workers * 4)
+        chunk_size = -(-len(subcomponents) // chunk_count)
+        chunks = [
+            subcomponents[i : i + chunk_size]
+            for i in range(0, len(subcomponents), chunk_size)
+        ]
+        # BEGIN and the own properties, then the subcomponents, then END
+        own_items = list(self.iter_property_items(recursive=False, sorted=sorted))
+        end = own_items.pop()
+        result = bytearray()
+        _write_property_items(result, own_items, sorted)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk in executor.map(
+                _components_to_ical, chunks, [sorted] * len(chunks)
+            ):
+                result += chunk
+        _write_property_items(result, [end], sorted)
+        return bytes(result)
 
     def __repr__(self) -> str:
         """String representation of class with all of its subcomponents.
@@ -950,12 +1027,7 @@ class Component(CaselessDict):
         # Iterative tree walk to avoid RecursionError on deeply nested
         # components, mirroring the iterative iCal parser/serializer (GH #1370).
         def make_node(comp: Component) -> list:
-            properties = [
-                item.to_jcal(key.lower())
-                for key, value in comp.items()
-                for item in (value if isinstance(value, list) else [value])
-            ]
-            return [comp.name.lower(), properties, []]
+            return [comp.name.lower(), _properties_to_jcal(comp), []]
 
         root_node = make_node(self)
         # stack of (component, jCal node) pairs still to expand
@@ -969,22 +1041,84 @@ class Component(CaselessDict):
                 stack.append((subcomponent, child_node))
         return root_node
 
-    def to_json(self) -> str:
+    def to_json(self, json_backend: JSONBackend | None = None) -> str:
         """Return this component as a jCal JSON string.
 
+        Parameters:
+            json_backend: The JSON backend to encode the jCal with.
+                The default is :data:`icalendar.config.JSON_BACKEND`.
+
         Returns:
             JSON string
 
-        See also :attr:`to_jcal`.
+        See also :attr:`to_jcal` and :meth:`write_jcal`.
+        """
+        file = StringIO()
+        self.write_jcal(file, json_backend)
+        return file.getvalue()
+
+    def write_jcal(self, file: TextIO, json_backend: JSONBackend | None = None) -> None:
+        """Write this component as jCal JSON to a text file.
+
+        The JSON is written component by component, so that the jCal of the
+        whole calendar is never held in memory at once.
+        The written text is the same as :meth:`to_json` returns.
+
+        Parameters:
+            file: A text file or any object with a ``write(str)`` method.
+            json_backend: The JSON backend to encode the jCal with.
+                The default is :data:`icalendar.config.JSON_BACKEND`.
+
+        Example:
+
+            .. code-block:: pycon
+
+                >>> from io import StringIO
+                >>> from icalendar import Calendar, Event
+                >>> calendar = Calendar()
+                >>> calendar.add("version", "2.0")
+                >>> event = Event()
+                >>> event.add("summary", "Meeting")
+                >>> calendar.add_component(event)
+                >>> file = StringIO()
+                >>> calendar.write_jcal(file)
+                >>> print(file.getvalue())
+                ["vcalendar", [["version", {}, "text", "2.0"]], [["vevent", [["summary", {}, "text", "Meeting"]], []]]]
+
         """
-        return json.dumps(self.to_jcal())
+        write = file.write
+        dumps = _get_json_backend(json_backend).dumps
+        # Iterative tree walk to avoid RecursionError, like in :meth:`to_jcal`.
+        # The stack holds the components to write, ``None`` to close a
+        # component and ``", "`` to separate two components.
+        stack: list[Component | str | None] = [self]
+        while stack:
+            item = stack.pop()
+            if item is None:
+                write("]]")
+            elif isinstance(item, str):
+                write(item)
+            else:
+                write(
+                    f"[{dumps(item.name.lower())}, "
+                    f"{dumps(_properties_to_jcal(item))}, ["
+                )
+                stack.append(None)
+                for i, subcomponent in enumerate(reversed(item.subcomponents)):
+                    if i:
+                        stack.append(", ")
+                    stack.append(subcomponent)
 
     @classmethod
-    def from_jcal(cls, jcal: str | list) -> Component:
+    def from_jcal(
+        cls, jcal: str | list, json_backend: JSONBackend | None = None
+    ) -> Component:
         """Create a component from a jCal list.
 
         Parameters:
             jcal: jCal list or JSON string according to :rfc:`7265`.
+            json_backend: The JSON backend to decode a JSON string with.
+                The default is :data:`icalendar.config.JSON_BACKEND`.
 
         Raises:
             ~error.JCalParsingError: If the jCal provided is invalid.
@@ -1026,7 +1160,7 @@ class Component(CaselessDict):
 
         """
         if isinstance(jcal, str):
-            jcal = json.loads(jcal)
+            jcal = _get_json_backend(json_backend).loads(jcal)
         # Iterative tree build to avoid RecursionError on deeply nested jCal,
         # mirroring the iterative iCal parser (GH #1370). ``_node_from_jcal``
         # parses a single component (without its subcomponents); the stack walks
@@ -1049,6 +1183,47 @@ class Component(CaselessDict):
                 stack.append((child, child_subcomponents, child_prefix))
         return root
 
+    @classmethod
+    def iter_jcal(cls, file: IO) -> JCalStreamParser:
+        """Parse a jCal file incrementally.
+
+        Use this instead of :meth:`from_jcal` for very large documents.
+        The subcomponents of the root component are parsed and returned one by
+        one while the file is read, so neither the whole JSON document
+        nor the whole component tree need to fit into memory.
+
+        Parameters:
+            file: A text or binary file containing jCal JSON.
+
+        Returns:
+            An iterator over the subcomponents of the root component.
+            Its :attr:`~icalendar.parser.jcal.JCalStreamParser.root` attribute
+            is the root component without subcomponents.
+
+        Raises:
+            ~error.JCalParsingError: If the jCal provided is invalid.
+            ~json.JSONDecodeError: If the file does not contain valid JSON.
+
+        Example:
+
+            .. code-block:: pycon
+
+                >>> from io import StringIO
+                >>> from icalendar import Calendar
+                >>> calendar = Calendar.example()
+                >>> file = StringIO(calendar.to_json())
+                >>> subcomponents = Calendar.iter_jcal(file)
+                >>> print(subcomponents.root.prodid)
+                collective/icalendar
+                >>> for event in subcomponents:
+                ...     print(event.summary)
+                New Year's Day
+                Orthodox Christmas
+                International Women's Day
+
+        """
+        return JCalStreamParser(file, cls)
+
     def copy(self, recursive: bool = False) -> Self:
         """Copy the component.
 
@@ -1115,6 +1290,46 @@ class Component(CaselessDict):
         return self
 
 
+def _write_property_items(
+    result: bytearray,
+    items: Iterable[tuple[str, object]],
+    sorted: bool,
+) -> None:
+    """Write the content lines of property items to a buffer.
+
+    This gives the same bytes as :meth:`Contentlines.to_ical` but does not
+    create a :class:`Contentline` for every property.
+    """
+    for name, value in items:
+        result += _parts_to_ical(
+            name, getattr(value, "params", None), value, sorted=sorted
+        )
+        result += b"\r\n"
+
+
+def _components_to_ical(components: list[Component], sorted: bool) -> bytes:
+    """Serialize components to iCalendar bytes and join them.
+
+    This is a module-level function so that :meth:`Component.to_ical`
+    can run it in another process.
+    """
+    result = bytearray()
+    for component in components:
+        _write_property_items(
+            result, component.iter_property_items(sorted=sorted), sorted
+        )
+    return bytes(result)
+
+
+def _properties_to_jcal(component: Component) -> list:
+    """Return the jCal properties of a component without its subcomponents."""
+    return [
+        item.to_jcal(key.lower())
+        for key, value in component.items()
+        for item in (value if isinstance(value, list) else [value])
+    ]
+
+
 def _node_from_jcal(jcal, starting_cls: type[Component]) -> tuple[Component, list]:
     """Parse a single jCal component without recursing into subcomponents.
 
@@ -266,6 +266,30 @@ class Event(Component):
 
         return Alarms(self)
 
+    def occurrences(self, start: date, end: date) -> list[date | datetime]:
+        """The start of each occurrence from ``start`` until before ``end``.
+
+        The occurrences are computed from DTSTART, RRULE, RDATE and EXDATE
+        in the timezone of DTSTART.
+        The compiled rules are kept with the event until one of these
+        properties is replaced or an RRULE changes.
+
+        >>> from datetime import date
+        >>> from icalendar import Event
+        >>> event = Event.from_ical('''BEGIN:VEVENT
+        ... DTSTART;TZID=Europe/Berlin:20250326T100000
+        ... RRULE:FREQ=WEEKLY;COUNT=3
+        ... EXDATE;TZID=Europe/Berlin:20250402T100000
+        ... END:VEVENT''')
+        >>> for occurrence in event.occurrences(date(2025, 1, 1), date(2026, 1, 1)):
+        ...     print(occurrence)
+        2025-03-26 10:00:00+01:00
+        2025-04-09 10:00:00+02:00
+        """
+        from icalendar.recurrence import Recurrence
+
+        return Recurrence.of(self).between(start, end)
+
     @classmethod
     def example(cls, name: str = "rfc_9074_example_3") -> Event:
         """Return the calendar example with the given name."""
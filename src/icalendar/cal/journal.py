@@ -152,6 +152,17 @@ class Journal(Component):
         """The journal has no duration: timedelta(0)."""
         return timedelta(0)
 
+    def occurrences(self, start: date, end: date) -> list[date | datetime]:
+        """The start of each occurrence from ``start`` until before ``end``.
+
+        The occurrences are computed from DTSTART, RRULE, RDATE and EXDATE
+        in the timezone of DTSTART.
+        A journal entry without DTSTART has no occurrences.
+        """
+        from icalendar.recurrence import Recurrence
+
+        return Recurrence.of(self).between(start, end)
+
     color = color_property
     sequence = sequence_property
     categories = categories_property
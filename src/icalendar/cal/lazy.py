@@ -5,15 +5,19 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Literal
 
 from icalendar.cal.component_factory import ComponentFactory
-from icalendar.parser.ical.lazy import LazyCalendarIcalParser
+from icalendar.config import _get_json_backend
+from icalendar.error import JCalParsingError
+from icalendar.parser.ical.lazy import LazyCalendarIcalParser, LazySubcomponent
+from icalendar.parser.jcal import JCalSubcomponentParser
 
 from .calendar import Calendar
+from .component import _node_from_jcal
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from icalendar.config import JSONBackend
     from icalendar.parser.ical.component import ComponentIcalParser
-    from icalendar.parser.ical.lazy import LazySubcomponent
 
     from .component import Component
 
@@ -242,14 +246,67 @@ class LazyCalendar(Calendar):
         factory.add_component_class(cls)
         return factory
 
+    @classmethod
+    def from_jcal(
+        cls, jcal: str | list, json_backend: JSONBackend | None = None
+    ) -> Component:
+        """Create a calendar from jCal and parse its subcomponents lazily.
+
+        The properties of the calendar are parsed immediately.
+        The jCal of the subcomponents is kept and only parsed
+        when the subcomponents are accessed.
+        See :meth:`Component.from_jcal()
+        <icalendar.cal.component.Component.from_jcal>` for the parameters.
+
+        Example:
+
+            .. code-block:: pycon
+
+                >>> from icalendar import Calendar, LazyCalendar
+                >>> jcal = Calendar.example("issue_1050_all_components").to_jcal()
+                >>> calendar = LazyCalendar.from_jcal(jcal)
+                >>> len(calendar.events)
+                1
+                >>> calendar.is_lazy()
+                True
+
+        """
+        if isinstance(jcal, str):
+            jcal = _get_json_backend(json_backend).loads(jcal)
+        calendar, subcomponents = _node_from_jcal(jcal, cls)
+        if not isinstance(calendar, LazyCalendar):
+            # Only calendars parse their subcomponents lazily.
+            return super().from_jcal(jcal)
+        for i, subcomponent in enumerate(subcomponents):
+            if (
+                not isinstance(subcomponent, list)
+                or len(subcomponent) != 3
+                or not isinstance(subcomponent[0], str)
+            ):
+                # Raise the error of the invalid component.
+                with JCalParsingError.reraise_with_path_added(2, i):
+                    _node_from_jcal(subcomponent, cls)
+            name = subcomponent[0].upper()
+            calendar.add_component(
+                LazySubcomponent(
+                    name,
+                    JCalSubcomponentParser(
+                        subcomponent, cls.get_component_class(name), [2, i]
+                    ),
+                )
+            )
+        return calendar
+
     def add_component(self, component: Component) -> None:
         """Add a component to the calendar.
 
         Use this instead of appending to
         :attr:`~icalendar.cal.lazy.LazyCalendar.subcomponents`,
         as the latter does not parse the whole calendar.
+        The :meth:`interval_index` is updated.
         """
         self._subcomponents = self._subcomponents.add_component(component)
+        self._add_last_component_to_interval_index()
 
     def is_lazy(self) -> bool:
         """Whether the subcomponents will be parsed lazily.
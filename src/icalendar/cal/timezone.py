@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections import defaultdict
 from datetime import date, datetime, timedelta, tzinfo
+from datetime import timezone as dt_timezone
 from typing import TYPE_CHECKING
 
 import dateutil.rrule
@@ -18,7 +20,9 @@ from icalendar.attr import (
 from icalendar.cal.component import Component
 from icalendar.cal.examples import get_example
 from icalendar.prop import vUTCOffset
-from icalendar.timezone import TZP, tzp
+from icalendar.recurrence import rrule_from_recur
+from icalendar.timezone import TZP, disk_cache, tzp, vtimezone_cache
+from icalendar.timezone.transitions import get_utc_transition_times
 from icalendar.timezone.tzid import tzid_from_tzinfo
 from icalendar.tools import to_datetime
 
@@ -77,14 +81,14 @@ class Timezone(Component):
             tzi = dateutil.tz.tzoffset("(offsetfrom)", offsetfrom)
             rrstart = dtstart.replace(tzinfo=tzi)
 
-            rrulestr = component["RRULE"].to_ical().decode("utf-8")
-            rrule = dateutil.rrule.rrulestr(rrulestr, dtstart=rrstart)
-            tzp.fix_rrule_until(rrule, component["RRULE"])
-
             # constructing the timezone requires UTC transition times.
             # here we construct local times without tzinfo, the offset to UTC
             # gets subtracted in to_tz().
-            transtimes = [dt.replace(tzinfo=None) for dt in rrule]
+            transtimes = []
+            for recur in component.rrules:
+                rrule = rrule_from_recur(recur, rrstart)
+                tzp.fix_rrule_until(rrule, recur)
+                transtimes.extend(dt.replace(tzinfo=None) for dt in rrule)
 
         # or rdates
         elif "RDATE" in component:
@@ -124,9 +128,14 @@ class Timezone(Component):
         :param tzp: timezone provider to use
         :param lookup_tzid: whether to use the TZID property to look up existing
                             timezone definitions with tzp.
-                            If it is False, a new timezone will be created.
+                            If it is False, the timezone is created from this
+                            component.
                             If it is True, the existing timezone will be used
-                            if it exists, otherwise a new timezone will be created.
+                            if it exists, otherwise the timezone is created
+                            from this component.
+
+        Components with the same content share the created timezone,
+        see :data:`~icalendar.timezone.cache.tzinfo_cache`.
         """
         if lookup_tzid:
             tz = tzp.timezone(self.tz_name)
@@ -190,29 +199,33 @@ class Timezone(Component):
         # (utcoffset, dstoffset, name)
         # dstoffset = 0, if current transition is to standard time
         #           = this_utcoffset - prev_standard_utcoffset, otherwise
+        # When the first transitions are to dst, there is no standard
+        # transition in the past, so we use the next one in the future.
+        # We go backwards once to know the next standard offset everywhere.
+        next_standard_osto = [None] * len(transitions)
+        standard_osto = None
+        for num in range(len(transitions) - 1, -1, -1):
+            _transtime, _osfrom, osto, name = transitions[num]
+            if not dst[name]:
+                standard_osto = osto
+            next_standard_osto[num] = standard_osto
         transition_info = []
+        standard_osto = None
         for num, (_transtime, osfrom, osto, name) in enumerate(transitions):
-            dst_offset = False
             if not dst[name]:
                 dst_offset = timedelta(seconds=0)
+                standard_osto = osto
+            elif standard_osto is not None and osto != standard_osto:
+                dst_offset = osto - standard_osto
+            elif next_standard_osto[num] is not None:
+                dst_offset = osto - next_standard_osto[num]
+            elif standard_osto is not None:
+                dst_offset = timedelta(seconds=0)
             else:
-                # go back in time until we find a transition to dst
-                for index in range(num - 1, -1, -1):
-                    if not dst[transitions[index][3]]:  # [3] is the name
-                        dst_offset = osto - transitions[index][2]  # [2] is osto
-                        break
-                # when the first transition is to dst, we didn't find anything
-                # in the past, so we have to look into the future
-                if not dst_offset:
-                    for index in range(num, len(transitions)):
-                        if not dst[transitions[index][3]]:  # [3] is the name
-                            dst_offset = osto - transitions[index][2]  # [2] is osto
-                            break
                 # If we still haven't found a STANDARD transition
                 # (only DAYLIGHT exists), calculate dst_offset as the
                 # difference from TZOFFSETFROM. Handles Issue #321.
-                if dst_offset is False:
-                    dst_offset = osto - osfrom
+                dst_offset = osto - osfrom
             transition_info.append((osto, dst_offset, name))
         return transition_times, transition_info
 
@@ -233,44 +246,14 @@ class Timezone(Component):
     ]
 
     @classmethod
-    def from_tzinfo(
-        cls,
-        timezone: tzinfo,
-        tzid: str | None = None,
-        first_date: date = DEFAULT_FIRST_DATE,
-        last_date: date = DEFAULT_LAST_DATE,
-    ) -> Timezone:
-        """Return a VTIMEZONE component from a timezone object.
-
-        This works with pytz and zoneinfo and any other timezone.
-        The offsets are calculated from the tzinfo object.
-
-        Parameters:
-
-        :param tzinfo: the timezone object
-        :param tzid: the tzid for this timezone. If None, it will be extracted from the tzinfo.
-        :param first_date: a datetime that is earlier than anything that happens in the calendar
-        :param last_date: a datetime that is later than anything that happens in the calendar
-        :raises ValueError: If we have no tzid and cannot extract one.
+    def _offsets_by_probing(
+        cls, timezone: tzinfo, first_datetime: datetime, last_datetime: datetime
+    ) -> dict[tuple[timedelta | None, timedelta, str, bool], list[datetime]]:
+        """Find the transitions by searching for changes of the UTC offset.
 
-        .. note::
-            This can take some time. Please cache the results.
+        This works with any tzinfo object.
         """
-        if tzid is None:
-            tzid = tzid_from_tzinfo(timezone)
-            if tzid is None:
-                raise ValueError(
-                    f"Cannot get TZID from {timezone}. Please set the tzid parameter."
-                )
         normalize = getattr(timezone, "normalize", lambda dt: dt)  # pytz compatibility
-        first_datetime = datetime(first_date.year, first_date.month, first_date.day)
-        last_datetime = datetime(last_date.year, last_date.month, last_date.day)
-        if hasattr(timezone, "localize"):  # pytz compatibility
-            first_datetime = timezone.localize(first_datetime)
-            last_datetime = timezone.localize(last_datetime)
-        else:
-            first_datetime = first_datetime.replace(tzinfo=timezone)
-            last_datetime = last_datetime.replace(tzinfo=timezone)
         # from, to, tzname, is_standard -> start
         offsets: dict[tuple[timedelta | None, timedelta, str, bool], list[datetime]] = (
             defaultdict(list)
@@ -305,6 +288,106 @@ class Timezone(Component):
             #     offsets[first_key] = offsets.pop(first_key)
             offsets[key].append(start.replace(tzinfo=None))
             start = normalize(end + cls._from_tzinfo_skip_search[-1])
+        return offsets
+
+    @staticmethod
+    def _offsets_from_transitions(
+        timezone: tzinfo, first_datetime: datetime, last_datetime: datetime
+    ) -> dict[tuple[timedelta | None, timedelta, str, bool], list[datetime]] | None:
+        """Find the transitions in the transition table of the timezone.
+
+        The result contains the transitions of :meth:`_offsets_by_probing`
+        and also periods that are shorter than the steps of probing,
+        like the summer time of ``Egypt`` in September 2010.
+        This is intended: the VTIMEZONE components of these timezones
+        are more accurate than before.
+
+        Returns:
+            ``None`` if the timezone has no transition table.
+        """
+        transition_times = get_utc_transition_times(
+            timezone, last_datetime.replace(tzinfo=None)
+        )
+        if transition_times is None:
+            return None
+        offsets: dict[tuple[timedelta | None, timedelta, str, bool], list[datetime]] = (
+            defaultdict(list)
+        )
+        start = first_datetime
+        offset_from, offset_to = None, start.utcoffset()
+        first_utc = first_datetime.astimezone(dt_timezone.utc).replace(tzinfo=None)
+        transition_times = transition_times[bisect_right(transition_times, first_utc) :]
+        for transition_time in [None, *transition_times]:
+            if transition_time is not None:
+                utc = transition_time.replace(tzinfo=dt_timezone.utc)
+                start = utc.astimezone(timezone)
+                offset_from, offset_to = offset_to, start.utcoffset()
+                if offset_from == offset_to:
+                    # the offset stays the same, only the name or DST may change
+                    continue
+                if not hasattr(timezone, "localize"):
+                    # The local time when the offset changes.
+                    # Ambiguous and missing times may have the old offset.
+                    for local_time in sorted(
+                        (transition_time + offset_from, transition_time + offset_to)
+                    ):
+                        start = local_time.replace(tzinfo=timezone)
+                        if start.utcoffset() == offset_to:
+                            break
+                    else:
+                        return None
+            if not start < last_datetime:
+                break
+            name = start.tzname()
+            if name is None:
+                name = str(offset_to)
+            key = (offset_from, offset_to, name, start.dst() == timedelta())
+            offsets[key].append(start.replace(tzinfo=None))
+        return offsets
+
+    @classmethod
+    def from_tzinfo(
+        cls,
+        timezone: tzinfo,
+        tzid: str | None = None,
+        first_date: date = DEFAULT_FIRST_DATE,
+        last_date: date = DEFAULT_LAST_DATE,
+    ) -> Timezone:
+        """Return a VTIMEZONE component from a timezone object.
+
+        This works with pytz and zoneinfo and any other timezone.
+        The transitions are read from the data of pytz and zoneinfo timezones.
+        For other timezones, the offsets are calculated from the tzinfo object.
+
+        Parameters:
+
+        :param tzinfo: the timezone object
+        :param tzid: the tzid for this timezone. If None, it will be extracted from the tzinfo.
+        :param first_date: a datetime that is earlier than anything that happens in the calendar
+        :param last_date: a datetime that is later than anything that happens in the calendar
+        :raises ValueError: If we have no tzid and cannot extract one.
+
+        .. note::
+            For timezones without transition data,
+            this can take some time. Please cache the results.
+        """
+        if tzid is None:
+            tzid = tzid_from_tzinfo(timezone)
+            if tzid is None:
+                raise ValueError(
+                    f"Cannot get TZID from {timezone}. Please set the tzid parameter."
+                )
+        first_datetime = datetime(first_date.year, first_date.month, first_date.day)
+        last_datetime = datetime(last_date.year, last_date.month, last_date.day)
+        if hasattr(timezone, "localize"):  # pytz compatibility
+            first_datetime = timezone.localize(first_datetime)
+            last_datetime = timezone.localize(last_datetime)
+        else:
+            first_datetime = first_datetime.replace(tzinfo=timezone)
+            last_datetime = last_datetime.replace(tzinfo=timezone)
+        offsets = cls._offsets_from_transitions(timezone, first_datetime, last_datetime)
+        if offsets is None:
+            offsets = cls._offsets_by_probing(timezone, first_datetime, last_datetime)
         tz = cls()
         tz.add("TZID", tzid)
         tz.add("COMMENT", f"This timezone only works from {first_date} to {last_date}.")
@@ -343,19 +426,35 @@ class Timezone(Component):
             that happens in the calendar
         :raises ValueError: If the tzid is unknown.
 
+        The components are cached in
+        :data:`~icalendar.timezone.cache.vtimezone_cache`.
+        You get a copy that you can change.
+
         >>> from icalendar import Timezone
         >>> tz = Timezone.from_tzid("Europe/Berlin")
         >>> print(tz.to_ical()[:36])
         BEGIN:VTIMEZONE
         TZID:Europe/Berlin
-
-        .. note::
-            This can take some time. Please cache the results.
         """
         tz = tzp.timezone(tzid)
         if tz is None:
             raise ValueError(f"Unkown timezone {tzid}.")
-        return cls.from_tzinfo(tz, tzid, first_date, last_date)
+        return vtimezone_cache.get_timezone(
+            tzid,
+            tz,
+            first_date,
+            last_date,
+            tzp.name,
+            lambda: disk_cache.get_vtimezone(
+                cls,
+                tz,
+                tzid,
+                first_date,
+                last_date,
+                tzp.name,
+                lambda: cls.from_tzinfo(tz, tzid, first_date, last_date),
+            ),
+        )
 
     @property
     def standard(self) -> list[TimezoneStandard]:
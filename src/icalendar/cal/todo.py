@@ -296,6 +296,25 @@ class Todo(Component):
 
         return Alarms(self)
 
+    def occurrences(self, start: date, end: date) -> list[date | datetime]:
+        """The start of each occurrence from ``start`` until before ``end``.
+
+        The occurrences are computed from DTSTART, RRULE, RDATE and EXDATE
+        in the timezone of DTSTART.
+        A to-do without DTSTART has no occurrences.
+
+        >>> from datetime import date
+        >>> from icalendar import Todo
+        >>> todo = Todo()
+        >>> todo.start = date(2025, 1, 31)
+        >>> todo.add("RRULE", {"FREQ": "MONTHLY", "BYMONTHDAY": -1})
+        >>> todo.occurrences(date(2025, 1, 1), date(2025, 4, 1))
+        [datetime.date(2025, 1, 31), datetime.date(2025, 2, 28), datetime.date(2025, 3, 31)]
+        """
+        from icalendar.recurrence import Recurrence
+
+        return Recurrence.of(self).between(start, end)
+
     color = color_property
     sequence = sequence_property
     categories = categories_property
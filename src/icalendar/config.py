@@ -1,5 +1,27 @@
 """Runtime configuration for icalendar."""
 
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+
+class JSONBackend(Protocol):
+    """A module or object that encodes and decodes JSON.
+
+    The standard library :mod:`json` module is such a backend.
+    """
+
+    def dumps(self, obj: Any) -> str:
+        """Return the JSON text of a Python object."""
+
+    def loads(self, s: str | bytes) -> Any:
+        """Return the Python object of a JSON text."""
+
+
 MAX_ALARM_REPEAT: int = 10_000
 """Cap on additional triggers expanded from a ``VALARM`` ``REPEAT`` property.
 
@@ -25,3 +47,64 @@ def _clamp_repeat(n: int) -> int:
     if MAX_ALARM_REPEAT < 0:
         return n
     return min(n, MAX_ALARM_REPEAT)
+
+
+JSON_BACKEND: JSONBackend = json
+"""The JSON backend used for jCal, the standard library :mod:`json` by default.
+
+:meth:`Component.to_json() <icalendar.cal.component.Component.to_json>`,
+:meth:`Component.write_jcal() <icalendar.cal.component.Component.write_jcal>`
+and :meth:`Component.from_jcal() <icalendar.cal.component.Component.from_jcal>`
+use this backend unless another one is passed as ``json_backend``.
+Any object with :meth:`~JSONBackend.dumps` and :meth:`~JSONBackend.loads`
+works, so a faster JSON library can be plugged in.
+``dumps`` must return a :class:`str`.
+The text may differ between backends, but the jCal must be the same.
+"""
+
+
+def _get_json_backend(json_backend: JSONBackend | None = None) -> JSONBackend:
+    """Return *json_backend* or :data:`JSON_BACKEND` if it is ``None``."""
+    return JSON_BACKEND if json_backend is None else json_backend
+
+
+TIMEZONE_CACHE_DIRECTORY: str | PathLike[str] | None = None
+"""A directory to keep compiled timezones in, or ``None`` to not use one.
+
+This cache is disabled by default.
+If you set a directory, timezones that are created from VTIMEZONE components
+and the components that
+:meth:`Timezone.from_tzid() <icalendar.cal.timezone.Timezone.from_tzid>`
+generates are stored there and loaded by the next process
+that needs the same timezone.
+The entries are named by a hash of their content.
+
+.. warning::
+
+    Compiled timezones are stored with :mod:`pickle`.
+    Only use a directory that no one else can write to.
+"""
+
+
+SUBSTITUTE_TIMEZONES_SINCE: int | None = None
+"""Use IANA timezones instead of equivalent VTIMEZONE components.
+
+This is disabled by default.
+If you set a year, VTIMEZONE components with unknown TZIDs are compared
+to the IANA timezones from the start of this year until 2038.
+If an IANA timezone has the same UTC offsets,
+it is used instead of a timezone created from the component.
+These timezones are faster and shared by all calendars.
+Times before this year may have other UTC offsets than the component defines,
+and the names of the offsets can differ.
+
+Example:
+
+    .. code-block:: python
+
+        from icalendar import config
+
+        config.SUBSTITUTE_TIMEZONES_SINCE = 2010
+
+See :mod:`icalendar.timezone.substitution`.
+"""
@@ -0,0 +1,276 @@
+"""Find the occurrences of events and to-dos within a time range.
+
+The :class:`IntervalIndex` contains the occurrences of the events and to-dos
+of a calendar until a horizon.
+This is what the ``time-range`` filter of CalDAV needs.
+
+The occurrences are sorted by their start.
+Occurrences of similar durations are kept together.
+Thus, we only look at the occurrences that start shortly before the time range
+and find the ones that overlap by bisection.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from datetime import date, datetime, timedelta
+from itertools import count
+from typing import TYPE_CHECKING
+
+from icalendar.recurrence import (
+    Recurrence,
+    _as_list,
+    _same_dependencies,
+    _Series,
+    _series_key,
+    _utc,
+)
+
+if TYPE_CHECKING:
+    from datetime import tzinfo
+
+    from icalendar.cal.calendar import Calendar
+    from icalendar.cal.component import Component
+    from icalendar.recurrence import Occurrence
+
+INDEXED_COMPONENTS = ("VEVENT", "VTODO")
+"""The components that are in the index."""
+
+# start, insertion order, end, occurrence
+_Entry = tuple[datetime, int, datetime, "Occurrence"]
+
+
+def _snapshot(component: Component) -> tuple[list, list]:
+    """Return the property values of a component and the parts of its RRULEs.
+
+    This is faster than looking up the properties
+    that the occurrences depend on.
+    """
+    values = []
+    for value in component.values():
+        values.append(value)
+        if isinstance(value, list):
+            values.extend(value)
+            values.append(None)
+    rrules = [
+        [
+            (key, tuple(part) if isinstance(part, list) else part)
+            for key, part in recur.items()
+        ]
+        for recur in _as_list(component.get("RRULE"))
+    ]
+    return values, rrules
+
+
+def _bucket(duration: timedelta) -> int:
+    """Return the bucket of occurrences with a similar duration.
+
+    Bucket ``n`` contains durations shorter than ``2 ** n`` seconds.
+    """
+    return int(duration.total_seconds()).bit_length()
+
+
+class IntervalIndex:
+    """The occurrences of events and to-dos from ``start`` until before ``end``.
+
+    Components with a RECURRENCE-ID modify the occurrences of their series
+    as in :meth:`Calendar.expand() <icalendar.cal.calendar.Calendar.expand>`.
+    Use :meth:`add` to add components.
+    Changes to components that are already added are not noticed.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from datetime import date, datetime, timezone
+            >>> from icalendar import Event
+            >>> from icalendar.interval_index import IntervalIndex
+            >>> index = IntervalIndex(date(2025, 1, 1), date(2026, 1, 1))
+            >>> event = Event()
+            >>> event.start = datetime(2025, 1, 6, 9, tzinfo=timezone.utc)
+            >>> event.end = datetime(2025, 1, 6, 10, tzinfo=timezone.utc)
+            >>> event.add("RRULE", {"FREQ": "WEEKLY"})
+            >>> index.add(event)
+            >>> len(index)
+            52
+            >>> index.at(datetime(2025, 1, 13, 9, 30, tzinfo=timezone.utc))
+            [<Occurrence VEVENT 2025-01-13 09:00:00+00:00 - 2025-01-13 10:00:00+00:00>]
+    """
+
+    def __init__(self, start: date, end: date) -> None:
+        """Create an empty index.
+
+        Parameters:
+            start: The occurrences end after this time.
+            end: The occurrences start before this time.
+                Dates and floating times are in the timezone of ``start``.
+        """
+        self._start = start
+        self._end = end
+        self._tz: tzinfo | None = start.tzinfo if isinstance(start, datetime) else None
+        self._series: dict[tuple, _Series] = {}
+        self._entries: dict[tuple, list[_Entry]] = {}
+        self._buckets: dict[int, list[_Entry]] = {}
+        self._order = count()
+        self._components: list[Component] = []
+        self._snapshots: list[tuple[list, list] | None] = []
+
+    @classmethod
+    def of(
+        cls,
+        calendar: Calendar,
+        start: date,
+        end: date,
+        *,
+        validate: bool = False,
+        rebuild: bool = False,
+    ) -> IntervalIndex:
+        """Return the index of a calendar.
+
+        The index is kept with the calendar.
+        :meth:`Calendar.add_component
+        <icalendar.cal.calendar.Calendar.add_component>`
+        adds components to it.
+        If the number of subcomponents or the first or last subcomponent
+        changes otherwise, the index is created again.
+
+        Parameters:
+            calendar: The calendar to index.
+            start: The occurrences end after this time.
+            end: The occurrences start before this time.
+            validate: Check with :meth:`is_built_from` that each subcomponent
+                is still the same and create the index again if not.
+                This looks at each subcomponent.
+            rebuild: Create the index and the recurrences
+                of the subcomponents again.
+        """
+        index: IntervalIndex | None = calendar.__dict__.get("_interval_index")
+        subcomponents = calendar.subcomponents
+        if (
+            rebuild
+            or index is None
+            or index.start != start
+            or index.end != end
+            or not index.may_be_built_from(subcomponents)
+            or (validate and not index.is_built_from(subcomponents))
+        ):
+            index = cls(start, end)
+            for component in subcomponents:
+                if rebuild:
+                    Recurrence.forget(component)
+                index.add(component)
+            calendar._interval_index = index  # noqa: SLF001
+        return index
+
+    @property
+    def start(self) -> date:
+        """The occurrences end after this time."""
+        return self._start
+
+    @property
+    def end(self) -> date:
+        """The occurrences start before this time."""
+        return self._end
+
+    @property
+    def components(self) -> int:
+        """The number of components that were added."""
+        return len(self._components)
+
+    def may_be_built_from(self, components: list[Component]) -> bool:
+        """Whether the index has as many components and the same first and last.
+
+        This is a quick check that does not look at each component.
+        Use :meth:`is_built_from` to check them all.
+        """
+        return len(components) == len(self._components) and (
+            not components
+            or (
+                components[0] is self._components[0]
+                and components[-1] is self._components[-1]
+            )
+        )
+
+    def is_built_from(self, components: list[Component]) -> bool:
+        """Whether the index contains exactly these components as they are now.
+
+        Properties that are set, added or removed are noticed
+        and so are changes to RRULE values.
+        Changes inside the values of the other properties are not noticed,
+        for example ``event["DTSTART"].dt = ...``.
+        """
+        return len(components) == len(self._components) and all(
+            component is indexed
+            and (snapshot is None or _same_dependencies(snapshot, _snapshot(component)))
+            for component, indexed, snapshot in zip(
+                components, self._components, self._snapshots, strict=True
+            )
+        )
+
+    def __len__(self) -> int:
+        """The number of occurrences in the index."""
+        return sum(map(len, self._buckets.values()))
+
+    def add(self, component: Component) -> None:
+        """Add a component and update the occurrences of its series.
+
+        Components other than events and to-dos are counted but not indexed.
+        """
+        self._components.append(component)
+        if component.name not in INDEXED_COMPONENTS:
+            self._snapshots.append(None)
+            return
+        self._snapshots.append(_snapshot(component))
+        key = _series_key(component)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series()
+        series.add(component)
+        for entry in self._entries.pop(key, []):
+            bucket = self._buckets[_bucket(entry[2] - entry[0])]
+            del bucket[bisect_left(bucket, entry[:2])]
+        entries = self._entries[key] = []
+        for occurrence in series.between(self._start, self._end):
+            start = _utc(occurrence.start, self._tz)
+            end = max(start, _utc(occurrence.end, self._tz))
+            entry = (start, next(self._order), end, occurrence)
+            entries.append(entry)
+            insort(self._buckets.setdefault(_bucket(end - start), []), entry)
+
+    def _overlapping(self, first: datetime, last: datetime) -> list[Occurrence]:
+        """Return the occurrences that overlap in UTC."""
+        result = []
+        for bucket, entries in self._buckets.items():
+            longest = timedelta(seconds=2**bucket)
+            for entry in entries[
+                bisect_left(entries, (first - longest,)) : bisect_left(entries, (last,))
+            ]:
+                start, _, end, _ = entry
+                if first < end or first <= start:
+                    result.append(entry)
+        result.sort()
+        return [entry[3] for entry in result]
+
+    def overlapping(self, start: date, end: date) -> list[Occurrence]:
+        """Return the occurrences that overlap with a time range.
+
+        Parameters:
+            start: The occurrences end after this time.
+            end: The occurrences start before this time.
+
+        Returns:
+            The occurrences in the order of their start.
+            Only occurrences within the horizon of the index are found.
+        """
+        return self._overlapping(_utc(start, self._tz), _utc(end, self._tz))
+
+    def at(self, dt: date) -> list[Occurrence]:
+        """Return the occurrences that happen at a time.
+
+        These occurrences start at or before ``dt`` and end after it.
+        """
+        moment = _utc(dt, self._tz)
+        return self._overlapping(moment, moment + timedelta(microseconds=1))
+
+
+__all__ = ["INDEXED_COMPONENTS", "IntervalIndex"]
@@ -20,6 +20,9 @@ from icalendar.parser_tools import DEFAULT_ENCODING, ICAL_TYPE, to_unicode
 UFOLD = re.compile(r"(?:(?<!\n)\r\n|(?<![\r\n])\n)(?:\r?\n)*[ \t]")
 NEWLINE = re.compile(r"\r?\n")
 
+# Lines of at least this many octets are folded, see :func:`_foldline`.
+FOLD_LIMIT = 75
+
 OWS = " \t"
 # ``[ \t]*([;=])[ \t]*`` in one pass rescans a long whitespace run at every
 # position. Splitting it into two anchored passes (leading then trailing) keeps
@@ -114,6 +117,63 @@ def _strip_ows_around_delimiters(st: str, delimiters: str = ";=") -> str:
     return "".join(out).strip()
 
 
+def _join_parts(
+    name: ICAL_TYPE,
+    params: Parameters | None,
+    values,
+    sorted: bool = True,  # noqa: A002
+) -> str:
+    """Join the parts of a property into one unfolded line.
+
+    This is shared by :meth:`Contentline.from_parts` and
+    :func:`_parts_to_ical`.
+    """
+    if hasattr(values, "to_ical"):
+        values = values.to_ical()
+    else:
+        from icalendar.prop import vText
+
+        values = vText(values).to_ical()
+
+    # TODO: after unicode only, remove this
+    # Convert back to unicode, after to_ical encoded it.
+    name = to_unicode(name)
+    values = to_unicode(values)
+    if params:
+        params = to_unicode(params.to_ical(sorted=sorted))
+        if params:
+            # some parameter values can be skipped during serialization
+            return f"{name};{params}:{values}"
+    return f"{name}:{values}"
+
+
+def _parts_to_ical(
+    name: ICAL_TYPE,
+    params: Parameters | None,
+    values,
+    sorted: bool = True,  # noqa: A002
+) -> bytes:
+    """Serialize the parts of a property to a folded line without line break.
+
+    This produces the same bytes as
+    ``Contentline.from_parts(name, params, values).to_ical()`` without
+    creating the intermediate :class:`Contentline`.
+    Lines shorter than the folding limit are encoded only once.
+    """
+    return _line_to_ical(_join_parts(name, params, values, sorted=sorted))
+
+
+def _line_to_ical(line: str) -> bytes:
+    """Encode and fold an unfolded content line without line break."""
+    assert "\n" not in line, (
+        "Content line can not contain unescaped new line characters."
+    )
+    encoded = line.encode(DEFAULT_ENCODING)
+    if len(encoded) < FOLD_LIMIT:
+        return encoded
+    return _foldline(line, limit=FOLD_LIMIT).encode(DEFAULT_ENCODING)
+
+
 class Contentline(str):
     """A content line is basically a string that can be folded and parsed into
     parts.
@@ -140,25 +200,7 @@ class Contentline(str):
     ):
         """Turn a parts into a content line."""
         assert isinstance(params, Parameters)
-        if hasattr(values, "to_ical"):
-            values = values.to_ical()
-        else:
-            from icalendar.prop import vText
-
-            values = vText(values).to_ical()
-        # elif isinstance(values, basestring):
-        #    values = escape_char(values)
-
-        # TODO: after unicode only, remove this
-        # Convert back to unicode, after to_ical encoded it.
-        name = to_unicode(name)
-        values = to_unicode(values)
-        if params:
-            params = to_unicode(params.to_ical(sorted=sorted))
-            if params:
-                # some parameter values can be skipped during serialization
-                return cls(f"{name};{params}:{values}")
-        return cls(f"{name}:{values}")
+        return cls(_join_parts(name, params, values, sorted=sorted))
 
     def raw_parts(self) -> tuple[str, Parameters, str]:
         """Split the line into ``name``, ``parameters``, and raw ``values`` parts.
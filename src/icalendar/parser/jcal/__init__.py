@@ -0,0 +1,21 @@
+"""Parsing and conversion of :rfc:`7265` jCal documents."""
+
+from .lazy import JCalSubcomponentParser
+from .stream import JCalStreamParser
+from .transcode import (
+    JCalComponentNode,
+    JCalTranscoder,
+    ical_to_jcal,
+    iter_jcal_to_ical,
+    jcal_to_ical,
+)
+
+__all__ = [
+    "JCalComponentNode",
+    "JCalStreamParser",
+    "JCalSubcomponentParser",
+    "JCalTranscoder",
+    "ical_to_jcal",
+    "iter_jcal_to_ical",
+    "jcal_to_ical",
+]
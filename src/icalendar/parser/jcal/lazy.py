@@ -0,0 +1,94 @@
+"""Lazy parsing of jCal subcomponents."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from icalendar.error import JCalParsingError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from icalendar.cal.component import Component
+
+
+class JCalSubcomponentParser:
+    """Parse the jCal of a subcomponent when it is needed.
+
+    This has the same methods as
+    :class:`~icalendar.parser.ical.component.ComponentIcalParser`
+    that :class:`~icalendar.parser.ical.lazy.LazySubcomponent` uses,
+    so that subcomponents of a
+    :class:`~icalendar.cal.lazy.LazyCalendar` can be kept as jCal
+    until they are accessed.
+    """
+
+    def __init__(
+        self, jcal: list, component_class: type[Component], path: list[int]
+    ) -> None:
+        """Initialize the parser with the jCal of one component.
+
+        Parameters:
+            jcal: The jCal list of the component with a valid name.
+            component_class: The class of the component.
+            path: The location of the component in the jCal document.
+                It is added to the errors that parsing raises.
+        """
+        self._jcal = jcal
+        self._component_class = component_class
+        self._path = path
+
+    def parse(self) -> list[Component]:
+        """Parse the jCal and return a list with the component."""
+        with JCalParsingError.reraise_with_path_added(*self._path):
+            return [self._component_class.from_jcal(self._jcal)]
+
+    def _iter_jcal_components(self) -> Iterator[list | None]:
+        """Iterate over the jCal of the component and its subcomponents.
+
+        ``None`` is yielded for invalid jCal which can only
+        be checked by parsing it.
+        """
+        stack = [self._jcal]
+        while stack:
+            jcal = stack.pop()
+            if not isinstance(jcal, list) or len(jcal) != 3:
+                yield None
+                continue
+            yield jcal
+            if isinstance(jcal[2], list):
+                stack.extend(jcal[2])
+            else:
+                yield None
+
+    def contains_component(self, name: str) -> bool:
+        """Check if the jCal may contain a component with the name."""
+        name = name.upper()
+        return any(
+            jcal is None or not isinstance(jcal[0], str) or jcal[0].upper() == name
+            for jcal in self._iter_jcal_components()
+        )
+
+    def contains_uid(self, uid: str) -> bool:
+        """Check if the jCal may contain the ``uid``.
+
+        Returns:
+            ``True`` if any property value contains the ``uid``.
+        """
+        for jcal in self._iter_jcal_components():
+            if jcal is None or not isinstance(jcal[1], list):
+                return True
+            for prop in jcal[1]:
+                if not isinstance(prop, list):
+                    return True
+                values = prop[3:]
+                while values:
+                    value = values.pop()
+                    if isinstance(value, list):
+                        values.extend(value)
+                    elif uid in str(value):
+                        return True
+        return False
+
+
+__all__ = ["JCalSubcomponentParser"]
@@ -0,0 +1,196 @@
+"""Parsing jCal documents from a file, one subcomponent at a time."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from io import BufferedIOBase, RawIOBase
+from typing import IO, TYPE_CHECKING, ClassVar
+
+from icalendar.error import JCalParsingError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from icalendar.cal.component import Component
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JCalStreamParser:
+    """Parse a jCal document incrementally from a file.
+
+    The JSON text is read in chunks.
+    Only the structure of the root component is scanned by this class.
+    Each subcomponent of the root is decoded and parsed on its own as soon as
+    its JSON text is complete, and the previous text is released.
+    This way, neither the whole JSON document nor the jCal list of the whole
+    calendar are held in memory.
+
+    Iterate over the parser to get the subcomponents of the root component.
+    The root component is available as :attr:`root`.
+    It has the properties but not the subcomponents of the document.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from io import StringIO
+            >>> from icalendar import Calendar
+            >>> from icalendar.parser.jcal import JCalStreamParser
+            >>> file = StringIO('''["vcalendar", [["version", {}, "text", "2.0"]], [
+            ...     ["vevent", [["summary", {}, "text", "First"]], []],
+            ...     ["vevent", [["summary", {}, "text", "Second"]], []]
+            ... ]]''')
+            >>> parser = JCalStreamParser(file, Calendar)
+            >>> print(parser.root["VERSION"])
+            2.0
+            >>> for event in parser:
+            ...     print(event.summary)
+            First
+            Second
+
+    """
+
+    chunk_size: ClassVar[int] = 64 * 1024
+    """The minimal number of characters to read from the file at once."""
+
+    def __init__(self, file: IO, component_class: type[Component]) -> None:
+        """Create a new parser.
+
+        Parameters:
+            file: A text file with the jCal JSON.
+                Binary files are decoded as UTF-8.
+                The file is not closed by the parser.
+            component_class: The class used to parse the root component.
+                Subcomponents are created according to their name.
+        """
+        self._file = file
+        self._text_decoder = (
+            codecs.getincrementaldecoder("utf-8")()
+            if isinstance(file, (RawIOBase, BufferedIOBase))
+            else None
+        )
+        self._component_class = component_class
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._end_of_file = False
+        self._root: Component | None = None
+        self._iterating = False
+
+    def _read(self, size: int | None = None) -> bool:
+        """Read more text into the buffer.
+
+        Parameters:
+            size: The minimal number of characters to read.
+
+        Returns:
+            ``False`` if the end of the file was reached, else ``True``.
+        """
+        chunk = ""
+        while not chunk:
+            if self._end_of_file:
+                return False
+            chunk = self._file.read(max(self.chunk_size, size or 0))
+            if not chunk:
+                self._end_of_file = True
+            if self._text_decoder is not None:
+                # A character can be split between two chunks.
+                chunk = self._text_decoder.decode(chunk, final=self._end_of_file)
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character.
+
+        Returns:
+            The next character or ``""`` at the end of the file.
+        """
+        while True:
+            self._position = WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read():
+                return ""
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        """Return an error for invalid JSON at the current position."""
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+    def _expect(self, characters: str) -> str:
+        """Consume one of the characters after optional whitespace."""
+        character = self._peek()
+        if not character or character not in characters:
+            raise self._error(f"Expecting one of {characters!r}")
+        self._position += 1
+        return character
+
+    def _decode(self) -> object:
+        """Decode the next complete JSON value from the file."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                # The value may not be complete yet.
+                # Doubling the buffer keeps the retries linear in its size.
+                if not self._read(len(self._buffer) - self._position):
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end < len(self._buffer) or not self._read():
+                self._position = end
+                return value
+
+    @property
+    def root(self) -> Component:
+        """The root component with its properties but without subcomponents."""
+        if self._root is None:
+            self._parse_root()
+        return self._root
+
+    def _parse_root(self) -> None:
+        """Parse the name and properties of the root component."""
+        if self._peek() != "[":
+            # This is not a component. Let from_jcal report the error.
+            self._component_class.from_jcal(self._decode())
+        self._expect("[")
+        name = self._decode()
+        self._expect(",")
+        properties = self._decode()
+        self._expect(",")
+        if self._peek() != "[":
+            self._component_class.from_jcal([name, properties, self._decode()])
+        self._root = self._component_class.from_jcal([name, properties, []])
+
+    def __iter__(self) -> Iterator[Component]:
+        """Parse and yield the subcomponents of the root component."""
+        if self._iterating:
+            raise ValueError("The subcomponents can only be iterated once.")
+        self._iterating = True
+        parent_class = type(self.root)
+        self._expect("[")
+        index = 0
+        if self._peek() == "]":
+            self._position += 1
+        else:
+            while True:
+                jcal = self._decode()
+                with JCalParsingError.reraise_with_path_added(2, index):
+                    component = parent_class.from_jcal(jcal)
+                yield component
+                index += 1
+                if self._expect(",]") == "]":
+                    break
+        if self._expect(",]") == ",":
+            raise JCalParsingError(
+                "A component must be a list with 3 items.", self._component_class
+            )
+        if self._peek():
+            raise self._error("Extra data")
+
+
+__all__ = ["JCalStreamParser"]
@@ -0,0 +1,507 @@
+"""Converting between iCalendar and jCal without creating components."""
+
+from __future__ import annotations
+
+import re
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Literal, overload
+
+from icalendar.caselessdict import canonsort_keys
+from icalendar.config import _get_json_backend
+from icalendar.error import JCalParsingError
+from icalendar.parser.content_line import _line_to_ical, _parts_to_ical
+from icalendar.parser.ical.component import ComponentIcalParser
+from icalendar.parser.parameter import Parameters
+from icalendar.parser.string import _escape_char
+from icalendar.prop import vCalAddress, vDDDTypes, vInt, vText, vUri
+from icalendar.timezone import tzp
+from icalendar.timezone.tzid import is_utc
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from icalendar.cal import Component, ComponentFactory
+    from icalendar.config import JSONBackend
+    from icalendar.parser.content_line import Contentline
+    from icalendar.prop import VPROPERTY, TypesFactory
+
+DATE_OR_DATETIME = re.compile(
+    r"([1-9]\d{3})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2})(Z?))?"
+)
+JCAL_DATE_OR_DATETIME = re.compile(
+    r"([1-9]\d{3})-(\d{2})-(\d{2})(?:T(\d{2}):(\d{2}):(\d{2})(Z?))?"
+)
+
+
+class JCalComponentNode:
+    """The jCal of a component that is being transcoded.
+
+    This collects the jCal properties in the same order as
+    :meth:`Component.to_jcal() <icalendar.cal.component.Component.to_jcal>`
+    returns them: grouped by name in the order of their first occurrence.
+    It has the attributes of a component that the parser uses.
+    """
+
+    def __init__(self, name: str, ignore_exceptions: bool) -> None:
+        """Create a new node for the component with the upper case name."""
+        self.name = name
+        self.ignore_exceptions = ignore_exceptions
+        self.errors: list[tuple[str | None, str]] = []
+        self.subcomponents: list[list] = []
+        self._properties: dict[str, list[list]] = {}
+
+    def add(self, name: str, value: VPROPERTY, encode: bool = False) -> None:
+        """Add the jCal of a parsed property value."""
+        self.add_jcal(name, value.to_jcal(name.lower()))
+
+    def add_jcal(self, name: str, jcal: list) -> None:
+        """Add the jCal of a property."""
+        properties = self._properties.get(name)
+        if properties is None:
+            self._properties[name] = [jcal]
+        else:
+            properties.append(jcal)
+
+    def to_jcal(self) -> list:
+        """Return the jCal of the component."""
+        return [
+            self.name.lower(),
+            [jcal for jcal_list in self._properties.values() for jcal in jcal_list],
+            self.subcomponents,
+        ]
+
+
+class JCalTranscoder(ComponentIcalParser):
+    """Convert iCalendar data to jCal without building components.
+
+    The content lines are converted straight to jCal arrays.
+    The common value types ``TEXT``, ``URI``, ``CAL-ADDRESS``, ``INTEGER``,
+    ``DATE`` and ``DATE-TIME`` are reformatted from the iCalendar text
+    without creating property values or localizing datetimes.
+    All other properties go through their value class, so that the result
+    is the same as with
+    :meth:`~icalendar.cal.component.Component.from_ical` and
+    :meth:`~icalendar.cal.component.Component.to_jcal`.
+
+    Timezone components are converted like all other components and
+    they are not cached in the timezone provider.
+    """
+
+    def __init__(
+        self,
+        data: bytes | str | list[Contentline],
+        component_factory: ComponentFactory,
+        types_factory: TypesFactory,
+    ) -> None:
+        """Initialize the transcoder with the raw data.
+
+        Parameters:
+            data: The raw iCalendar data to convert.
+            component_factory: The factory to look up the component classes.
+            types_factory: The factory to use for the property value types.
+        """
+        super().__init__(data, component_factory, types_factory)
+        self._utc_tzids: dict[str, bool] = {}
+
+    def handle_begin_component(self, vals: str) -> None:
+        """Start the jCal of a component."""
+        c_name = vals.upper()
+        c_class = self._component_factory.get_component_class(c_name)
+        self._stack.append(JCalComponentNode(c_name, c_class.ignore_exceptions))
+
+    def handle_end_component(self, vals: str) -> None:
+        """Finish the jCal of a component and add it to its parent."""
+        if not self._stack:
+            # The stack is currently empty, the input must be invalid
+            raise ValueError("END encountered without an accompanying BEGIN!")
+        component = self._stack.pop()
+        if not self._stack:
+            self._components.append(component.to_jcal())
+        else:
+            self._stack[-1].subcomponents.append(component.to_jcal())
+
+    def handle_property(
+        self, name: str, params: Parameters, vals: str, line: Contentline
+    ) -> None:
+        """Convert a property line to jCal.
+
+        Parameters:
+            name: The name of the property, uppercased.
+            params: The parameters of the property.
+            vals: The value of the property.
+            line: The original content line.
+        """
+        if self.component is not None and name != "REQUEST-STATUS":
+            factory = self.get_factory_for_property(name, params)
+            jcal = None
+            if factory is vText or factory is vUri:
+                jcal = self._string_to_jcal(factory, name, params, vals)
+            elif factory is vCalAddress:
+                if "\r" not in vals and "\n" not in vals:
+                    jcal = self._string_to_jcal(factory, name, params, vals)
+            elif factory is vInt:
+                jcal = self._integer_to_jcal(name, params, vals)
+            elif factory is vDDDTypes:
+                jcal = self._date_or_datetime_to_jcal(name, params, vals)
+            if jcal is not None:
+                self.component.add_jcal(name, jcal)
+                return
+        super().handle_property(name, params, vals, line)
+
+    @staticmethod
+    def _value_type(factory: type[VPROPERTY], params: Parameters) -> str:
+        """Return the jCal value type like the ``VALUE`` of a property."""
+        value = params.value
+        return (factory.default_value if value is None else value).lower()
+
+    def _string_to_jcal(
+        self, factory: type[VPROPERTY], name: str, params: Parameters, vals: str
+    ) -> list:
+        """Return the jCal of a value that is kept as it is."""
+        return [name.lower(), params.to_jcal(), self._value_type(factory, params), vals]
+
+    def _integer_to_jcal(self, name: str, params: Parameters, vals: str) -> list | None:
+        """Return the jCal of an integer or None if it is invalid."""
+        try:
+            value = int(vals)
+        except ValueError:
+            return None
+        return [name.lower(), params.to_jcal(), self._value_type(vInt, params), value]
+
+    def _tzid_is_utc(self, tzid: str) -> bool:
+        """Whether the TZID is resolved to UTC."""
+        result = self._utc_tzids.get(tzid)
+        if result is None:
+            tzinfo = tzp.timezone(tzid)
+            result = self._utc_tzids[tzid] = tzinfo is not None and is_utc(tzinfo)
+        return result
+
+    def _date_or_datetime_to_jcal(
+        self, name: str, params: Parameters, vals: str
+    ) -> list | None:
+        """Return the jCal of a date or date-time.
+
+        Returns:
+            ``None`` if the value needs a timezone or is not a simple
+            ``DATE`` or ``DATE-TIME``.
+        """
+        match = DATE_OR_DATETIME.fullmatch(vals)
+        if match is None:
+            return None
+        year, month, day, hour, minute, second, utc = match.groups()
+        value_type = params.value
+        tzid = params.tzid
+        try:
+            if hour is None:
+                if tzid is not None or value_type not in (None, "DATE"):
+                    return None
+                date(int(year), int(month), int(day))
+                return [
+                    name.lower(),
+                    params.to_jcal(),
+                    "date",
+                    f"{year}-{month}-{day}",
+                ]
+            if value_type not in (None, "DATE-TIME") or (
+                tzid is not None and (utc or self._tzid_is_utc(tzid))
+            ):
+                return None
+            datetime(  # noqa: DTZ001
+                int(year), int(month), int(day), int(hour), int(minute), int(second)
+            )
+        except ValueError:
+            return None
+        return [
+            name.lower(),
+            params.to_jcal(exclude_utc=True),
+            "date-time",
+            f"{year}-{month}-{day}T{hour}:{minute}:{second}{utc}",
+        ]
+
+
+@overload
+def ical_to_jcal(st: str | bytes, multiple: Literal[False] = False) -> list: ...
+
+
+@overload
+def ical_to_jcal(st: str | bytes, multiple: Literal[True]) -> list[list]: ...
+
+
+def ical_to_jcal(st: str | bytes, multiple: bool = False) -> list | list[list]:
+    r"""Convert iCalendar data to jCal without creating components.
+
+    This returns the same jCal as
+    :meth:`~icalendar.cal.component.Component.from_ical` followed by
+    :meth:`~icalendar.cal.component.Component.to_jcal` but it is faster
+    because the content lines are mapped to jCal properties directly,
+    see :class:`JCalTranscoder`.
+
+    Parameters:
+        st: iCalendar data as bytes or string.
+        multiple: If ``True``, return a list of all the components.
+            If ``False``, return exactly one component.
+
+    Raises:
+        ValueError: If the data can not be parsed or if the number of
+            components does not match ``multiple``.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from icalendar.parser.jcal import ical_to_jcal
+            >>> ical_to_jcal(
+            ...     "BEGIN:VEVENT\r\n"
+            ...     "DTSTART:20250101T100000Z\r\n"
+            ...     "SUMMARY:New Year\r\n"
+            ...     "END:VEVENT\r\n"
+            ... )  # doctest: +NORMALIZE_WHITESPACE
+            ['vevent',
+             [['dtstart', {}, 'date-time', '2025-01-01T10:00:00Z'],
+              ['summary', {}, 'text', 'New Year']],
+             []]
+
+    """
+    from icalendar.cal.component import Component
+
+    transcoder = JCalTranscoder(
+        st,
+        Component._get_component_factory(),  # noqa: SLF001
+        Component.types_factory,
+    )
+    components = transcoder.parse()
+    if multiple:
+        return components
+    if len(components) != 1:
+        raise ValueError(f"Expected exactly one component but found {len(components)}.")
+    return components[0]
+
+
+def _jcal_value_to_ical(
+    prop_cls: type[VPROPERTY], name: str, jcal_params: dict, value: object
+) -> str | None:
+    """Return the iCalendar text of a simple jCal value.
+
+    Returns:
+        ``None`` if the value has to be parsed by its value class.
+    """
+    if prop_cls is vText:
+        if isinstance(value, str) and name not in ("categories", "request-status"):
+            return _escape_char(value)
+    elif prop_cls is vUri or prop_cls is vCalAddress:
+        if isinstance(value, str) and "\r" not in value and "\n" not in value:
+            return value
+    elif prop_cls is vInt:
+        if type(value) is int:
+            return str(value)
+    elif prop_cls is vDDDTypes and isinstance(value, str):
+        if any(key.lower() == "tzid" for key in jcal_params):
+            return None
+        match = JCAL_DATE_OR_DATETIME.fullmatch(value)
+        if match is None:
+            return None
+        year, month, day, hour, minute, second, utc = match.groups()
+        try:
+            if hour is None:
+                date(int(year), int(month), int(day))
+                return f"{year}{month}{day}"
+            datetime(  # noqa: DTZ001
+                int(year), int(month), int(day), int(hour), int(minute), int(second)
+            )
+        except ValueError:
+            return None
+        return f"{year}{month}{day}T{hour}{minute}{second}{utc}"
+    return None
+
+
+def _jcal_property_to_ical(
+    jcal_property: list,
+    component_class: type[Component],
+    sorted: bool,  # noqa: A002
+) -> bytes:
+    """Return the folded content line of a validated jCal property."""
+    name, jcal_params, value_type, *values = jcal_property
+    types_factory = component_class.types_factory
+    prop_cls = types_factory.for_property(name, value_type)
+    ical = None
+    if len(values) == 1:
+        ical = _jcal_value_to_ical(prop_cls, name, jcal_params, values[0])
+    if ical is None:
+        prop = prop_cls.from_jcal(jcal_property)
+        params = prop.params
+    else:
+        prop = None
+        params = Parameters.from_jcal_property(jcal_property)
+    # The value type is restored as VALUE parameter like in Component.from_jcal.
+    if isinstance(value_type, str) and value_type.lower() not in (
+        "unknown",
+        types_factory.default_value_type(name),
+    ):
+        params.value = value_type.upper()
+    elif "VALUE" in params:
+        del params.value
+    name = name.upper()
+    if prop is not None:
+        return _parts_to_ical(name, params, prop, sorted=sorted)
+    if params:
+        ical_params = params.to_ical(sorted=sorted).decode("utf-8")
+        if ical_params:
+            return _line_to_ical(f"{name};{ical_params}:{ical}")
+    return _line_to_ical(f"{name}:{ical}")
+
+
+def _jcal_component_to_ical(
+    jcal: object,
+    starting_class: type[Component],
+    sorted: bool,  # noqa: A002
+) -> tuple[type[Component], bytearray, list]:
+    """Convert the name and properties of a jCal component.
+
+    This validates the component like :meth:`Component.from_jcal
+    <icalendar.cal.component.Component.from_jcal>`.
+
+    Returns:
+        The component class, the ``BEGIN`` and property lines
+        and the jCal subcomponents.
+    """
+    if not isinstance(jcal, list) or len(jcal) != 3:
+        raise JCalParsingError(
+            "A component must be a list with 3 items.", starting_class, value=jcal
+        )
+    name, properties, subcomponents = jcal
+    if not isinstance(name, str):
+        raise JCalParsingError(
+            "The name must be a string.", starting_class, path=[0], value=name
+        )
+    if name.upper() != starting_class.name:
+        component_class = starting_class.get_component_class(name.upper())
+    else:
+        component_class = starting_class
+    if not isinstance(properties, list):
+        raise JCalParsingError(
+            "The properties must be a list.",
+            component_class,
+            path=1,
+            value=properties,
+        )
+    lines: dict[str, list[bytes]] = {}
+    for i, prop in enumerate(properties):
+        JCalParsingError.validate_property(prop, component_class, path=[1, i])
+        with JCalParsingError.reraise_with_path_added(1, i):
+            line = _jcal_property_to_ical(prop, component_class, sorted)
+        lines.setdefault(prop[0].upper(), []).append(line)
+    if not isinstance(subcomponents, list):
+        raise JCalParsingError(
+            "The subcomponents must be a list.",
+            component_class,
+            2,
+            value=subcomponents,
+        )
+    result = bytearray(b"BEGIN:")
+    result += vText(component_class.name).to_ical()
+    result += b"\r\n"
+    names = canonsort_keys(lines, component_class.canonical_order) if sorted else lines
+    for property_name in names:
+        for line in lines[property_name]:
+            result += line
+            result += b"\r\n"
+    return component_class, result, subcomponents
+
+
+def iter_jcal_to_ical(
+    jcal: str | list,
+    component_class: type[Component] | None = None,
+    sorted: bool = True,  # noqa: A002
+    json_backend: JSONBackend | None = None,
+) -> Iterator[bytes]:
+    """Convert jCal to iCalendar without creating components.
+
+    The folded content lines are yielded as soon as they are converted,
+    one chunk per component and one for each ``END`` line.
+    The common value types ``TEXT``, ``URI``, ``CAL-ADDRESS``, ``INTEGER``,
+    ``DATE`` and ``DATE-TIME`` without ``TZID`` are formatted directly.
+    All other properties go through their value class, so that the result
+    is the same as with
+    :meth:`~icalendar.cal.component.Component.from_jcal` and
+    :meth:`~icalendar.cal.component.Component.to_ical`.
+
+    Parameters:
+        jcal: jCal list or JSON string according to :rfc:`7265`.
+        component_class: The class used to validate the root component.
+            Subcomponents are looked up by their name.
+            The default is :class:`~icalendar.cal.component.Component`.
+        sorted: Whether parameters and properties should be
+            lexicographically sorted.
+        json_backend: The JSON backend to decode a JSON string with.
+            The default is :data:`icalendar.config.JSON_BACKEND`.
+
+    Raises:
+        ~error.JCalParsingError: If the jCal provided is invalid.
+        ~json.JSONDecodeError: If the provided string is not valid JSON.
+    """
+    if component_class is None:
+        from icalendar.cal.component import Component
+
+        component_class = Component
+    if isinstance(jcal, str):
+        jcal = _get_json_backend(json_backend).loads(jcal)
+    # The stack holds END lines and (jcal, parent class, error path) tuples.
+    stack: list[bytes | tuple[object, type[Component], list[int]]] = [
+        (jcal, component_class, [])
+    ]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, bytes):
+            yield item
+            continue
+        jcal, parent_class, path = item
+        with JCalParsingError.reraise_with_path_added(*path):
+            component_class, lines, subcomponents = _jcal_component_to_ical(
+                jcal, parent_class, sorted
+            )
+        yield bytes(lines)
+        stack.append(b"END:" + vText(component_class.name).to_ical() + b"\r\n")
+        for i in range(len(subcomponents) - 1, -1, -1):
+            stack.append((subcomponents[i], component_class, [*path, 2, i]))
+
+
+def jcal_to_ical(
+    jcal: str | list,
+    component_class: type[Component] | None = None,
+    sorted: bool = True,  # noqa: A002
+    json_backend: JSONBackend | None = None,
+) -> bytes:
+    r"""Convert jCal to iCalendar without creating components.
+
+    This returns the same bytes as
+    :meth:`~icalendar.cal.component.Component.from_jcal` followed by
+    :meth:`~icalendar.cal.component.Component.to_ical`,
+    see :func:`iter_jcal_to_ical`.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from icalendar.parser.jcal import jcal_to_ical
+            >>> print(jcal_to_ical(
+            ...     ["vevent", [
+            ...         ["summary", {"language": "de"}, "text", "Neujahr"],
+            ...         ["dtstart", {}, "date", "2025-01-01"],
+            ...     ], []]
+            ... ).decode())
+            BEGIN:VEVENT
+            SUMMARY;LANGUAGE=de:Neujahr
+            DTSTART;VALUE=DATE:20250101
+            END:VEVENT
+
+    """
+    return b"".join(iter_jcal_to_ical(jcal, component_class, sorted, json_backend))
+
+
+__all__ = [
+    "JCalComponentNode",
+    "JCalTranscoder",
+    "ical_to_jcal",
+    "iter_jcal_to_ical",
+    "jcal_to_ical",
+]
@@ -6,8 +6,10 @@ from icalendar.compatibility import Self
 from icalendar.error import JCalParsingError
 from icalendar.parser import Parameters
 from icalendar.parser_tools import from_unicode
+from icalendar.timezone import tzp
 
 from .base import TimeBase
+from .datetime import vDatetime
 from .types import vDDDTypes
 
 
@@ -48,9 +50,20 @@ class vDDDLists:
     @staticmethod
     def from_ical(ical, timezone=None):
         out = []
-        ical_dates = ical.split(",")
-        for ical_dt in ical_dates:
-            out.append(vDDDTypes.from_ical(ical_dt, timezone=timezone))
+        # local date-times are localized together, see TZP.localize_many
+        local_indices = []
+        for ical_dt in ical.split(","):
+            if timezone is not None and len(ical_dt) == 15:
+                local_indices.append(len(out))
+                out.append(vDatetime.from_ical(ical_dt))
+            else:
+                out.append(vDDDTypes.from_ical(ical_dt, timezone=timezone))
+        if local_indices:
+            localized = tzp.localize_many(
+                [out[index] for index in local_indices], timezone
+            )
+            for index, dt in zip(local_indices, localized, strict=True):
+                out[index] = dt
         return out
 
     def __eq__(self, other):
@@ -0,0 +1,517 @@
+"""Compute the occurrences of recurring components.
+
+The DTSTART, RRULE, RDATE and EXDATE properties of a component are
+compiled into a :class:`dateutil.rrule.rruleset` once.
+The compiled rules are kept with the component
+and compiled again when one of these properties changes.
+
+The rules are expanded in the local time of DTSTART.
+The occurrences are localized afterwards so that they keep their local time
+when the UTC offset of the timezone changes.
+
+:func:`expand` computes the occurrences of all components of a calendar.
+It uses the components with a RECURRENCE-ID instead of the occurrences
+that they modify.
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import dateutil.rrule
+
+from icalendar.error import IncompleteComponent, InvalidCalendar
+from icalendar.parser_tools import SEQUENCE_TYPES
+from icalendar.prop import vRecur, vWeekday
+from icalendar.timezone import tzp
+from icalendar.tools import is_date, to_datetime
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import tzinfo
+
+    from icalendar.cal.component import Component
+
+RECURRENCE_PROPERTIES = ("DTSTART", "RRULE", "RDATE", "EXDATE")
+"""The properties that the occurrences of a component depend on."""
+
+RECURRING_COMPONENTS = ("VEVENT", "VTODO", "VJOURNAL")
+"""The components that :func:`expand` expands."""
+
+# the parts of a vRecur that we pass to dateutil.rrule.rrule directly
+_RRULE_INTEGER_PARTS = {
+    "COUNT": "count",
+    "INTERVAL": "interval",
+    "BYSECOND": "bysecond",
+    "BYMINUTE": "byminute",
+    "BYHOUR": "byhour",
+    "BYMONTHDAY": "bymonthday",
+    "BYYEARDAY": "byyearday",
+    "BYWEEKNO": "byweekno",
+    "BYMONTH": "bymonth",
+    "BYSETPOS": "bysetpos",
+}
+_RRULE_WEEKDAY_PARTS = {
+    "BYDAY": "byweekday",
+    "BYWEEKDAY": "byweekday",
+    "WKST": "wkst",
+}
+
+
+def rrule_from_recur(
+    recur: vRecur, dtstart: datetime, until: datetime | None = None
+) -> dateutil.rrule.rrule:
+    """Return the rule of an RRULE value.
+
+    The rule is created from the parsed values.
+    Rules that dateutil cannot create like this are converted to a string
+    and parsed by :func:`dateutil.rrule.rrulestr`.
+
+    Parameters:
+        recur: The value of the RRULE property.
+        dtstart: The start of the rule.
+        until: Use this instead of the UNTIL of the rule.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from datetime import datetime
+            >>> from icalendar import vRecur
+            >>> from icalendar.recurrence import rrule_from_recur
+            >>> rrule = rrule_from_recur(
+            ...     vRecur.from_ical("FREQ=DAILY;COUNT=2"), datetime(2025, 1, 1)
+            ... )
+            >>> list(rrule)
+            [datetime.datetime(2025, 1, 1, 0, 0), datetime.datetime(2025, 1, 2, 0, 0)]
+    """
+    kw = {}
+    for key, values in recur.items():
+        if not isinstance(values, SEQUENCE_TYPES):
+            values = [values]  # noqa: PLW2901
+        if key in _RRULE_INTEGER_PARTS:
+            if any(getattr(value, "leap", False) for value in values):
+                break
+            kw[_RRULE_INTEGER_PARTS[key]] = [int(value) for value in values]
+        elif key in _RRULE_WEEKDAY_PARTS:
+            kw[_RRULE_WEEKDAY_PARTS[key]] = [
+                getattr(dateutil.rrule, value.weekday)(value.relative)
+                for value in map(vWeekday, values)
+            ]
+        elif key == "FREQ" and values[0] in vRecur.frequencies:
+            kw["freq"] = getattr(dateutil.rrule, values[0])
+        elif key == "UNTIL" and isinstance(values[0], date):
+            kw["until"] = to_datetime(values[0])
+        else:
+            break
+    else:
+        if "freq" in kw:
+            for name in ("count", "interval", "wkst"):
+                if name in kw:
+                    kw[name] = kw[name][0]
+            if until is not None:
+                kw["until"] = until
+            return dateutil.rrule.rrule(dtstart=dtstart, **kw)
+    if until is not None:
+        recur = vRecur(recur)
+        recur.pop("UNTIL", None)
+    rrule = dateutil.rrule.rrulestr(recur.to_ical().decode("utf-8"), dtstart=dtstart)
+    return rrule if until is None else rrule.replace(until=until)
+
+
+def _as_list(value) -> list:
+    """Return the values of a property that can occur several times."""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _dependencies(component: Component) -> tuple[list, list[bytes]]:
+    """Return what the occurrences of the component depend on.
+
+    These are the values of the properties and their items.
+    RRULE values can be changed in place, so we also use their content.
+    """
+    values = []
+    for name in RECURRENCE_PROPERTIES:
+        value = component.get(name)
+        values.append(value)
+        if isinstance(value, list):
+            values.extend(value)
+            values.append(None)
+    rrules = [recur.to_ical() for recur in _as_list(component.get("RRULE"))]
+    return values, rrules
+
+
+def _same_dependencies(old: tuple[list, list], new: tuple[list, list]) -> bool:
+    """Whether the values are the same objects and the RRULEs are equal."""
+    (old_values, old_rrules), (values, rrules) = old, new
+    return (
+        len(values) == len(old_values)
+        and all(a is b for a, b in zip(values, old_values, strict=True))
+        and rrules == old_rrules
+    )
+
+
+class Recurrence:
+    """The compiled recurrence set of a component.
+
+    Use :meth:`of` to get the recurrence of a component.
+    Components without DTSTART have no occurrences.
+    """
+
+    def __init__(self, component: Component) -> None:
+        """Compile the recurrence of the component."""
+        self._values, self._rrules = _dependencies(component)
+        self._rruleset: dateutil.rrule.rruleset | None = None
+        self._tz: tzinfo | None = None
+        self._is_date = False
+        self._exdays: set[date] = set()
+        self._local_start: datetime | None = None
+        start = component.get("DTSTART")
+        if start is None or not isinstance(start.dt, date):
+            return
+        dtstart = start.dt
+        self._is_date = is_date(dtstart)
+        if not self._is_date:
+            self._tz = dtstart.tzinfo
+        rruleset = dateutil.rrule.rruleset()
+        local_start = self._local_start = self.to_local(dtstart)
+        rruleset.rdate(local_start)
+        for recur in _as_list(component.get("RRULE")):
+            rruleset.rrule(
+                rrule_from_recur(recur, local_start, until=self.local_until(recur))
+            )
+        for rdates in _as_list(component.get("RDATE")):
+            for rdate in rdates.dts:
+                dt = rdate.dt[0] if isinstance(rdate.dt, tuple) else rdate.dt
+                rruleset.rdate(self.to_local(dt))
+        for exdates in _as_list(component.get("EXDATE")):
+            for exdate in exdates.dts:
+                if is_date(exdate.dt) and not self._is_date:
+                    # exclude the whole day
+                    self._exdays.add(exdate.dt)
+                else:
+                    rruleset.exdate(self.to_local(exdate.dt))
+        self._rruleset = rruleset
+
+    @classmethod
+    def of(cls, component: Component) -> Recurrence:
+        """Return the recurrence of a component.
+
+        The result is cached with the component until DTSTART, RRULE,
+        RDATE or EXDATE change.
+        Changes to the values of DTSTART, RDATE and EXDATE
+        that do not replace them are not noticed.
+        """
+        recurrence: Recurrence | None = component.__dict__.get("_recurrence")
+        if recurrence is None or not recurrence.is_compiled_from(component):
+            recurrence = cls(component)
+            component._recurrence = recurrence  # noqa: SLF001
+        return recurrence
+
+    @staticmethod
+    def forget(component: Component) -> None:
+        """Remove the cached recurrence of a component.
+
+        Use this after changing the values of DTSTART, RDATE or EXDATE.
+        """
+        component.__dict__.pop("_recurrence", None)
+
+    def is_compiled_from(self, component: Component) -> bool:
+        """Whether the recurrence is up to date with the component."""
+        return _same_dependencies(
+            (self._values, self._rrules), _dependencies(component)
+        )
+
+    @property
+    def tz(self) -> tzinfo | None:
+        """The timezone of DTSTART or None for dates and floating time."""
+        return self._tz
+
+    @property
+    def is_date(self) -> bool:
+        """Whether the component occurs on dates."""
+        return self._is_date
+
+    @property
+    def local_start(self) -> datetime | None:
+        """DTSTART in local time or None if there is no DTSTART."""
+        return self._local_start
+
+    def to_local(self, dt: date) -> datetime:
+        """Return the naive local time that the rules use."""
+        if is_date(dt):
+            return to_datetime(dt)
+        if dt.tzinfo is not None and self._tz is not None:
+            dt = dt.astimezone(self._tz)
+        return dt.replace(tzinfo=None)
+
+    def local_until(self, recur: vRecur) -> datetime | None:
+        """Return the UNTIL of a rule in local time."""
+        until = recur.get("UNTIL")
+        if isinstance(until, SEQUENCE_TYPES):
+            until = until[0] if until else None
+        if not isinstance(until, date):
+            return None
+        if is_date(until) and not self._is_date:
+            # the whole day is included
+            return datetime.combine(until, time.max)
+        return self.to_local(until)
+
+    def _bound(self, dt: date) -> datetime:
+        """Return a bound that we can compare to the occurrences."""
+        if self._tz is None:
+            return self.to_local(dt)
+        if is_date(dt) or dt.tzinfo is None:
+            return tzp.localize(to_datetime(dt), self._tz)
+        return dt
+
+    def between(self, start: date, end: date) -> list[date | datetime]:
+        """Return the occurrences from ``start`` until before ``end``.
+
+        Parameters:
+            start: The first occurrence can start at this time.
+                Dates are the start of the day.
+            end: The occurrences start before this time.
+
+        Returns:
+            The start of each occurrence.
+            All-day components occur on dates.
+            Occurrences of components with a timezone are in that timezone.
+        """
+        if self._rruleset is None:
+            return []
+        first = self.to_local(start)
+        last = self.to_local(end)
+        if self._tz is not None:
+            # The offsets of the bounds can differ from the occurrences.
+            first -= timedelta(days=1)
+            last += timedelta(days=1)
+        local = self._rruleset.between(first, last, inc=True)
+        if self._exdays:
+            local = [dt for dt in local if dt.date() not in self._exdays]
+        occurrences = local if self._tz is None else tzp.localize_many(local, self._tz)
+        first, last = self._bound(start), self._bound(end)
+        result = [dt for dt in occurrences if first <= dt < last]
+        if self._is_date:
+            return [dt.date() for dt in result]
+        return result
+
+
+class Occurrence:
+    """An occurrence of a recurring component.
+
+    The component describes the occurrence.
+    This is the component with the RRULE or, if the occurrence is modified,
+    the component with the RECURRENCE-ID.
+    """
+
+    def __init__(
+        self,
+        component: Component,
+        start: date,
+        end: date,
+        recurrence_id: date | None = None,
+    ) -> None:
+        """Create an occurrence.
+
+        Parameters:
+            component: The component that describes the occurrence.
+            start: The start of the occurrence.
+            end: The end of the occurrence.
+            recurrence_id: The start of the occurrence in the recurrence set.
+                This is the start if the occurrence is not moved.
+        """
+        self._component = component
+        self._start = start
+        self._end = end
+        self._recurrence_id = start if recurrence_id is None else recurrence_id
+
+    @property
+    def component(self) -> Component:
+        """The component that describes the occurrence."""
+        return self._component
+
+    @property
+    def start(self) -> date:
+        """The start of the occurrence."""
+        return self._start
+
+    @property
+    def end(self) -> date:
+        """The end of the occurrence."""
+        return self._end
+
+    @property
+    def recurrence_id(self) -> date:
+        """The start of the occurrence in the recurrence set.
+
+        Components with a RECURRENCE-ID of this value modify the occurrence.
+        """
+        return self._recurrence_id
+
+    def __repr__(self) -> str:
+        """repr(self)"""
+        return (
+            f"<{self.__class__.__name__} {self.component.name} "
+            f"{self.start} - {self.end}>"
+        )
+
+
+def _duration(component: Component) -> timedelta:
+    """Return the duration of a component or no duration."""
+    try:
+        return component.duration
+    except (IncompleteComponent, InvalidCalendar, AttributeError):
+        return timedelta(0)
+
+
+def _utc(dt: date, tz: tzinfo | None) -> datetime:
+    """Return a naive datetime in UTC that we can compare to all others.
+
+    Dates and floating times are in the timezone ``tz``.
+    Without ``tz``, they are in UTC.
+    """
+    dt = to_datetime(dt)
+    if dt.tzinfo is None:
+        if tz is None:
+            return dt
+        dt = dt.replace(tzinfo=tz)
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _series_key(component: Component) -> tuple:
+    """Return the key of the series that the component belongs to."""
+    uid = component.get("UID")
+    return (component.name, id(component) if uid is None else str(uid))
+
+
+class _Series:
+    """The components of a calendar with the same UID."""
+
+    def __init__(self) -> None:
+        self.masters: list[Component] = []
+        self.overrides: dict[date, Component] = {}
+
+    def add(self, component: Component) -> None:
+        """Add a component to the series."""
+        recurrence_id = component.get("RECURRENCE-ID")
+        if recurrence_id is None:
+            self.masters.append(component)
+            return
+        other = self.overrides.get(recurrence_id.dt)
+        if other is None or component.get("SEQUENCE", 0) >= other.get("SEQUENCE", 0):
+            self.overrides[recurrence_id.dt] = component
+
+    def between(self, start: date, end: date) -> list[Occurrence]:
+        """Return the occurrences that overlap with the time span.
+
+        Parameters:
+            start: The start of the time span.
+            end: The end of the time span.
+        """
+        tz = start.tzinfo if isinstance(start, datetime) else None
+        first, last = _utc(start, tz), _utc(end, tz)
+        occurrences = []
+
+        def add(occurrence: Occurrence) -> None:
+            occurrence_start = _utc(occurrence.start, tz)
+            if occurrence_start < last and (
+                first < _utc(occurrence.end, tz) or first <= occurrence_start
+            ):
+                occurrences.append(occurrence)
+
+        # RANGE=THISANDFUTURE modifies all later occurrences
+        ranges = []
+        for recurrence_id, override in self.overrides.items():
+            override_start = override.get("DTSTART")
+            override_start = (
+                recurrence_id if override_start is None else override_start.dt
+            )
+            add(
+                Occurrence(
+                    override,
+                    override_start,
+                    override_start + _duration(override),
+                    recurrence_id,
+                )
+            )
+            if (
+                override["RECURRENCE-ID"].params.get("RANGE", "").upper()
+                == "THISANDFUTURE"
+            ):
+                shift = _utc(override_start, tz) - _utc(recurrence_id, tz)
+                ranges.append((_utc(recurrence_id, tz), shift, override))
+        ranges.sort(key=lambda modification: modification[0])
+        range_starts = [modification[0] for modification in ranges]
+        max_shift = max((abs(shift) for _, shift, _ in ranges), default=timedelta(0))
+
+        for master in self.masters:
+            duration = _duration(master)
+            # the bounds may be in another timezone than the occurrences
+            margin = timedelta(days=1) + abs(duration) + max_shift
+            for recurrence_id in master.occurrences(start - margin, end + margin):
+                if recurrence_id in self.overrides:
+                    continue
+                index = bisect_right(range_starts, _utc(recurrence_id, tz)) - 1
+                if index < 0:
+                    add(Occurrence(master, recurrence_id, recurrence_id + duration))
+                else:
+                    _, shift, override = ranges[index]
+                    occurrence_start = recurrence_id + shift
+                    add(
+                        Occurrence(
+                            override,
+                            occurrence_start,
+                            occurrence_start + _duration(override),
+                            recurrence_id,
+                        )
+                    )
+        occurrences.sort(key=lambda occurrence: _utc(occurrence.start, tz))
+        return occurrences
+
+
+def expand(
+    components: Iterable[Component], start: date, end: date
+) -> Iterator[Occurrence]:
+    """Yield the occurrences of the components in the order of their start.
+
+    Components with the same UID form a series.
+    Components with a RECURRENCE-ID modify the occurrences of the
+    component with the RRULE.
+    With ``RANGE=THISANDFUTURE``, they also modify the later occurrences.
+
+    Parameters:
+        components: The components to expand.
+            Only events, to-dos and journal entries are expanded.
+        start: The occurrences end after this time.
+        end: The occurrences start before this time.
+            Dates and floating times are in the timezone of ``start``.
+    """
+    series: dict[tuple, _Series] = {}
+    for component in components:
+        if component.name not in RECURRING_COMPONENTS:
+            continue
+        key = _series_key(component)
+        if key not in series:
+            series[key] = _Series()
+        series[key].add(component)
+    tz = start.tzinfo if isinstance(start, datetime) else None
+    yield from heapq.merge(
+        *(each.between(start, end) for each in series.values()),
+        key=lambda occurrence: _utc(occurrence.start, tz),
+    )
+
+
+__all__ = [
+    "RECURRENCE_PROPERTIES",
+    "RECURRING_COMPONENTS",
+    "Occurrence",
+    "Recurrence",
+    "expand",
+    "rrule_from_recur",
+]
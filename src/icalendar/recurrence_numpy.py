@@ -0,0 +1,297 @@
+"""Compute the occurrences of simple recurrence rules with NumPy.
+
+NumPy is not a dependency of icalendar.
+Install it to use this module.
+
+The occurrences are computed as arrays of :class:`numpy.datetime64`
+in the local time of DTSTART.
+They are converted to :class:`datetime.datetime` objects
+only when you ask for them.
+
+These rules are computed with NumPy:
+
+- ``FREQ=DAILY``, ``FREQ=WEEKLY`` and ``FREQ=MONTHLY``
+- with ``INTERVAL``, ``COUNT`` and ``UNTIL``
+- and ``BYDAY`` without numbers for ``FREQ=WEEKLY``.
+
+Other rules are computed by :class:`icalendar.recurrence.Recurrence`.
+
+Example:
+
+    .. code-block:: pycon
+
+        >>> from datetime import date
+        >>> from icalendar import Event
+        >>> from icalendar.recurrence_numpy import occurrence_array
+        >>> event = Event.from_ical('''BEGIN:VEVENT
+        ... DTSTART;TZID=Europe/Berlin:20250101T100000
+        ... RRULE:FREQ=WEEKLY;BYDAY=MO,WE,FR
+        ... END:VEVENT''')
+        >>> occurrences = occurrence_array(event, date(2025, 1, 1), date(2026, 1, 1))
+        >>> len(occurrences)
+        157
+        >>> occurrences.starts.dtype
+        dtype('<M8[s]')
+        >>> print(occurrences.starts[1])
+        2025-01-03T10:00:00
+        >>> occurrences.to_list()[0]
+        datetime.datetime(2025, 1, 1, 10, 0, tzinfo=ZoneInfo(key='Europe/Berlin'))
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from icalendar.parser_tools import SEQUENCE_TYPES
+from icalendar.prop import vWeekday
+from icalendar.recurrence import Recurrence, _as_list
+from icalendar.timezone import tzp
+from icalendar.tools import is_date
+
+if TYPE_CHECKING:
+    from datetime import date, datetime, tzinfo
+
+    from icalendar.cal.component import Component
+    from icalendar.prop import vRecur
+
+SIMPLE_FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY")
+"""The frequencies that we compute with NumPy."""
+
+_DAY = 86400
+# 1970-01-01 is a Thursday
+_THURSDAY = 3
+
+
+def _seconds(dt: datetime) -> int:
+    """Return the seconds since 1970 of a naive datetime."""
+    return int(np.datetime64(dt, "s").astype(np.int64))
+
+
+def _weekday(seconds: int) -> int:
+    """Return the weekday with Monday as 0."""
+    return (seconds // _DAY + _THURSDAY) % 7
+
+
+def _parts(recur: vRecur) -> dict[str, list] | None:
+    """Return the parts of a simple rule or None."""
+    parts = {
+        key: list(value) if isinstance(value, SEQUENCE_TYPES) else [value]
+        for key, value in recur.items()
+    }
+    if not parts.get("FREQ") or parts["FREQ"][0] not in SIMPLE_FREQUENCIES:
+        return None
+    if not set(parts) <= {"FREQ", "INTERVAL", "COUNT", "UNTIL", "WKST", "BYDAY"}:
+        return None
+    if "BYDAY" in parts:
+        if parts["FREQ"][0] != "WEEKLY":
+            return None
+        parts["BYDAY"] = [vWeekday(day) for day in parts["BYDAY"]]
+        if any(day.relative for day in parts["BYDAY"]):
+            return None
+    return parts
+
+
+def _arithmetic(
+    start: int, step: int, first: int, last: int, count: int | None
+) -> np.ndarray:
+    """Return the occurrences ``start + k * step`` from first until before last."""
+    k_first = max(0, -((start - first) // step))
+    k_stop = -((start - last) // step)
+    if count is not None:
+        k_stop = min(k_stop, count)
+    return start + step * np.arange(k_first, max(k_first, k_stop), dtype=np.int64)
+
+
+def _weekly_by_day(
+    start: int,
+    interval: int,
+    weekdays: list[vWeekday],
+    week_start: str,
+    first: int,
+    last: int,
+    count: int | None,
+) -> np.ndarray:
+    """Return the occurrences of FREQ=WEEKLY with BYDAY."""
+    wkst = (vWeekday.week_days[week_start] - 1) % 7
+    start_offset = (_weekday(start) - wkst) % 7
+    week = start - start_offset * _DAY
+    offsets = np.array(
+        sorted({(vWeekday.week_days[day.weekday] - 1 - wkst) % 7 for day in weekdays}),
+        dtype=np.int64,
+    )
+    per_week = len(offsets)
+    span = interval * 7 * _DAY
+    # the days of the first week before DTSTART do not occur
+    skipped = int(np.count_nonzero(offsets < start_offset))
+    j_first = max(skipped, per_week * max(0, (first - week) // span))
+    j_stop = per_week * ((last - week) // span + 1)
+    if count is not None:
+        j_stop = min(j_stop, skipped + count)
+    j = np.arange(j_first, max(j_first, j_stop), dtype=np.int64)
+    return week + (j // per_week) * span + offsets[j % per_week] * _DAY
+
+
+def _monthly(
+    start: datetime, interval: int, last: int, count: int | None
+) -> np.ndarray:
+    """Return the occurrences of FREQ=MONTHLY on the day of DTSTART.
+
+    Months without this day are skipped.
+    """
+    first_month = np.datetime64(start, "M")
+    months_until_last = int(
+        np.datetime64(last, "s").astype("datetime64[M]") - first_month
+    )
+    months = first_month + interval * np.arange(
+        0, max(0, months_until_last // interval + 1), dtype=np.int64
+    )
+    days = months.astype("datetime64[D]")
+    days_in_month = ((months + 1).astype("datetime64[D]") - days).astype(np.int64)
+    days = days[start.day <= days_in_month] + (start.day - 1)
+    if count is not None:
+        days = days[:count]
+    time_of_day = _seconds(start) % _DAY
+    return days.astype("datetime64[s]").astype(np.int64) + time_of_day
+
+
+def _rule(
+    recurrence: Recurrence, recur: vRecur, parts: dict, first: int, last: int
+) -> np.ndarray:
+    """Return the occurrences of a simple rule in local seconds."""
+    start = recurrence.local_start
+    start_seconds = _seconds(start)
+    until = recurrence.local_until(recur)
+    if until is not None:
+        last = min(last, _seconds(until) + 1)
+    interval = int(parts.get("INTERVAL", [1])[0])
+    count = int(parts["COUNT"][0]) if "COUNT" in parts else None
+    frequency = parts["FREQ"][0]
+    if frequency == "MONTHLY":
+        result = _monthly(start, interval, last, count)
+    elif "BYDAY" in parts:
+        result = _weekly_by_day(
+            start_seconds,
+            interval,
+            parts["BYDAY"],
+            parts.get("WKST", ["MO"])[0],
+            first,
+            last,
+            count,
+        )
+    else:
+        step = interval * _DAY * (7 if frequency == "WEEKLY" else 1)
+        result = _arithmetic(start_seconds, step, first, last, count)
+    return result[(first <= result) & (result < last)]
+
+
+class OccurrenceArray:
+    """The starts of occurrences as a NumPy array.
+
+    The starts are in the local time of DTSTART and sorted.
+    """
+
+    def __init__(
+        self, starts: np.ndarray, tz: tzinfo | None = None, is_date: bool = False
+    ) -> None:
+        """Create an array of occurrences.
+
+        Parameters:
+            starts: The starts in local time as ``datetime64[s]``.
+            tz: The timezone of the starts.
+            is_date: Whether the occurrences are on dates.
+        """
+        self._starts = starts
+        self._tz = tz
+        self._is_date = is_date
+
+    @property
+    def starts(self) -> np.ndarray:
+        """The starts in local time as ``datetime64[s]``."""
+        return self._starts
+
+    @property
+    def tz(self) -> tzinfo | None:
+        """The timezone of the starts or None for dates and floating time."""
+        return self._tz
+
+    def __len__(self) -> int:
+        """The number of occurrences."""
+        return len(self._starts)
+
+    def to_list(self) -> list[date | datetime]:
+        """Return the starts as dates or datetimes with the timezone."""
+        if self._is_date:
+            return self._starts.astype("datetime64[D]").tolist()
+        starts = self._starts.tolist()
+        if self._tz is None:
+            return starts
+        return tzp.localize_many(starts, self._tz)
+
+
+def occurrence_array(component: Component, start: date, end: date) -> OccurrenceArray:
+    """Return the occurrences of a component from ``start`` until before ``end``.
+
+    This computes the same occurrences as ``component.occurrences(start, end)``.
+    Bounds with a timezone are converted to the local time of DTSTART.
+    Thus, occurrences in the hour that repeats when DST ends can differ.
+
+    Parameters:
+        component: The event, to-do or journal entry.
+        start: The first occurrence can start at this time.
+        end: The occurrences start before this time.
+    """
+    recurrence = Recurrence.of(component)
+    if recurrence.local_start is None:
+        return OccurrenceArray(np.array([], dtype="datetime64[s]"))
+    first = _seconds(recurrence.to_local(start))
+    last = _seconds(recurrence.to_local(end))
+    rrules = _as_list(component.get("RRULE"))
+    rules = [_parts(recur) for recur in rrules]
+    if None in rules:
+        local = [recurrence.to_local(dt) for dt in recurrence.between(start, end)]
+        return OccurrenceArray(
+            np.array(local, dtype="datetime64[s]"),
+            recurrence.tz,
+            recurrence.is_date,
+        )
+    starts = [
+        np.array([_seconds(recurrence.local_start)], dtype=np.int64),
+        *(
+            _rule(recurrence, recur, parts, first, last)
+            for recur, parts in zip(rrules, rules, strict=True)
+        ),
+        np.array(
+            [
+                _seconds(
+                    recurrence.to_local(
+                        rdate.dt[0] if isinstance(rdate.dt, tuple) else rdate.dt
+                    )
+                )
+                for rdates in _as_list(component.get("RDATE"))
+                for rdate in rdates.dts
+            ],
+            dtype=np.int64,
+        ),
+    ]
+    result = np.unique(np.concatenate(starts))
+    result = result[(first <= result) & (result < last)]
+    exdates = []
+    exdays = []
+    for exdates_value in _as_list(component.get("EXDATE")):
+        for exdate in exdates_value.dts:
+            if is_date(exdate.dt) and not recurrence.is_date:
+                exdays.append(_seconds(recurrence.to_local(exdate.dt)) // _DAY)
+            else:
+                exdates.append(_seconds(recurrence.to_local(exdate.dt)))
+    if exdates:
+        result = np.setdiff1d(result, np.array(exdates, dtype=np.int64))
+    if exdays:
+        result = result[~np.isin(result // _DAY, np.array(exdays, dtype=np.int64))]
+    return OccurrenceArray(
+        result.astype("datetime64[s]"), recurrence.tz, recurrence.is_date
+    )
+
+
+__all__ = ["SIMPLE_FREQUENCIES", "OccurrenceArray", "occurrence_array"]
@@ -2,6 +2,7 @@
 
 import json
 from datetime import datetime
+from io import StringIO
 from pprint import pprint
 
 from icalendar.cal.alarm import Alarm
@@ -15,6 +16,14 @@ def test_to_jcal_can_be_json_serialized(source_file):
     assert s
 
 
+def test_write_jcal_equals_json_dumps(source_file):
+    """Writing jCal incrementally produces the same JSON as json.dumps."""
+    file = StringIO()
+    source_file.write_jcal(file)
+    assert file.getvalue() == json.dumps(source_file.to_jcal())
+    assert source_file.to_json() == file.getvalue()
+
+
 def test_trigger(tzp):
     """Check jCal loading of TRIGGER."""
     alarm = Alarm()
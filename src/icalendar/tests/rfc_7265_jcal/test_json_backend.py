@@ -0,0 +1,96 @@
+"""Plug other JSON libraries into the jCal conversion."""
+
+import json
+from io import StringIO
+
+import pytest
+
+from icalendar import Component, config
+from icalendar.parser.jcal import jcal_to_ical
+
+
+class CompactJSON:
+    """A backend that writes different JSON text than the default."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def dumps(self, obj) -> str:
+        self.calls += 1
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def loads(self, s):
+        self.calls += 1
+        return json.loads(s)
+
+
+class ORJSON:
+    """Adapt orjson which returns bytes."""
+
+    def __init__(self, orjson):
+        self.orjson = orjson
+
+    def dumps(self, obj) -> str:
+        return self.orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, s):
+        return self.orjson.loads(s)
+
+
+@pytest.fixture(params=["json", "compact", "orjson", "ujson", "simplejson"])
+def json_backend(request):
+    """All the JSON backends that we can test."""
+    if request.param == "json":
+        return json
+    if request.param == "compact":
+        return CompactJSON()
+    module = pytest.importorskip(request.param)
+    if request.param == "orjson":
+        return ORJSON(module)
+    return module
+
+
+def test_backends_produce_the_same_jcal(source_file, json_backend):
+    """Every backend encodes the same jCal as the standard library."""
+    assert json.loads(source_file.to_json(json_backend=json_backend)) == (
+        json.loads(source_file.to_json())
+    )
+
+
+def test_backends_decode_the_same_jcal(json_backend):
+    """Every backend decodes the same components."""
+    calendar = Component.from_ical(
+        "BEGIN:VCALENDAR\r\n"
+        "BEGIN:VEVENT\r\n"
+        "SUMMARY:Ünïcödé \\, text\r\n"
+        "DTSTART;TZID=Europe/Berlin:20250101T100000\r\n"
+        "SEQUENCE:1\r\n"
+        "END:VEVENT\r\n"
+        "END:VCALENDAR\r\n"
+    )
+    jcal = calendar.to_json(json_backend=json_backend)
+    assert Component.from_jcal(jcal, json_backend=json_backend) == calendar
+    assert jcal_to_ical(jcal, json_backend=json_backend) == calendar.to_ical()
+
+
+def test_global_backend(monkeypatch):
+    """The configured backend is used if none is passed."""
+    backend = CompactJSON()
+    monkeypatch.setattr(config, "JSON_BACKEND", backend)
+    calendar = Component.from_ical("BEGIN:VEVENT\r\nSUMMARY:Ä\r\nEND:VEVENT\r\n")
+    jcal = calendar.to_json()
+    assert jcal == '["vevent", [["summary",{},"text","Ä"]], []]'
+    assert Component.from_jcal(jcal) == calendar
+    assert jcal_to_ical(jcal) == calendar.to_ical()
+    assert backend.calls == 4
+
+
+def test_backend_per_call_overrides_global(monkeypatch):
+    """A backend passed to the call is used instead of the global one."""
+    backend = CompactJSON()
+    monkeypatch.setattr(config, "JSON_BACKEND", backend)
+    calendar = Component.from_ical("BEGIN:VEVENT\r\nEND:VEVENT\r\n")
+    file = StringIO()
+    calendar.write_jcal(file, json_backend=json)
+    assert file.getvalue() == '["vevent", [], []]'
+    assert backend.calls == 0
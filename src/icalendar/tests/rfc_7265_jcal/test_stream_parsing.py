@@ -0,0 +1,150 @@
+"""Parse jCal incrementally with Component.iter_jcal."""
+
+import gc
+import json
+from io import BytesIO, StringIO
+
+import pytest
+
+from icalendar import Calendar, Component, JCalParsingError
+from icalendar.parser.jcal import JCalStreamParser
+
+
+@pytest.fixture(params=[1, 7, 64 * 1024])
+def chunk_size(request, monkeypatch):
+    """Read the files in chunks of different sizes."""
+    monkeypatch.setattr(JCalStreamParser, "chunk_size", request.param)
+    return request.param
+
+
+def parse(jcal: str, cls=Calendar) -> tuple[Component, list[Component]]:
+    """Parse the jCal string and return the root and the subcomponents."""
+    parser = cls.iter_jcal(StringIO(jcal))
+    subcomponents = list(parser)
+    return parser.root, subcomponents
+
+
+def test_stream_equals_from_jcal(source_file, chunk_size):
+    """The components are the same as with from_jcal."""
+    jcal = source_file.to_json()
+    try:
+        expected = Component.from_jcal(jcal)
+    except JCalParsingError as error:
+        # Some example files do not survive the round trip.
+        message = str(error)
+    else:
+        message = None
+    if message is not None:
+        with pytest.raises(JCalParsingError) as stream_error:
+            parse(jcal, Component)
+        assert str(stream_error.value) == message
+        return
+    root, subcomponents = parse(jcal, Component)
+    assert root.name == expected.name
+    assert dict(root) == dict(expected)
+    assert subcomponents == expected.subcomponents
+
+
+def test_binary_file():
+    """Binary files are decoded as UTF-8."""
+    jcal = '["vcalendar", [["x-name", {}, "text", "Ä"]], []]'
+    parser = Calendar.iter_jcal(BytesIO(jcal.encode("utf-8")))
+    assert list(parser) == []
+    assert parser.root["X-NAME"] == "Ä"
+
+
+def test_binary_file_split_characters(chunk_size):
+    """Characters can be split across chunks of a binary file."""
+    jcal = '["vcalendar", [["x-name", {}, "text", "ÄÖ€😀"]], []]'
+    parser = Calendar.iter_jcal(BytesIO(jcal.encode("utf-8")))
+    assert list(parser) == []
+    assert parser.root["X-NAME"] == "ÄÖ€😀"
+
+
+def test_binary_file_stays_open():
+    """The parser does not close the file it reads."""
+    jcal = '["vcalendar", [], [["vevent", [], []]]]'
+    file = BytesIO(jcal.encode("utf-8"))
+    parser = Calendar.iter_jcal(file)
+    assert len(list(parser)) == 1
+    assert not file.closed
+    del parser
+    gc.collect()
+    assert not file.closed
+    file.seek(0)
+    assert file.read() == jcal.encode("utf-8")
+
+
+def test_whitespace_and_numbers(chunk_size):
+    """Numbers and whitespace can be split across chunks."""
+    jcal = (
+        '\n[ "vcalendar" ,\n [ ] ,\n [ [ "vevent" , '
+        '[ [ "sequence" , { } , "integer" , 12345 ] ] , [ ] ] ] ]\n'
+    )
+    root, (event,) = parse(jcal)
+    assert root.name == "VCALENDAR"
+    assert event["SEQUENCE"] == 12345
+
+
+def test_root_is_parsed_before_the_subcomponents():
+    """The root is available without reading the subcomponents."""
+    parser = Calendar.iter_jcal(
+        StringIO('["vcalendar", [["version", {}, "text", "2.0"]], [invalid')
+    )
+    assert parser.root["VERSION"] == "2.0"
+    with pytest.raises(json.JSONDecodeError):
+        list(parser)
+
+
+def test_subcomponents_are_yielded_as_they_complete():
+    """A subcomponent is returned before the rest of the file is valid."""
+    parser = Calendar.iter_jcal(
+        StringIO('["vcalendar", [], [["vevent", [], []], invalid')
+    )
+    iterator = iter(parser)
+    assert next(iterator).name == "VEVENT"
+    with pytest.raises(json.JSONDecodeError):
+        next(iterator)
+
+
+def test_iterate_only_once():
+    """The file is consumed by the iteration."""
+    parser = Calendar.iter_jcal(StringIO('["vcalendar", [], []]'))
+    assert list(parser) == []
+    with pytest.raises(ValueError, match="only be iterated once"):
+        list(parser)
+
+
+@pytest.mark.parametrize(
+    "jcal",
+    [
+        "",
+        "[",
+        '["vcalendar" []]',
+        '["vcalendar", [], []] []',
+        '["vcalendar", [], [["vevent", [], []] ["vevent", [], []]]]',
+    ],
+)
+def test_invalid_json(jcal):
+    """Invalid JSON raises a JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        parse(jcal)
+
+
+@pytest.mark.parametrize(
+    ("jcal", "message"),
+    [
+        ("{}", r"A component must be a list with 3 items\."),
+        ('["vcalendar", [], {}]', r"\[2\] in Calendar: The subcomponents must"),
+        ('["vcalendar", [], [], []]', r"A component must be a list with 3 items\."),
+        ('["vcalendar", [], [["vevent", [], []], 1]]', r"\[2\]\[1\] in Calendar"),
+        (
+            '["vcalendar", [], [["vevent", [], [["valarm", [], 1]]]]]',
+            r"\[2\]\[0\]\[2\]\[0\]\[2\] in Alarm",
+        ),
+    ],
+)
+def test_invalid_jcal(jcal, message):
+    """The errors have the same path as with from_jcal."""
+    with pytest.raises(JCalParsingError, match=message):
+        parse(jcal)
@@ -0,0 +1,228 @@
+"""Convert iCalendar to jCal without the component model."""
+
+import json
+
+import pytest
+
+from icalendar import Calendar, Component, Event, JCalParsingError
+from icalendar.parser.jcal import ical_to_jcal, iter_jcal_to_ical, jcal_to_ical
+
+
+def test_same_result_as_component_model(ics_file):
+    """The transcoder gives the same jCal as from_ical and to_jcal."""
+    expected = [
+        component.to_jcal()
+        for component in Component.from_ical(ics_file.raw_ics, multiple=True)
+    ]
+    assert ical_to_jcal(ics_file.raw_ics, multiple=True) == expected
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "DTSTART:20250101T100000Z",
+        "DTSTART:20250101T100000",
+        "DTSTART;VALUE=DATE:20250101",
+        "DTSTART:20250101",
+        "DTSTART;TZID=Europe/Berlin:20250101T100000",
+        "DTSTART;TZID=UTC:20250101T100000",
+        "DTSTART;TZID=Europe/Berlin:20250101T100000Z",
+        "DTSTART;TZID=Europe/Berlin:20250101",
+        "DTSTART;VALUE=DATE:20250101T100000",
+        "DTSTART:09990101T100000",
+        "DUE:20250101T240000",
+        "RECURRENCE-ID;RANGE=THISANDFUTURE:20250101T100000Z",
+        "SEQUENCE:3",
+        "SEQUENCE:+3",
+        "PRIORITY;X-PARAM=1:9",
+        "SUMMARY;LANGUAGE=de:Hallo\\, Welt\\n",
+        "URL:https://example.com/a,b",
+        "ATTENDEE;CN=Max;ROLE=CHAIR:mailto:max@example.com",
+        "X-CUSTOM;VALUE=TEXT:text",
+        "REQUEST-STATUS:2.0;Success",
+        "CATEGORIES:a,b\\,c",
+        "RDATE:20250101T100000Z,20250102T100000Z",
+        "DURATION:PT1H",
+    ],
+)
+def test_property(line):
+    """Properties are converted like in the component model."""
+    ical = f"BEGIN:VEVENT\r\n{line}\r\nEND:VEVENT\r\n"
+    assert ical_to_jcal(ical) == Event.from_ical(ical).to_jcal()
+
+
+def test_properties_are_grouped_by_name():
+    """Properties with the same name are next to each other like in to_jcal."""
+    ical = (
+        "BEGIN:VEVENT\r\n"
+        "ATTENDEE:mailto:a@example.com\r\n"
+        "SUMMARY:test\r\n"
+        "ATTENDEE:mailto:b@example.com\r\n"
+        "END:VEVENT\r\n"
+    )
+    assert [prop[0] for prop in ical_to_jcal(ical)[1]] == [
+        "attendee",
+        "attendee",
+        "summary",
+    ]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "SEQUENCE:not-a-number",
+        "DTSTART:20251301T100000Z",
+    ],
+)
+def test_invalid_value(line):
+    """Invalid values raise errors in strict components."""
+    ical = f"BEGIN:X-STRICT\r\n{line}\r\nEND:X-STRICT\r\n"
+    with pytest.raises(ValueError):
+        Component.from_ical(ical)
+    with pytest.raises(ValueError):
+        ical_to_jcal(ical)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "SEQUENCE:not-a-number",
+        "DTSTART:20251301T100000Z",
+    ],
+)
+def test_broken_values_in_tolerant_components(line):
+    """Components that ignore exceptions keep broken values."""
+    ical = f"BEGIN:VEVENT\r\n{line}\r\nEND:VEVENT\r\n"
+    assert ical_to_jcal(ical) == Event.from_ical(ical).to_jcal()
+
+
+@pytest.mark.parametrize(
+    "ical",
+    [
+        "",
+        "BEGIN:VEVENT\r\nEND:VEVENT\r\nBEGIN:VEVENT\r\nEND:VEVENT\r\n",
+    ],
+)
+def test_not_exactly_one_component(ical):
+    """Without multiple, there must be exactly one component."""
+    with pytest.raises(ValueError, match="exactly one component"):
+        ical_to_jcal(ical)
+
+
+def test_end_without_begin():
+    """END without BEGIN is invalid."""
+    with pytest.raises(ValueError, match="END encountered"):
+        ical_to_jcal("END:VEVENT\r\n")
+
+
+def round_trip(jcal, **kw):
+    """The bytes of the round trip through the component model."""
+    return Component.from_jcal(jcal).to_ical(**kw)
+
+
+@pytest.mark.parametrize("sort", [True, False])
+def test_jcal_to_ical_same_as_round_trip(source_file, sort):
+    """jcal_to_ical gives the same bytes as from_jcal and to_ical."""
+    jcal = source_file.to_jcal()
+    try:
+        expected = round_trip(jcal, sorted=sort)
+    except JCalParsingError as error:
+        # Some example files do not survive the round trip.
+        message = str(error)
+    else:
+        message = None
+    if message is not None:
+        with pytest.raises(JCalParsingError) as error:
+            jcal_to_ical(jcal, sorted=sort)
+        assert str(error.value) == message
+        return
+    assert jcal_to_ical(jcal, sorted=sort) == expected
+
+
+@pytest.mark.parametrize(
+    "prop",
+    [
+        ["dtstart", {}, "date-time", "2025-01-01T10:00:00Z"],
+        ["dtstart", {}, "date-time", "2025-01-01T10:00:00"],
+        ["dtstart", {}, "date-time", "2025-01-01"],
+        ["dtstart", {}, "date", "2025-01-01"],
+        ["dtstart", {}, "date", "2025-01-01T10:00:00"],
+        ["dtstart", {}, "date-time", "2025-1-01T10:00:00"],
+        ["dtstart", {}, "date-time", "0999-01-01T10:00:00"],
+        ["dtstart", {"tzid": "Europe/Berlin"}, "date-time", "2025-01-01T10:00:00"],
+        ["dtstart", {"tzid": "UTC"}, "date-time", "2025-01-01T10:00:00"],
+        ["dtstart", {"value": "DATE"}, "date-time", "2025-01-01T10:00:00"],
+        ["x-date", {}, "date-time", "2025-01-01T10:00:00"],
+        ["sequence", {}, "integer", 3],
+        ["sequence", {"x-param": "1"}, "integer", 3],
+        ["summary", {"language": "de"}, "text", "Hallo, Welt;\n\\"],
+        ["summary", {"x-quote": 'a "quoted" ^ value'}, "text", "x"],
+        ["summary", {"x-list": ["a,b", "c"]}, "text", "x"],
+        ["summary", {}, "text", "ä" * 80],
+        ["x-custom", {}, "text", "text"],
+        ["x-custom", {}, "unknown", "text"],
+        ["url", {}, "uri", "https://example.com/a,b"],
+        ["attendee", {"cn": "Max"}, "cal-address", "mailto:max@example.com"],
+        ["request-status", {}, "text", ["2.0", "Success"]],
+        ["categories", {}, "text", "a,b", "c"],
+        ["rdate", {}, "date-time", "2025-01-01T10:00:00Z", "2025-01-02T10:00:00Z"],
+        ["duration", {}, "duration", "PT1H"],
+    ],
+)
+def test_jcal_property_to_ical(prop):
+    """Properties are converted like in the component model."""
+    jcal = ["vevent", [prop], []]
+    assert jcal_to_ical(jcal) == round_trip(jcal)
+
+
+@pytest.mark.parametrize(
+    "jcal",
+    [
+        "{}",
+        ["vevent", [], []],
+        ["vcalendar", [], [["vevent", [], [["valarm", [], []]]], ["vtodo", [], []]]],
+        ["x-custom", [["version", {}, "text", "2.0"]], []],
+    ],
+)
+def test_components(jcal):
+    """Components and their nesting are converted like with from_jcal."""
+    if jcal == "{}":
+        with pytest.raises(JCalParsingError):
+            jcal_to_ical(jcal)
+        return
+    assert jcal_to_ical(jcal) == round_trip(jcal)
+    assert jcal_to_ical(json.dumps(jcal)) == round_trip(jcal)
+
+
+@pytest.mark.parametrize(
+    "jcal",
+    [
+        ["vevent", {}, []],
+        [1, [], []],
+        ["vevent", [], {}],
+        ["vevent", [["summary", {}, "text"]], []],
+        ["vevent", [["summary", {}, "text", 1]], []],
+        ["vevent", [["summary", {"x": {}}, "text", "a"]], []],
+        ["vevent", [["sequence", {}, "integer", "1"]], []],
+        ["vevent", [["dtstart", {}, "date-time", "2025-13-01T10:00:00"]], []],
+        ["vcalendar", [], [["vevent", [], [["valarm", [], 1]]]]],
+    ],
+)
+def test_invalid_jcal(jcal):
+    """Invalid jCal raises the same errors as from_jcal."""
+    with pytest.raises(JCalParsingError) as expected:
+        Component.from_jcal(jcal)
+    with pytest.raises(JCalParsingError) as error:
+        jcal_to_ical(jcal)
+    assert str(error.value) == str(expected.value)
+
+
+def test_lines_are_yielded_per_component():
+    """The conversion is incremental."""
+    jcal = ["vcalendar", [], [["vevent", [], []], ["vevent", [], 1]]]
+    lines = iter_jcal_to_ical(jcal, Calendar)
+    assert next(lines) == b"BEGIN:VCALENDAR\r\n"
+    assert next(lines) == b"BEGIN:VEVENT\r\n"
+    assert next(lines) == b"END:VEVENT\r\n"
+    with pytest.raises(JCalParsingError):
+        next(lines)
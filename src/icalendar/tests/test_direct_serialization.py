@@ -0,0 +1,90 @@
+"""Component.to_ical writes lines directly without Contentline objects."""
+
+import pytest
+
+from icalendar import Calendar, Event
+from icalendar.cal import component
+from icalendar.parser import Contentline, Parameters
+from icalendar.parser.content_line import _parts_to_ical
+from icalendar.prop import vUnknown
+
+
+def test_to_ical_equals_content_lines(ics_file):
+    """The direct serializer produces the same bytes as the content lines."""
+    assert ics_file.to_ical() == ics_file.content_lines().to_ical()
+
+
+def test_unsorted_to_ical_equals_content_lines(ics_file):
+    """Unsorted serialization is also unchanged."""
+    assert (
+        ics_file.to_ical(sorted=False) == ics_file.content_lines(sorted=False).to_ical()
+    )
+
+
+@pytest.mark.parametrize(
+    ("name", "params", "value"),
+    [
+        ("SUMMARY", Parameters(), "short"),
+        ("SUMMARY", Parameters(), "x" * 74),
+        ("SUMMARY", Parameters(), "x" * 75),
+        ("DESCRIPTION", Parameters({"LANGUAGE": "de"}), "ä" * 100),
+        ("DESCRIPTION", Parameters(), "escaped\\;" * 20),
+        ("ATTENDEE", Parameters({"CN": "Max Rasmussen"}), "mailto:max@example.com"),
+    ],
+)
+def test_parts_to_ical_equals_contentline(name, params, value):
+    """Folding and encoding match Contentline."""
+    expected = Contentline.from_parts(name, params, value).to_ical()
+    assert _parts_to_ical(name, params, value) == expected
+
+
+def test_newline_in_value_is_rejected():
+    """Unescaped new lines can not end up in the output."""
+    with pytest.raises(AssertionError):
+        _parts_to_ical("X-RAW", None, vUnknown("a\nb"))
+
+
+def test_folded_output():
+    """Long lines are folded when serializing a component."""
+    event = Event()
+    event.add("summary", "a" * 100)
+    assert event.to_ical() == (
+        b"BEGIN:VEVENT\r\n"
+        b"SUMMARY:" + b"a" * 66 + b"\r\n " + b"a" * 34 + b"\r\n"
+        b"END:VEVENT\r\n"
+    )
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_to_ical_in_processes(calendars, workers, zoneinfo_only):
+    """Serializing in several processes gives the same result.
+
+    pytz can not unpickle timezones created from a VTIMEZONE component.
+    """
+    calendar = calendars.timezone_same_start
+    assert calendar.to_ical(workers=workers) == calendar.to_ical()
+
+
+def test_to_ical_in_processes_many_subcomponents():
+    """The subcomponents are split into chunks and joined in order."""
+    calendar = Calendar()
+    calendar.add("prodid", "-//test//")
+    for i in range(50):
+        event = Event()
+        event.add("uid", str(i))
+        event.add("summary", "x" * i)
+        calendar.add_component(event)
+    assert calendar.to_ical(workers=4) == calendar.to_ical()
+
+
+@pytest.mark.parametrize("workers", [None, 0, 1])
+def test_serial_workers(workers, monkeypatch):
+    """No pool is used for fewer than two workers."""
+
+    def no_pool(*args, **kw):
+        raise AssertionError("No ProcessPoolExecutor should be created.")
+
+    calendar = Calendar.example()
+    expected = calendar.to_ical()
+    monkeypatch.setattr(component, "ProcessPoolExecutor", no_pool)
+    assert calendar.to_ical(workers=workers) == expected
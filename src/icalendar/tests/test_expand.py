@@ -0,0 +1,243 @@
+"""Expand all recurring components of a calendar."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from icalendar import Calendar, Event, Todo
+
+JANUARY = date(2025, 1, 1), date(2025, 2, 1)
+
+
+def calendar(*components: str) -> Calendar:
+    """Return a calendar with the components."""
+    return Calendar.from_ical(
+        "BEGIN:VCALENDAR\r\n"
+        + "".join(
+            "".join(f"{line.strip()}\r\n" for line in component.strip().splitlines())
+            for component in components
+        )
+        + "END:VCALENDAR\r\n"
+    )
+
+
+DAILY = """
+BEGIN:VEVENT
+UID:daily
+SUMMARY:daily
+DTSTART:20250106T090000Z
+DURATION:PT1H
+RRULE:FREQ=DAILY;COUNT=5
+END:VEVENT
+"""
+
+
+def override(recurrence_id: str, start: str, *lines: str) -> str:
+    """Return an event that modifies an occurrence of DAILY."""
+    return "\n".join(
+        (
+            "BEGIN:VEVENT",
+            "UID:daily",
+            f"SUMMARY:moved {recurrence_id}",
+            f"RECURRENCE-ID{recurrence_id}",
+            f"DTSTART:{start}",
+            "DURATION:PT1H",
+            *lines,
+            "END:VEVENT",
+        )
+    )
+
+
+def summaries(cal: Calendar, start=JANUARY[0], end=JANUARY[1]) -> list[str]:
+    """Return the start and summary of each occurrence."""
+    return [
+        f"{occurrence.start:%d %H:%M} {occurrence.component['SUMMARY']}"
+        for occurrence in cal.expand(start, end)
+    ]
+
+
+def test_without_overrides():
+    """All occurrences of the series are yielded."""
+    assert summaries(calendar(DAILY)) == [
+        "06 09:00 daily",
+        "07 09:00 daily",
+        "08 09:00 daily",
+        "09 09:00 daily",
+        "10 09:00 daily",
+    ]
+
+
+def test_override_replaces_the_occurrence():
+    """The occurrence is moved to the start of the override."""
+    cal = calendar(DAILY, override(":20250108T090000Z", "20250109T120000Z"))
+    assert summaries(cal) == [
+        "06 09:00 daily",
+        "07 09:00 daily",
+        "09 09:00 daily",
+        "09 12:00 moved :20250108T090000Z",
+        "10 09:00 daily",
+    ]
+
+
+def test_recurrence_id_in_another_timezone():
+    """The RECURRENCE-ID can use another timezone than DTSTART."""
+    cal = calendar(
+        DAILY, override(";TZID=Europe/Berlin:20250108T100000", "20250108T120000Z")
+    )
+    assert "08 09:00 daily" not in summaries(cal)
+
+
+def test_this_and_future():
+    """RANGE=THISANDFUTURE modifies all later occurrences."""
+    cal = calendar(
+        DAILY,
+        override(";RANGE=THISANDFUTURE:20250108T090000Z", "20250108T100000Z"),
+    )
+    assert summaries(cal) == [
+        "06 09:00 daily",
+        "07 09:00 daily",
+        "08 10:00 moved ;RANGE=THISANDFUTURE:20250108T090000Z",
+        "09 10:00 moved ;RANGE=THISANDFUTURE:20250108T090000Z",
+        "10 10:00 moved ;RANGE=THISANDFUTURE:20250108T090000Z",
+    ]
+
+
+def test_later_override_of_this_and_future():
+    """Single occurrences can be modified after THISANDFUTURE."""
+    cal = calendar(
+        DAILY,
+        override(";RANGE=THISANDFUTURE:20250107T090000Z", "20250107T100000Z"),
+        override(":20250109T090000Z", "20250109T080000Z"),
+    )
+    occurrences = list(cal.expand(*JANUARY))
+    assert [occurrence.start.hour for occurrence in occurrences] == [9, 10, 10, 8, 10]
+    assert occurrences[3].recurrence_id == datetime(2025, 1, 9, 9, tzinfo=timezone.utc)
+    assert occurrences[4].recurrence_id == datetime(2025, 1, 10, 9, tzinfo=timezone.utc)
+
+
+def test_higher_sequence_wins():
+    """Of two overrides of the same occurrence, we use the newer one."""
+    cal = calendar(
+        DAILY,
+        override(":20250108T090000Z", "20250108T150000Z", "SEQUENCE:2"),
+        override(":20250108T090000Z", "20250108T140000Z", "SEQUENCE:1"),
+    )
+    assert "08 15:00 moved :20250108T090000Z" in summaries(cal)
+    assert "08 14:00 moved :20250108T090000Z" not in summaries(cal)
+
+
+def test_override_moved_into_the_time_span():
+    """The original occurrence is outside the time span."""
+    cal = calendar(DAILY, override(":20250106T090000Z", "20250110T120000Z"))
+    assert summaries(cal, date(2025, 1, 10), date(2025, 1, 11)) == [
+        "10 09:00 daily",
+        "10 12:00 moved :20250106T090000Z",
+    ]
+
+
+def test_override_moved_out_of_the_time_span():
+    """The original occurrence is in the time span but moved."""
+    cal = calendar(DAILY, override(":20250110T090000Z", "20250201T120000Z"))
+    assert summaries(cal, date(2025, 1, 10), date(2025, 1, 11)) == []
+
+
+def test_override_without_master():
+    """We may only know about one modified occurrence."""
+    cal = calendar(override(":20250108T090000Z", "20250108T150000Z"))
+    assert summaries(cal) == ["08 15:00 moved :20250108T090000Z"]
+
+
+def test_occurrences_that_overlap_are_included():
+    """An occurrence can start before the time span."""
+    cal = calendar(DAILY)
+    start = datetime(2025, 1, 7, 9, 30, tzinfo=timezone.utc)
+    occurrences = list(cal.expand(start, start + timedelta(minutes=1)))
+    assert len(occurrences) == 1
+    assert occurrences[0].end == datetime(2025, 1, 7, 10, tzinfo=timezone.utc)
+
+
+def test_occurrences_that_end_at_the_start_are_excluded():
+    """The time span is half open."""
+    cal = calendar(DAILY)
+    start = datetime(2025, 1, 7, 10, tzinfo=timezone.utc)
+    assert list(cal.expand(start, start + timedelta(hours=1))) == []
+
+
+def test_series_are_merged_in_order():
+    """Occurrences of all series are sorted by their start."""
+    cal = calendar(
+        DAILY,
+        """
+        BEGIN:VEVENT
+        UID:weekly
+        SUMMARY:weekly
+        DTSTART;TZID=Europe/Berlin:20250101T093000
+        RRULE:FREQ=WEEKLY
+        END:VEVENT
+        """,
+        """
+        BEGIN:VEVENT
+        UID:once
+        SUMMARY:once
+        DTSTART;VALUE=DATE:20250107
+        END:VEVENT
+        """,
+    )
+    assert summaries(cal, date(2025, 1, 6), date(2025, 1, 9)) == [
+        "06 09:00 daily",
+        "07 00:00 once",
+        "07 09:00 daily",
+        "08 09:30 weekly",  # 08:30 in UTC
+        "08 09:00 daily",
+    ]
+
+
+def test_dates_are_in_the_timezone_of_start():
+    """All-day events are compared in the timezone of the time span."""
+    cal = calendar(
+        """
+        BEGIN:VEVENT
+        UID:holiday
+        SUMMARY:holiday
+        DTSTART;VALUE=DATE:20250107
+        END:VEVENT
+        """
+    )
+    utc = datetime(2025, 1, 7, 23, 30, tzinfo=timezone.utc)
+    assert summaries(cal, utc, utc + timedelta(minutes=1)) == ["07 00:00 holiday"]
+    tokyo = utc.astimezone(timezone(timedelta(hours=9)))
+    assert summaries(cal, tokyo, tokyo + timedelta(minutes=1)) == []
+
+
+def test_components_without_uid_are_separate():
+    """Each component without UID is its own series."""
+    cal = Calendar()
+    for hour in (10, 9):
+        event = Event()
+        event.start = datetime(2025, 1, 6, hour)
+        cal.add_component(event)
+    assert [occurrence.start.hour for occurrence in cal.expand(*JANUARY)] == [9, 10]
+
+
+@pytest.mark.parametrize("component", [Todo, Event])
+def test_same_uid_in_other_components(component):
+    """Events and to-dos do not share their series."""
+    cal = calendar(DAILY)
+    other = component()
+    other.uid = "daily"
+    other.add("RECURRENCE-ID", datetime(2025, 1, 8, 9, tzinfo=timezone.utc))
+    other.start = datetime(2025, 1, 20, 9, tzinfo=timezone.utc)
+    cal.add_component(other)
+    starts = [occurrence.start.day for occurrence in cal.expand(*JANUARY)]
+    if component is Todo:
+        assert starts == [6, 7, 8, 9, 10, 20]
+    else:
+        assert starts == [6, 7, 9, 10, 20]
+
+
+def test_occurrence_repr():
+    """The occurrence shows the component and the time."""
+    occurrence = next(calendar(DAILY).expand(*JANUARY))
+    assert repr(occurrence) == (
+        "<Occurrence VEVENT 2025-01-06 09:00:00+00:00 - 2025-01-06 10:00:00+00:00>"
+    )
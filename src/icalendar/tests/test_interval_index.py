@@ -0,0 +1,230 @@
+"""Find occurrences in a time range with an index."""
+
+import random
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from icalendar import Calendar, Event, Journal, LazyCalendar, Todo
+from icalendar.interval_index import IntervalIndex
+
+HORIZON = date(2025, 1, 1), date(2026, 1, 1)
+UTC = timezone.utc
+
+
+def event(start: datetime, duration: timedelta, uid: str | None = None) -> Event:
+    """Return an event."""
+    e = Event()
+    if uid is not None:
+        e.uid = uid
+    e.start = start
+    e.duration = duration
+    return e
+
+
+@pytest.fixture
+def calendar() -> Calendar:
+    """A calendar with events of different durations."""
+    cal = Calendar()
+    cal.add_component(
+        event(datetime(2025, 1, 6, 9, tzinfo=UTC), timedelta(hours=1), "meeting")
+    )
+    cal.add_component(
+        event(datetime(2025, 1, 1, tzinfo=UTC), timedelta(days=60), "winter")
+    )
+    cal.add_component(event(datetime(2025, 1, 6, 12, tzinfo=UTC), timedelta(0), "now"))
+    return cal
+
+
+def uids(occurrences) -> list[str]:
+    """The UIDs of the occurrences."""
+    return [occurrence.component.uid for occurrence in occurrences]
+
+
+def test_overlapping(calendar):
+    """Long and short occurrences overlap with a time range."""
+    index = calendar.interval_index(*HORIZON)
+    start = datetime(2025, 1, 6, 9, 30, tzinfo=UTC)
+    assert uids(index.overlapping(start, start + timedelta(hours=3))) == [
+        "winter",
+        "meeting",
+        "now",
+    ]
+    assert uids(index.overlapping(date(2025, 4, 1), date(2025, 5, 1))) == []
+
+
+def test_at(calendar):
+    """Occurrences include their start but not their end."""
+    index = calendar.interval_index(*HORIZON)
+    assert uids(index.at(datetime(2025, 1, 6, 9, tzinfo=UTC))) == [
+        "winter",
+        "meeting",
+    ]
+    assert uids(index.at(datetime(2025, 1, 6, 10, tzinfo=UTC))) == ["winter"]
+    assert uids(index.at(datetime(2025, 1, 6, 12, tzinfo=UTC))) == ["winter", "now"]
+
+
+def test_add_component_updates_the_index(calendar):
+    """The index knows about new components."""
+    index = calendar.interval_index(*HORIZON)
+    calendar.add_component(
+        event(datetime(2025, 6, 1, tzinfo=UTC), timedelta(days=1), "summer")
+    )
+    assert calendar.interval_index(*HORIZON) is index
+    assert uids(index.at(datetime(2025, 6, 1, 12, tzinfo=UTC))) == ["summer"]
+
+
+def test_added_override_replaces_the_occurrence():
+    """Components with a RECURRENCE-ID modify their series."""
+    cal = Calendar()
+    daily = event(datetime(2025, 1, 6, 9, tzinfo=UTC), timedelta(hours=1), "daily")
+    daily.add("RRULE", {"FREQ": "DAILY", "COUNT": 3})
+    cal.add_component(daily)
+    index = cal.interval_index(*HORIZON)
+    assert len(index) == 3
+    moved = event(datetime(2025, 1, 7, 15, tzinfo=UTC), timedelta(hours=1), "daily")
+    moved.add("RECURRENCE-ID", datetime(2025, 1, 7, 9, tzinfo=UTC))
+    cal.add_component(moved)
+    assert len(index) == 3
+    assert index.at(datetime(2025, 1, 7, 9, tzinfo=UTC)) == []
+    assert [
+        occurrence.component for occurrence in index.at(datetime(2025, 1, 7, 15, 30))
+    ] == [moved]
+
+
+def test_changed_subcomponents_create_a_new_index(calendar):
+    """We notice when the subcomponents change without add_component()."""
+    index = calendar.interval_index(*HORIZON)
+    calendar.subcomponents.pop()
+    new_index = calendar.interval_index(*HORIZON)
+    assert new_index is not index
+    assert len(new_index) == 2
+
+
+def test_replaced_last_subcomponent_creates_a_new_index(calendar):
+    """The last subcomponent is checked without validation."""
+    index = calendar.interval_index(*HORIZON)
+    calendar.subcomponents[-1] = event(
+        datetime(2025, 6, 1, tzinfo=UTC), timedelta(days=1), "summer"
+    )
+    new_index = calendar.interval_index(*HORIZON)
+    assert new_index is not index
+    assert uids(new_index.at(datetime(2025, 6, 1, 12, tzinfo=UTC))) == ["summer"]
+
+
+def test_replaced_subcomponent_is_noticed_with_validation(calendar):
+    """The number of subcomponents stays the same."""
+    index = calendar.interval_index(*HORIZON)
+    calendar.subcomponents[1] = event(
+        datetime(2025, 6, 1, tzinfo=UTC), timedelta(days=1), "summer"
+    )
+    assert calendar.interval_index(*HORIZON) is index
+    new_index = calendar.interval_index(*HORIZON, validate=True)
+    assert new_index is not index
+    assert uids(new_index.at(datetime(2025, 6, 1, 12, tzinfo=UTC))) == ["summer"]
+    assert uids(new_index.at(datetime(2025, 1, 6, 9, tzinfo=UTC))) == ["meeting"]
+
+
+def test_changed_subcomponent_is_noticed_with_validation(calendar):
+    """Changing the properties of a component updates the occurrences."""
+    index = calendar.interval_index(*HORIZON)
+    meeting = calendar.events[0]
+    meeting.start = datetime(2025, 6, 1, 9, tzinfo=UTC)
+    assert calendar.interval_index(*HORIZON) is index
+    new_index = calendar.interval_index(*HORIZON, validate=True)
+    assert new_index is not index
+    assert uids(new_index.at(datetime(2025, 6, 1, 9, 30, tzinfo=UTC))) == ["meeting"]
+    meeting.add("RRULE", {"FREQ": "DAILY", "COUNT": 2})
+    assert len(calendar.interval_index(*HORIZON, validate=True)) == 4
+    meeting.rrules[0]["COUNT"] = [3]
+    assert len(calendar.interval_index(*HORIZON, validate=True)) == 5
+
+
+def test_changed_value_is_noticed_with_rebuild(calendar):
+    """Changes inside a value are only noticed when we rebuild the index."""
+    index = calendar.interval_index(*HORIZON)
+    calendar.events[0]["DTSTART"].dt = datetime(2025, 6, 1, 9, tzinfo=UTC)
+    assert calendar.interval_index(*HORIZON, validate=True) is index
+    new_index = calendar.interval_index(*HORIZON, rebuild=True)
+    assert new_index is not index
+    assert uids(new_index.at(datetime(2025, 6, 1, 9, 30, tzinfo=UTC))) == ["meeting"]
+
+
+def test_add_component_updates_the_index_of_a_lazy_calendar():
+    """LazyCalendar also adds components to the index."""
+    calendar = LazyCalendar.from_ical(
+        Calendar.example("issue_1050_calendar_with_events_and_todos").to_ical()
+    )
+    index = calendar.interval_index(*HORIZON)
+    calendar.add_component(
+        event(datetime(2025, 6, 1, tzinfo=UTC), timedelta(days=1), "summer")
+    )
+    assert calendar.interval_index(*HORIZON) is index
+    assert uids(index.at(datetime(2025, 6, 1, 12, tzinfo=UTC))) == ["summer"]
+
+
+def test_another_horizon_creates_a_new_index(calendar):
+    """The index covers one horizon."""
+    index = calendar.interval_index(*HORIZON)
+    assert calendar.interval_index(date(2025, 1, 1), date(2025, 1, 2)) is not index
+
+
+def test_only_events_and_todos():
+    """Other components are not indexed."""
+    cal = Calendar()
+    for component in (Event(), Todo(), Journal()):
+        component.start = date(2025, 1, 1)
+        cal.add_component(component)
+    assert len(cal.interval_index(*HORIZON)) == 2
+
+
+def test_occurrences_outside_the_horizon():
+    """Only occurrences within the horizon are indexed."""
+    cal = Calendar()
+    daily = event(datetime(2024, 12, 30, 9, tzinfo=UTC), timedelta(hours=1), "daily")
+    daily.add("RRULE", {"FREQ": "DAILY"})
+    cal.add_component(daily)
+    index = cal.interval_index(*HORIZON)
+    assert len(index) == 365
+    assert index.at(datetime(2026, 1, 1, 9, 30, tzinfo=UTC)) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_same_as_expand(seed):
+    """The index finds what Calendar.expand() yields."""
+    rng = random.Random(seed)  # noqa: S311
+    cal = Calendar()
+    for i in range(200):
+        start = datetime(2025, 1, 1, tzinfo=UTC) + timedelta(
+            minutes=rng.randrange(365 * 24 * 60)
+        )
+        duration = timedelta(minutes=rng.choice([0, 15, 60, 24 * 60, 40 * 24 * 60]))
+        e = event(start, duration, f"event-{i}")
+        if rng.random() < 0.3:
+            e.add("RRULE", {"FREQ": rng.choice(["DAILY", "WEEKLY"]), "COUNT": 20})
+        cal.add_component(e)
+    index = cal.interval_index(*HORIZON)
+    for _ in range(50):
+        # the time range is within the horizon
+        start = datetime(2025, 1, 1, tzinfo=UTC) + timedelta(
+            hours=rng.randrange(358 * 24)
+        )
+        end = start + timedelta(hours=rng.choice([1, 24, 24 * 7]))
+        expected = sorted(
+            (occurrence.start, occurrence.component.uid)
+            for occurrence in cal.expand(start, end)
+        )
+        found = [
+            (occurrence.start, occurrence.component.uid)
+            for occurrence in index.overlapping(start, end)
+        ]
+        assert sorted(found) == expected
+        assert found == sorted(found, key=lambda item: item[0])
+
+
+def test_index_without_calendar():
+    """The index can be used on its own."""
+    index = IntervalIndex(*HORIZON)
+    index.add(event(datetime(2025, 1, 1, 12), timedelta(hours=1)))
+    assert len(index.at(date(2025, 1, 1))) == 0
+    assert len(index.overlapping(date(2025, 1, 1), date(2025, 1, 2))) == 1
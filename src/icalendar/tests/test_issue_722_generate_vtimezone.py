@@ -20,6 +20,7 @@ from dateutil.tz import gettz
 
 from icalendar import Calendar, Component, Event, Timezone
 from icalendar.timezone import tzid_from_tzinfo, tzids_from_tzinfo
+from icalendar.timezone.transitions import TransitionTimezone
 
 tzids = pytest.mark.parametrize(
     "tzid",
@@ -345,7 +346,7 @@ def test_dateutil_timezone_is_not_found_with_tzname(calendars, no_pytz):
     cal: Calendar = calendars.america_new_york
     cal.subcomponents.remove(cal.timezones[0])
     assert cal.get_missing_tzids() == {"custom_America/New_York"}
-    assert "dateutil" in repr(cal.events[0].start.tzinfo.__class__)
+    assert isinstance(cal.events[0].start.tzinfo, TransitionTimezone)
 
 
 @pytest.mark.parametrize("tzname", ["America/New_York", "Arctic/Longyearbyen"])
@@ -435,3 +436,76 @@ def test_we_can_identify_dateutil_timezones(tzid):
     """
     tz = gettz(tzid)
     assert tz is None or tzid in tzids_from_tzinfo(tz)
+
+
+@pytest.mark.parametrize(
+    "tzid",
+    ["Europe/Berlin", "America/New_York", "Australia/Sydney", "Asia/Kolkata", "UTC"],
+)
+def test_transition_table_and_probing_give_the_same_result(tzp, tzid):
+    """Reading the transitions is the same as searching for them."""
+    tz = tzp.timezone(tzid)
+    first = tzp.localize(datetime(1970, 1, 1), tz)
+    last = tzp.localize(datetime(2038, 1, 1), tz)
+    offsets = Timezone._offsets_from_transitions(tz, first, last)
+    assert offsets is not None
+    assert offsets == Timezone._offsets_by_probing(tz, first, last)
+
+
+def test_short_periods_are_found(tzp):
+    """Fiji had summer time for four weeks, probing skips this."""
+    tz = Timezone.from_tzid(
+        "Pacific/Fiji", first_date=date(2020, 1, 1), last_date=date(2022, 1, 1)
+    )
+    starts = [
+        start
+        for sub in tz.daylight
+        for start in [sub.DTSTART] + [rdate.dt for rdate in sub.get("RDATE", [])]
+    ]
+    assert datetime(2020, 12, 20, 3) in starts
+
+
+@pytest.mark.parametrize(
+    "tzid", ["Egypt", "Africa/Casablanca", "America/Argentina/La_Rioja"]
+)
+def test_transition_table_finds_more_than_probing(tzp, tzid):
+    """These timezones have short periods that probing skips.
+
+    The VTIMEZONE components change on purpose.
+    """
+    tz = tzp.timezone(tzid)
+    first = tzp.localize(datetime(1970, 1, 1), tz)
+    last = tzp.localize(datetime(2038, 1, 1), tz)
+    offsets = Timezone._offsets_from_transitions(tz, first, last)
+    probed = Timezone._offsets_by_probing(tz, first, last)
+    assert offsets != probed
+    for key, starts in probed.items():
+        assert set(starts) <= set(offsets[key])
+
+
+def test_summer_time_of_egypt_after_ramadan_2010(tzp):
+    """Egypt paused summer time for Ramadan and had it for three more weeks."""
+    tz = Timezone.from_tzid(
+        "Egypt", first_date=date(2010, 1, 1), last_date=date(2011, 1, 1)
+    )
+    (daylight,) = tz.daylight
+    assert daylight.DTSTART == datetime(2010, 4, 30, 1)
+    assert [start for start, _ in daylight.rdates] == [datetime(2010, 9, 10, 1)]
+    dt = tzp.localize(datetime(2010, 9, 20, 12), tz.to_tz(tzp, lookup_tzid=False))
+    assert dt.utcoffset() == timedelta(hours=3)
+
+
+def test_timezones_without_transition_table_are_probed():
+    """dateutil does not reveal its transitions."""
+    tz = gettz("Europe/Berlin")
+    first = datetime(2024, 1, 1, tzinfo=tz)
+    last = datetime(2025, 1, 1, tzinfo=tz)
+    assert Timezone._offsets_from_transitions(tz, first, last) is None
+    vtimezone = Timezone.from_tzinfo(
+        tz, "Europe/Berlin", first_date=first.date(), last_date=last.date()
+    )
+    assert [sub.TZOFFSETTO for sub in vtimezone.subcomponents] == [
+        timedelta(hours=1),
+        timedelta(hours=2),
+        timedelta(hours=1),
+    ]
@@ -12,6 +12,7 @@ depth comfortably above the recursion limit so the recursive implementation
 would fail while the iterative one succeeds.
 """
 
+import io
 import sys
 
 import pytest
@@ -154,3 +155,14 @@ def test_error_path_is_preserved_for_nested_jcal():
         r"A component must be a list with 3 items\.",
     ):
         Component.from_jcal(bad)
+
+
+def test_write_jcal_handles_deeply_nested_components():
+    """Writing deeply nested jCal JSON must not recurse."""
+    depth = sys.getrecursionlimit() + 50
+    calendar = Component.from_jcal(_nested_jcal(depth))
+    file = io.StringIO()
+    calendar.write_jcal(file)
+    text = file.getvalue()
+    assert text.count('["vevent", ') == depth
+    assert text.endswith("]]" * (depth + 1))
@@ -0,0 +1,88 @@
+"""LazyCalendar.from_jcal keeps the jCal of the subcomponents until needed."""
+
+import pytest
+
+from icalendar import Calendar, Event, JCalParsingError, LazyCalendar
+
+
+@pytest.fixture
+def jcal(calendars):
+    """The jCal of a calendar with different components."""
+    return calendars.issue_1050_calendar_with_events_and_todos.to_jcal()
+
+
+def test_same_as_from_jcal(source_file):
+    """The lazy calendar has the same content as the parsed one."""
+    jcal = source_file.to_jcal()
+    try:
+        expected = Calendar.from_jcal(jcal)
+    except JCalParsingError as error:
+        # Some example files do not survive the round trip.
+        message = str(error)
+    else:
+        message = None
+    if message is not None:
+        with pytest.raises(JCalParsingError) as error:
+            LazyCalendar.from_jcal(jcal).subcomponents
+        assert str(error.value) == message
+        return
+    calendar = LazyCalendar.from_jcal(jcal)
+    assert calendar.to_ical() == expected.to_ical()
+
+
+def test_properties_are_parsed_immediately(jcal):
+    """The calendar properties are available but no subcomponent is parsed."""
+    calendar = LazyCalendar.from_jcal(jcal)
+    assert calendar.is_lazy()
+    assert calendar.prodid == "-//Test//Test//EN"
+    assert calendar.is_lazy()
+
+
+def test_only_accessed_components_are_parsed(jcal):
+    """Walking parses only the matching subcomponents."""
+    calendar = LazyCalendar.from_jcal(jcal)
+    assert [todo["SUMMARY"] for todo in calendar.todos] == ["Test Todo 1"]
+    strategy = calendar._subcomponents
+    assert [c.is_parsed() for c in strategy._components] == [
+        c.name in ("VTODO", "VTIMEZONE") for c in strategy._components
+    ]
+    assert calendar.is_lazy()
+
+
+def test_json_string(jcal):
+    """JSON strings are decoded."""
+    calendar = Calendar.from_jcal(jcal)
+    lazy = LazyCalendar.from_jcal(calendar.to_json())
+    assert lazy.subcomponents == calendar.subcomponents
+
+
+def test_with_uid(jcal):
+    """Only components with the UID are parsed."""
+    calendar = LazyCalendar.from_jcal(jcal)
+    (event,) = calendar.with_uid(calendar.events[0].uid)
+    assert event == calendar.events[0]
+    assert calendar.with_uid("unknown uid") == []
+    assert calendar.is_lazy()
+
+
+def test_other_root_component_is_parsed():
+    """A root component that is not a calendar is parsed completely."""
+    event = LazyCalendar.from_jcal(["vevent", [], [["valarm", [], []]]])
+    assert isinstance(event, Event)
+    assert event.subcomponents[0].name == "VALARM"
+
+
+def test_invalid_subcomponent_raises_immediately():
+    """The name of a subcomponent is needed right away."""
+    with pytest.raises(JCalParsingError, match=r"\[2\]\[1\] in LazyCalendar"):
+        LazyCalendar.from_jcal(["vcalendar", [], [["vevent", [], []], 1]])
+
+
+def test_invalid_subcomponent_raises_when_parsed():
+    """The content of a subcomponent is checked when it is parsed."""
+    calendar = LazyCalendar.from_jcal(
+        ["vcalendar", [], [["vevent", [], []], ["vtodo", [1], []]]]
+    )
+    assert len(calendar.events) == 1
+    with pytest.raises(JCalParsingError, match=r"\[2\]\[1\]\[1\]\[0\] in Todo"):
+        calendar.todos
@@ -0,0 +1,129 @@
+"""Add VTIMEZONE components that only cover the dates of the calendar.
+
+Timezones generated from 1970 to 2038 contain many transitions
+that a calendar does not need.
+"""
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from icalendar import Calendar, Event, Timezone
+from icalendar.timezone import vtimezone_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Generate the timezones for each test."""
+    vtimezone_cache.clear()
+    yield
+    vtimezone_cache.clear()
+
+
+def test_date_ranges_of_example(calendars):
+    """All kinds of dates count."""
+    calendar = calendars.issue_722_missing_timezones
+    assert calendar.get_tzid_date_ranges() == {
+        "America/New_York": (date(2014, 8, 29), date(2014, 8, 30)),
+        "America/Los_Angeles": (date(2014, 8, 29), date(2014, 8, 30)),
+        "Europe/Berlin": (date(2024, 9, 13), date(2024, 9, 14)),
+        "Europe/Moscow": (date(2019, 3, 9), date(2019, 3, 10)),
+        "Asia/Singapore": (date(2014, 8, 29), date(2014, 8, 30)),
+        "Mexico/General": (date(2019, 3, 9), date(2019, 3, 10)),
+        "America/Noronha": (date(2019, 3, 9), date(2019, 3, 10)),
+    }
+
+
+def test_period_with_duration():
+    """The end of a period counts."""
+    calendar = Calendar.from_ical(
+        "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\n"
+        "RDATE;VALUE=PERIOD;TZID=Europe/Berlin:20240913T120000/P20D\r\n"
+        "END:VEVENT\r\nEND:VCALENDAR\r\n"
+    )
+    assert calendar.get_tzid_date_ranges() == {
+        "Europe/Berlin": (date(2024, 9, 13), date(2024, 10, 4))
+    }
+
+
+@pytest.fixture
+def event(tzp):
+    """An event in Berlin."""
+    event = Event()
+    event.start = tzp.localize(datetime(2024, 1, 10, 10), "Europe/Berlin")
+    event.DURATION = datetime(2024, 4, 1) - datetime(2024, 1, 10)
+    return event
+
+
+@pytest.fixture
+def calendar(event):
+    calendar = Calendar()
+    calendar.add_component(event)
+    return calendar
+
+
+def test_duration_counts(calendar):
+    """The event ends after the change to summer time."""
+    assert calendar.get_tzid_date_ranges() == {
+        "Europe/Berlin": (date(2024, 1, 10), date(2024, 4, 2))
+    }
+
+
+def test_rrule_with_until(calendar, event):
+    """The recurrences end at UNTIL."""
+    event.add("RRULE", {"FREQ": "YEARLY", "UNTIL": datetime(2026, 1, 10, 9)})
+    assert calendar.get_tzid_date_ranges() == {
+        "Europe/Berlin": (date(2024, 1, 10), date(2026, 1, 11))
+    }
+
+
+def test_rrule_with_utc_until(tzp):
+    """UNTIL in UTC is converted to the timezone of DTSTART."""
+    event = Event()
+    event.start = tzp.localize(datetime(2024, 1, 10, 10), "Pacific/Auckland")
+    event.add(
+        "RRULE",
+        {"FREQ": "DAILY", "UNTIL": datetime(2024, 1, 20, 21, tzinfo=timezone.utc)},
+    )
+    calendar = Calendar()
+    calendar.add_component(event)
+    assert calendar.get_tzid_date_ranges() == {
+        "Pacific/Auckland": (date(2024, 1, 10), date(2024, 1, 22))
+    }
+
+
+def test_rrule_without_until(calendar, event):
+    """Recurrences without end are covered until the last date."""
+    event.add("RRULE", {"FREQ": "YEARLY"})
+    assert calendar.get_tzid_date_ranges(date(2030, 1, 1)) == {
+        "Europe/Berlin": (date(2024, 1, 10), date(2030, 1, 1))
+    }
+    calendar.add_missing_timezones(last_date=date(2030, 1, 1), minimal=True)
+    assert "2030-01-01" in calendar.timezones[0]["COMMENT"]
+
+
+def test_minimal_timezone_has_the_used_transitions(calendar):
+    """The component covers the winter and summer time of the event."""
+    calendar.add_missing_timezones(minimal=True)
+    timezone = calendar.timezones[0]
+    assert timezone.tz_name == "Europe/Berlin"
+    assert [sub.name for sub in timezone.walk()[1:]] == ["STANDARD", "DAYLIGHT"]
+    assert timezone.to_tz(lookup_tzid=False).utcoffset(datetime(2024, 4, 1)) == (
+        Timezone.from_tzid("Europe/Berlin")
+        .to_tz(lookup_tzid=False)
+        .utcoffset(datetime(2024, 4, 1))
+    )
+
+
+def test_minimal_timezone_is_smaller(calendar):
+    """The default adds transitions from 1970 to 2038."""
+    minimal = calendar.copy()
+    minimal.add_missing_timezones(minimal=True)
+    calendar.add_missing_timezones()
+    assert len(minimal.to_ical()) < len(calendar.to_ical()) / 2
+
+
+def test_default_is_unchanged(calendar):
+    """Without minimal, the dates are not used."""
+    calendar.add_missing_timezones()
+    assert str(Timezone.DEFAULT_FIRST_DATE) in calendar.timezones[0]["COMMENT"]
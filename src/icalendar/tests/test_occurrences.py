@@ -0,0 +1,220 @@
+"""Compute the occurrences of recurring components."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from icalendar import Event, Journal, Todo
+from icalendar.prop import vRecur
+from icalendar.recurrence import Recurrence, rrule_from_recur
+
+YEAR_2025 = date(2025, 1, 1), date(2026, 1, 1)
+
+
+def event(*lines: str) -> Event:
+    """Return an event with the lines."""
+    return Event.from_ical(
+        "BEGIN:VEVENT\r\n" + "".join(f"{line}\r\n" for line in lines) + "END:VEVENT\r\n"
+    )
+
+
+def test_daily_in_local_time(tzp):
+    """The occurrences keep their local time when DST begins."""
+    e = event(
+        "DTSTART;TZID=Europe/Berlin:20250329T100000",
+        "RRULE:FREQ=DAILY;COUNT=3",
+    )
+    occurrences = e.occurrences(*YEAR_2025)
+    assert occurrences == [
+        tzp.localize(datetime(2025, 3, day, 10), "Europe/Berlin")
+        for day in (29, 30, 31)
+    ]
+    assert [dt.utcoffset() for dt in occurrences] == [
+        timedelta(hours=1),
+        timedelta(hours=2),
+        timedelta(hours=2),
+    ]
+
+
+def test_all_day_events_occur_on_dates():
+    """All-day events return dates."""
+    e = event(
+        "DTSTART;VALUE=DATE:20250101",
+        "RRULE:FREQ=MONTHLY;UNTIL=20250401",
+        "EXDATE;VALUE=DATE:20250201",
+    )
+    assert e.occurrences(*YEAR_2025) == [
+        date(2025, 1, 1),
+        date(2025, 3, 1),
+        date(2025, 4, 1),
+    ]
+
+
+def test_floating_time():
+    """Events without a timezone return naive datetimes."""
+    e = event("DTSTART:20250101T090000", "RRULE:FREQ=YEARLY;COUNT=2")
+    assert e.occurrences(date(2020, 1, 1), date(2030, 1, 1)) == [
+        datetime(2025, 1, 1, 9),
+        datetime(2026, 1, 1, 9),
+    ]
+
+
+def test_utc_until_is_included(tzp):
+    """UNTIL in UTC is compared to the occurrences in their timezone."""
+    e = event(
+        "DTSTART;TZID=America/New_York:20250101T090000",
+        "RRULE:FREQ=DAILY;UNTIL=20250103T140000Z",
+    )
+    assert len(e.occurrences(*YEAR_2025)) == 3
+
+
+def test_date_until_includes_the_whole_day():
+    """UNTIL can be a date although DTSTART is a datetime."""
+    e = event("DTSTART:20250101T090000", "RRULE:FREQ=DAILY;UNTIL=20250103")
+    assert len(e.occurrences(*YEAR_2025)) == 3
+
+
+def test_exdate_and_rdate(tzp):
+    """EXDATE removes occurrences and RDATE adds them."""
+    e = event(
+        "DTSTART;TZID=Europe/Berlin:20250106T100000",
+        "RRULE:FREQ=WEEKLY;COUNT=4",
+        "EXDATE:20250113T090000Z",
+        "EXDATE;VALUE=DATE:20250120",
+        "RDATE;TZID=Europe/Berlin:20250108T150000",
+        "RDATE;VALUE=PERIOD:20250110T080000Z/PT1H",
+    )
+    assert e.occurrences(*YEAR_2025) == [
+        tzp.localize(dt, "Europe/Berlin")
+        for dt in (
+            datetime(2025, 1, 6, 10),
+            datetime(2025, 1, 8, 15),
+            datetime(2025, 1, 10, 9),
+            datetime(2025, 1, 27, 10),
+        )
+    ]
+
+
+def test_without_rules_only_dtstart_occurs():
+    """A component without RRULE occurs once."""
+    e = event("DTSTART:20250101T090000")
+    assert e.occurrences(*YEAR_2025) == [datetime(2025, 1, 1, 9)]
+
+
+def test_without_dtstart_nothing_occurs():
+    """We cannot compute occurrences without a start."""
+    assert Event().occurrences(*YEAR_2025) == []
+    assert Todo().occurrences(*YEAR_2025) == []
+    assert Journal().occurrences(*YEAR_2025) == []
+
+
+def test_start_is_included_and_end_is_excluded():
+    """The range is half open."""
+    e = event("DTSTART:20250101T090000", "RRULE:FREQ=DAILY")
+    assert e.occurrences(datetime(2025, 1, 2, 9), datetime(2025, 1, 4, 9)) == [
+        datetime(2025, 1, 2, 9),
+        datetime(2025, 1, 3, 9),
+    ]
+
+
+def test_bounds_in_another_timezone(tzp):
+    """Bounds with a timezone are compared in UTC."""
+    e = event(
+        "DTSTART;TZID=Pacific/Auckland:20250101T090000",
+        "RRULE:FREQ=DAILY",
+    )
+    # 2025-01-01 09:00 in Auckland is 2024-12-31 20:00 UTC
+    start = datetime(2024, 12, 31, 20, tzinfo=timezone.utc)
+    assert e.occurrences(start, start + timedelta(hours=1)) == [
+        tzp.localize(datetime(2025, 1, 1, 9), "Pacific/Auckland")
+    ]
+    assert e.occurrences(start + timedelta(seconds=1), start + timedelta(days=1)) == []
+
+
+def test_infinite_rule():
+    """Rules without end can be expanded within the bounds."""
+    e = event("DTSTART:20000101T000000", "RRULE:FREQ=HOURLY")
+    assert len(e.occurrences(date(2100, 1, 1), date(2100, 1, 2))) == 24
+
+
+def test_todo_and_journal():
+    """To-dos and journal entries can recur."""
+    for component in (Todo(), Journal()):
+        component.start = date(2025, 1, 1)
+        component.add("RRULE", {"FREQ": "YEARLY", "COUNT": 2})
+        assert component.occurrences(date(2025, 1, 1), date(2030, 1, 1)) == [
+            date(2025, 1, 1),
+            date(2026, 1, 1),
+        ]
+
+
+@pytest.fixture
+def weekly() -> Event:
+    """A weekly event that we expanded once."""
+    e = event("DTSTART:20250106T100000", "RRULE:FREQ=WEEKLY;COUNT=3")
+    assert len(e.occurrences(*YEAR_2025)) == 3
+    return e
+
+
+def test_compiled_rules_are_reused(weekly):
+    """The rules are not compiled again."""
+    recurrence = Recurrence.of(weekly)
+    weekly.occurrences(*YEAR_2025)
+    assert Recurrence.of(weekly) is recurrence
+
+
+def test_changing_the_rrule(weekly):
+    """The RRULE can be changed in place."""
+    weekly["RRULE"]["COUNT"] = [2]
+    assert len(weekly.occurrences(*YEAR_2025)) == 2
+
+
+def test_adding_an_exdate(weekly):
+    """Added EXDATE values are used."""
+    weekly.add("EXDATE", datetime(2025, 1, 13, 10))
+    assert len(weekly.occurrences(*YEAR_2025)) == 2
+    weekly.add("EXDATE", datetime(2025, 1, 20, 10))
+    assert len(weekly.occurrences(*YEAR_2025)) == 1
+
+
+def test_adding_an_rdate(weekly):
+    """Added RDATE values are used."""
+    weekly.add("RDATE", datetime(2025, 1, 7, 10))
+    assert len(weekly.occurrences(*YEAR_2025)) == 4
+
+
+def test_changing_the_start(weekly):
+    """A new DTSTART moves the occurrences."""
+    weekly.start = datetime(2025, 2, 3, 10)
+    assert weekly.occurrences(*YEAR_2025)[0] == datetime(2025, 2, 3, 10)
+
+
+def test_removing_the_rrule(weekly):
+    """Without RRULE only DTSTART occurs."""
+    del weekly["RRULE"]
+    assert weekly.occurrences(*YEAR_2025) == [datetime(2025, 1, 6, 10)]
+
+
+def test_copies_compile_their_own_rules(weekly):
+    """Copies of a component do not share the compiled rules."""
+    copy = weekly.copy()
+    copy.update(weekly)
+    copy["RRULE"] = vRecur.from_ical("FREQ=DAILY;COUNT=5")
+    assert len(copy.occurrences(*YEAR_2025)) == 5
+    assert len(weekly.occurrences(*YEAR_2025)) == 3
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        "FREQ=YEARLY;UNTIL=20300101T000000Z",
+        "FREQ=YEARLY",
+        "FREQ=YEARLY;BYEASTER=0;UNTIL=20300101T000000Z",
+    ],
+)
+def test_until_can_be_replaced(rule):
+    """UNTIL is replaced with the local time that we pass."""
+    rrule = rrule_from_recur(
+        vRecur.from_ical(rule), datetime(2025, 1, 1), until=datetime(2026, 12, 31)
+    )
+    assert [dt.year for dt in rrule] == [2025, 2026]
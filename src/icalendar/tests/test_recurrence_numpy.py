@@ -0,0 +1,109 @@
+"""Compute the occurrences of simple rules with NumPy.
+
+The results are the same as those of Component.occurrences().
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from icalendar import Event, Todo
+
+np = pytest.importorskip("numpy")
+
+from icalendar.recurrence_numpy import occurrence_array  # noqa: E402
+
+YEAR_2025 = date(2025, 1, 1), date(2026, 1, 1)
+
+
+def event(*lines: str) -> Event:
+    """Return an event with the lines."""
+    return Event.from_ical(
+        "BEGIN:VEVENT\r\n" + "".join(f"{line}\r\n" for line in lines) + "END:VEVENT\r\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        "FREQ=DAILY",
+        "FREQ=DAILY;INTERVAL=3;COUNT=10",
+        "FREQ=DAILY;UNTIL=20250330T010000Z",
+        "FREQ=DAILY;UNTIL=20250330",
+        "FREQ=WEEKLY;INTERVAL=2",
+        "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+        "FREQ=WEEKLY;BYDAY=SU,TU;COUNT=7",
+        "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,SU;WKST=SU",
+        "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,SU;WKST=MO",
+        "FREQ=MONTHLY",
+        "FREQ=MONTHLY;INTERVAL=5;COUNT=4",
+        # these are computed by dateutil
+        "FREQ=MONTHLY;BYDAY=-1FR",
+        "FREQ=YEARLY;BYMONTH=3,4",
+    ],
+)
+@pytest.mark.parametrize(
+    "dtstart",
+    [
+        "DTSTART;TZID=Europe/Berlin:20250131T093000",
+        "DTSTART:20250131T093000Z",
+        "DTSTART:20250131T093000",
+        "DTSTART;VALUE=DATE:20250131",
+    ],
+)
+def test_same_as_occurrences(tzp, rule, dtstart):
+    """The occurrences are the same as with dateutil."""
+    if dtstart.endswith("20250131"):
+        rule = rule.split(";UNTIL=")[0]
+    e = event(dtstart, f"RRULE:{rule}")
+    assert occurrence_array(e, *YEAR_2025).to_list() == e.occurrences(*YEAR_2025)
+
+
+def test_exdate_and_rdate(tzp):
+    """EXDATE values are removed and RDATE values are added."""
+    e = event(
+        "DTSTART;TZID=Europe/Berlin:20250106T100000",
+        "RRULE:FREQ=WEEKLY;COUNT=6",
+        "EXDATE:20250113T090000Z",
+        "EXDATE;VALUE=DATE:20250120",
+        "RDATE;TZID=Europe/Berlin:20250108T150000,20250106T100000",
+        "RDATE;VALUE=PERIOD:20250110T080000Z/PT1H",
+    )
+    occurrences = occurrence_array(e, *YEAR_2025)
+    assert occurrences.to_list() == e.occurrences(*YEAR_2025)
+    assert len(occurrences) == 6
+
+
+def test_starts_are_in_local_time():
+    """The array does not contain the timezone."""
+    e = event(
+        "DTSTART;TZID=America/New_York:20250101T090000", "RRULE:FREQ=DAILY;COUNT=2"
+    )
+    occurrences = occurrence_array(e, *YEAR_2025)
+    assert occurrences.starts.dtype == np.dtype("datetime64[s]")
+    assert occurrences.starts.tolist() == [
+        datetime(2025, 1, 1, 9),
+        datetime(2025, 1, 2, 9),
+    ]
+    assert str(occurrences.tz) == "America/New_York"
+
+
+def test_bounds_are_half_open():
+    """The start is included and the end is excluded."""
+    e = event("DTSTART:20250101T090000", "RRULE:FREQ=DAILY")
+    occurrences = occurrence_array(e, datetime(2025, 1, 2, 9), datetime(2025, 1, 4, 9))
+    assert occurrences.to_list() == [datetime(2025, 1, 2, 9), datetime(2025, 1, 3, 9)]
+
+
+def test_many_occurrences():
+    """Rules without end can be expanded for a long time."""
+    e = event("DTSTART:20000101T000000", "RRULE:FREQ=DAILY;INTERVAL=1")
+    occurrences = occurrence_array(e, date(2000, 1, 1), date(2100, 1, 1))
+    assert len(occurrences) == (date(2100, 1, 1) - date(2000, 1, 1)).days
+    assert np.all(np.diff(occurrences.starts) == np.timedelta64(timedelta(days=1)))
+
+
+def test_without_dtstart():
+    """Components without DTSTART do not occur."""
+    assert len(occurrence_array(Todo(), *YEAR_2025)) == 0
+    assert occurrence_array(Todo(), *YEAR_2025).to_list() == []
@@ -0,0 +1,111 @@
+"""Compiled timezones can be stored in a directory."""
+
+import pickle
+from datetime import timezone
+
+import pytest
+
+from icalendar import Timezone, config
+from icalendar.timezone import TZP, tzinfo_cache, vtimezone_cache
+
+
+@pytest.fixture
+def directory(tmp_path, monkeypatch):
+    """The cache directory."""
+    monkeypatch.setattr(config, "TIMEZONE_CACHE_DIRECTORY", tmp_path)
+    vtimezone_cache.clear()
+    tzinfo_cache.clear()
+    yield tmp_path
+    vtimezone_cache.clear()
+    tzinfo_cache.clear()
+
+
+def files(directory, suffix):
+    """The cache files."""
+    return sorted(directory.glob(f"*{suffix}"))
+
+
+def test_cache_is_disabled_by_default(tmp_path, monkeypatch, timezones, tzp):
+    """Nothing is written without a directory."""
+    assert config.TIMEZONE_CACHE_DIRECTORY is None
+    monkeypatch.chdir(tmp_path)
+    TZP(tzp.name).cache_timezone_component(timezones.pacific_fiji)
+    Timezone.from_tzid("Europe/Berlin")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_timezone_is_loaded_from_the_directory(directory, timezones, zoneinfo_only):
+    """Another process loads the timezone from the cache."""
+    tz = TZP("zoneinfo").create_timezone(timezones.pacific_fiji)
+    (path,) = files(directory, ".pickle")
+    assert pickle.loads(path.read_bytes()).key == tz.key  # noqa: S301
+    path.write_bytes(pickle.dumps(timezone.utc))
+    tzinfo_cache.clear()
+    other_tzp = TZP("zoneinfo")
+    other_tzp.cache_timezone_component(timezones.pacific_fiji)
+    assert other_tzp.timezone("custom_Pacific/Fiji") is timezone.utc
+
+
+def test_other_components_have_other_files(directory, timezones, zoneinfo_only):
+    """The content of the component is the key."""
+    component = timezones.pacific_fiji
+    TZP("zoneinfo").create_timezone(component)
+    component["TZID"] = "other"
+    TZP("zoneinfo").create_timezone(component)
+    assert len(files(directory, ".pickle")) == 2
+
+
+def test_timezones_that_cannot_be_loaded_are_not_stored(
+    directory, timezones, pytz_only
+):
+    """pytz looks up the timezone by name when it is loaded."""
+    tz = TZP("pytz").create_timezone(timezones.pacific_fiji)
+    assert tz.zone == "custom_Pacific/Fiji"
+    assert files(directory, ".pickle") == []
+
+
+def test_broken_file_is_replaced(directory, timezones, zoneinfo_only):
+    """Files that cannot be loaded are written again."""
+    TZP("zoneinfo").create_timezone(timezones.pacific_fiji)
+    (path,) = files(directory, ".pickle")
+    path.write_bytes(b"broken")
+    tzinfo_cache.clear()
+    tz = TZP("zoneinfo").create_timezone(timezones.pacific_fiji)
+    assert tz.key == "custom_Pacific/Fiji"
+    assert pickle.loads(path.read_bytes()).key == tz.key  # noqa: S301
+
+
+def test_vtimezone_is_loaded_from_the_directory(directory, tzp):
+    """Generated components are stored as iCalendar."""
+    berlin = Timezone.from_tzid("Europe/Berlin")
+    (path,) = files(directory, ".ics")
+    assert Timezone.from_ical(path.read_bytes()) == berlin
+    berlin["COMMENT"] = "from the cache"
+    path.write_bytes(berlin.to_ical())
+    vtimezone_cache.clear()
+    assert Timezone.from_tzid("Europe/Berlin")["COMMENT"] == "from the cache"
+
+
+def test_vtimezone_key(directory, tzp):
+    """The arguments are part of the key."""
+    Timezone.from_tzid("Europe/Berlin")
+    Timezone.from_tzid("America/New_York")
+    Timezone.from_tzid("Europe/Berlin", last_date=Timezone.DEFAULT_FIRST_DATE)
+    assert len(files(directory, ".ics")) == 3
+
+
+def test_custom_timezones_are_not_generated_from_the_cache(directory, timezones):
+    """Only IANA timezone data can be identified."""
+    tzp = TZP("zoneinfo")
+    tzp.cache_timezone_component(timezones.pacific_fiji)
+    Timezone.from_tzid("custom_Pacific/Fiji", tzp)
+    assert files(directory, ".ics") == []
+
+
+def test_directory_cannot_be_written(tmp_path, monkeypatch, timezones):
+    """The cache is optional."""
+    file = tmp_path / "file"
+    file.write_text("not a directory")
+    monkeypatch.setattr(config, "TIMEZONE_CACHE_DIRECTORY", file / "cache")
+    tz = TZP("zoneinfo").create_timezone(timezones.pacific_fiji)
+    assert tz.key == "custom_Pacific/Fiji"
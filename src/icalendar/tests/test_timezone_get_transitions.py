@@ -0,0 +1,113 @@
+"""Timezone.get_transitions takes linear time.
+
+The DST offset of a DAYLIGHT transition was found by searching
+the earlier and later transitions for every transition.
+For VTIMEZONE components with many RDATEs, this was quadratic.
+"""
+
+import time
+import zoneinfo
+from datetime import date, datetime, timedelta, timezone
+
+import dateutil.rrule
+import pytest
+
+from icalendar import Timezone, TimezoneDaylight, TimezoneStandard
+from icalendar.prop import vRecur
+from icalendar.recurrence import rrule_from_recur
+
+START = datetime(1970, 3, 29, 2)  # a Sunday
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        "FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU",
+        "FREQ=YEARLY;BYMONTH=10;BYDAY=1SU;UNTIL=20061029T060000Z",
+        "FREQ=YEARLY;BYMONTH=4;BYDAY=1SU;COUNT=10;WKST=MO",
+        "FREQ=MONTHLY;INTERVAL=6;BYMONTHDAY=1,-1;BYSETPOS=1",
+        "FREQ=YEARLY;BYYEARDAY=100;BYHOUR=2;BYMINUTE=30;BYSECOND=0",
+        "FREQ=YEARLY;BYWEEKNO=20;BYWEEKDAY=MO",
+        # these are parsed from the string
+        "RSCALE=GREGORIAN;FREQ=YEARLY",
+        "FREQ=YEARLY;BYMONTH=5L",
+        "FREQ=YEARLY;UNTIL=20001231",
+    ],
+)
+def test_rrule_is_created_from_recur(rule):
+    """The rule is the same as the one dateutil parses."""
+    dtstart = START.replace(tzinfo=timezone.utc)
+    try:
+        expected = list(dateutil.rrule.rrulestr(rule, dtstart=dtstart)[:50])
+    except ValueError:
+        with pytest.raises(ValueError):
+            rrule_from_recur(vRecur.from_ical(rule), dtstart)
+        return
+    rrule = rrule_from_recur(vRecur.from_ical(rule), dtstart)
+    assert list(rrule[:50]) == expected
+
+
+def test_daylight_before_standard():
+    """The first DAYLIGHT transitions use the next STANDARD offset."""
+    tz = Timezone()
+    tz.add("TZID", "test")
+    daylight = TimezoneDaylight()
+    daylight.DTSTART = START
+    daylight.add("RDATE", [START + timedelta(days=7 * i) for i in range(1, 3)])
+    daylight.TZOFFSETFROM = timedelta(hours=1)
+    daylight.TZOFFSETTO = timedelta(hours=2)
+    daylight.add("TZNAME", "DST")
+    standard = TimezoneStandard()
+    standard.DTSTART = START + timedelta(days=100)
+    standard.TZOFFSETFROM = timedelta(hours=2)
+    standard.TZOFFSETTO = timedelta(hours=1)
+    standard.add("TZNAME", "STD")
+    tz.add_component(daylight)
+    tz.add_component(standard)
+    _, transition_info = tz.get_transitions()
+    assert transition_info == [
+        (timedelta(hours=2), timedelta(hours=1), "DST"),
+        (timedelta(hours=2), timedelta(hours=1), "DST"),
+        (timedelta(hours=2), timedelta(hours=1), "DST"),
+        (timedelta(hours=1), timedelta(0), "STD"),
+    ]
+
+
+def test_many_daylight_transitions_are_fast():
+    """Many DAYLIGHT transitions before a STANDARD transition.
+
+    This took minutes with the quadratic search.
+    """
+    tz = Timezone()
+    tz.add("TZID", "many transitions")
+    daylight = TimezoneDaylight()
+    daylight.DTSTART = START
+    daylight.add("RDATE", [START + timedelta(hours=i) for i in range(1, 20_000)])
+    daylight.TZOFFSETFROM = timedelta(hours=1)
+    daylight.TZOFFSETTO = timedelta(hours=2)
+    standard = TimezoneStandard()
+    standard.DTSTART = datetime(2100, 1, 1)
+    standard.TZOFFSETFROM = timedelta(hours=2)
+    standard.TZOFFSETTO = timedelta(hours=1)
+    tz.add_component(daylight)
+    tz.add_component(standard)
+    start = time.perf_counter()
+    transition_times, _ = tz.get_transitions()
+    # the bound is generous so that slow CI does not fail
+    assert time.perf_counter() - start < 5
+    assert len(transition_times) == 20_001
+
+
+def test_generated_timezone_for_two_centuries():
+    """A timezone generated from 1900 to 2100 has the offsets of the original."""
+    berlin = zoneinfo.ZoneInfo("Europe/Berlin")
+    tz = Timezone.from_tzinfo(
+        berlin, first_date=date(1900, 1, 1), last_date=date(2100, 1, 1)
+    )
+    transition_times, transition_info = tz.get_transitions()
+    assert transition_times == sorted(transition_times)
+    for utc_time, (utcoffset, _, _) in zip(
+        transition_times, transition_info, strict=True
+    ):
+        local = utc_time.replace(tzinfo=timezone.utc).astimezone(berlin)
+        assert local.utcoffset() == utcoffset
@@ -8,6 +8,7 @@ We want to make sure we can roughly identify most of them.
 
 import sys
 from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 import pytest
 
@@ -88,3 +89,44 @@ def test_tzwin_non_utc_is_identified():
 
     tzinfo = gettz("Eastern Standard Time")
     assert tzid_from_tzinfo(tzinfo) == "America/New_York"
+
+
+def test_equivalent_ids_are_loaded_when_needed(monkeypatch):
+    """The equivalent timezone ids are loaded by the first lookup."""
+    from icalendar.timezone import tzid
+
+    name = "icalendar.timezone.equivalent_timezone_ids_result"
+    monkeypatch.delitem(sys.modules, name)
+    tzid._equivalent_ids.cache_clear()
+    tzid._get_equivalent_tzids.cache_clear()
+    assert name not in sys.modules
+    assert "Europe/Vienna" in tzids_from_tzinfo(ZoneInfo("Europe/Berlin"))
+    assert name in sys.modules
+
+
+def test_groups_of_the_lookup_tree():
+    """The leaves of the lookup tree are stored."""
+    pytest.importorskip("pytz")
+    from icalendar.timezone.equivalent_timezone_ids import get_groups
+
+    lookup = (
+        datetime(1970, 1, 1),
+        {
+            timedelta(hours=1): {"B", "A"},
+            timedelta(hours=2): (datetime(1980, 1, 1), {timedelta(0): {"C"}}),
+        },
+    )
+    assert get_groups(lookup) == [["A", "B"], ["C"]]
+
+
+def test_dateutil_constants():
+    """The constants are still available."""
+    from dateutil.tz import gettz
+
+    from icalendar.timezone import tzid
+
+    assert tzid.DATEUTIL_UTC == gettz("UTC")
+    if tzid.DATEUTIL_UTC_PATH is not None:
+        assert tzid.DATEUTIL_ZONEINFO_PATH is not None
+    with pytest.raises(AttributeError):
+        tzid.UNKNOWN_CONSTANT
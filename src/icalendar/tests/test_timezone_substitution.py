@@ -0,0 +1,120 @@
+"""VTIMEZONE components can be replaced by equivalent IANA timezones."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from icalendar import Calendar, config
+from icalendar.timezone import TZP
+from icalendar.timezone.substitution import find_equivalent_tzid, get_fingerprint
+
+
+@pytest.fixture
+def substitute(monkeypatch):
+    """Enable the substitution."""
+    monkeypatch.setattr(config, "SUBSTITUTE_TIMEZONES_SINCE", 2010)
+
+
+def component(name):
+    """The first VTIMEZONE component of a calendar."""
+    return Calendar.example(name).timezones[0]
+
+
+def test_substitution_is_disabled_by_default(tzp):
+    """The timezone is created from the component."""
+    assert config.SUBSTITUTE_TIMEZONES_SINCE is None
+    new_tzp = TZP(tzp.name)
+    new_tzp.cache_timezone_component(component("timezone_same_start"))
+    assert new_tzp.timezone("Pacific Standard Time") != tzp.timezone(
+        "America/Los_Angeles"
+    )
+
+
+def test_windows_timezone_is_substituted(tzp, substitute):
+    """Outlook uses Windows names for the TZID."""
+    new_tzp = TZP(tzp.name)
+    new_tzp.cache_timezone_component(component("timezone_same_start"))
+    assert new_tzp.timezone("Pacific Standard Time") == tzp.timezone(
+        "America/Los_Angeles"
+    )
+
+
+def test_timezone_without_equivalent(tzp, monkeypatch):
+    """The rules of the USA changed in 2007."""
+    monkeypatch.setattr(config, "SUBSTITUTE_TIMEZONES_SINCE", 2000)
+    new_tzp = TZP(tzp.name)
+    new_tzp.cache_timezone_component(component("issue_836_do_not_quote_tzid"))
+    tz = new_tzp.timezone("Eastern Standard Time")
+    assert tz is not None
+    assert tz != tzp.timezone("America/New_York")
+
+
+def test_scope_uses_the_substitution(tzp, substitute):
+    """The substitution works inside of a scope."""
+    new_tzp = TZP(tzp.name)
+    with new_tzp.scope():
+        new_tzp.cache_timezone_component(component("issue_836_do_not_quote_tzid"))
+        assert new_tzp.timezone("Eastern Standard Time") == tzp.timezone(
+            "America/New_York"
+        )
+
+
+def test_location_is_preferred(tzp, monkeypatch):
+    """libical adds the location of the timezone."""
+    monkeypatch.setattr(config, "SUBSTITUTE_TIMEZONES_SINCE", 2000)
+    timezone = component("issue_466_respect_unique_timezone")
+    timezone.add("X-LIC-LOCATION", "Europe/Berlin")
+    new_tzp = TZP(tzp.name)
+    new_tzp.cache_timezone_component(timezone)
+    assert new_tzp.timezone("/Europe/CUSTOM") == tzp.timezone("Europe/Berlin")
+
+
+def test_first_equivalent_timezone_is_used():
+    """Without hints, the first ID in sorted order is used."""
+    timezone = component("issue_466_respect_unique_timezone")
+    assert find_equivalent_tzid(timezone, 2000) == "Africa/Ceuta"
+
+
+@pytest.mark.parametrize(
+    "dt",
+    [
+        datetime(2010, 1, 1),
+        datetime(2025, 3, 9, 1, 59),
+        datetime(2025, 3, 9, 3),
+        datetime(2030, 7, 1),
+        datetime(2037, 11, 1, 1, 30),
+    ],
+)
+def test_offsets_are_the_same(dt, zoneinfo_only):
+    """The substituted timezone behaves like the component."""
+    timezone = component("issue_836_do_not_quote_tzid")
+    tzid = find_equivalent_tzid(timezone, 2010)
+    original = TZP("zoneinfo").create_timezone(timezone)
+    substitute = TZP("zoneinfo").timezone(tzid)
+    assert (
+        dt.replace(tzinfo=original).utcoffset()
+        == dt.replace(tzinfo=substitute).utcoffset()
+    )
+
+
+def test_fingerprint_ignores_names():
+    """Transitions that do not change the offset are left out."""
+    hour = timedelta(hours=1)
+    first = datetime(2000, 1, 1)
+    transitions = [
+        (datetime(1999, 1, 1), hour),
+        (datetime(2001, 1, 1), hour),
+        (datetime(2002, 1, 1), 2 * hour),
+        (datetime(2003, 1, 1), 2 * hour),
+        (datetime(2040, 1, 1), hour),
+    ]
+    assert get_fingerprint(transitions, first) == (
+        hour,
+        ((datetime(2002, 1, 1), 2 * hour),),
+    )
+
+
+def test_fingerprint_needs_the_first_offset():
+    """We cannot compare the timezone before the first transition."""
+    transitions = [(datetime(2001, 1, 1), timedelta(hours=1))]
+    assert get_fingerprint(transitions, datetime(2000, 1, 1)) is None
@@ -0,0 +1,148 @@
+"""zoneinfo creates timezones from the transitions of VTIMEZONE components."""
+
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from icalendar import Timezone
+from icalendar.timezone.transitions import TransitionTimezone
+from icalendar.timezone.zoneinfo import create_tzical_timezone
+
+UTC = timezone.utc
+
+
+@pytest.fixture(
+    params=[
+        "pacific_fiji",
+        "issue_53_tzid_parsed_properly",
+        "issue_55_parse_error_on_utc_offset_with_seconds",
+        "two_rrules",
+        "Europe/Berlin",
+        "America/New_York",
+        "Australia/Sydney",
+    ]
+)
+def vtimezone(request, timezones, zoneinfo_only) -> Timezone:
+    """A timezone component from a file or generated from a tzid."""
+    if "/" in request.param:
+        return Timezone.from_tzid(request.param)
+    return timezones[request.param]
+
+
+def local_times_to_check(tz: Timezone):
+    """Local times around the transitions and after the last one."""
+    transition_times, _ = tz.get_transitions()
+    for utc_time in transition_times[:: max(1, len(transition_times) // 20)]:
+        for minutes in range(-180, 181, 30):
+            yield utc_time + timedelta(minutes=minutes)
+    for year in (1900, 2037, 2039, 2040, 2100):
+        yield datetime(year, 7, 1, 12)
+        yield datetime(year, 12, 24, 23, 59)
+
+
+def test_offsets_are_the_same_as_with_dateutil(vtimezone):
+    """The offsets are the same as with the tzical of dateutil."""
+    new = vtimezone.to_tz(lookup_tzid=False)
+    old = create_tzical_timezone(vtimezone)
+    assert isinstance(new, TransitionTimezone)
+    for local_time in local_times_to_check(vtimezone):
+        for fold in (0, 1):
+            dt = local_time.replace(fold=fold)
+            assert dt.replace(tzinfo=new).utcoffset() == (
+                dt.replace(tzinfo=old).utcoffset()
+            ), dt
+            if dt.replace(tzinfo=old).tzname() is not None:
+                # without TZNAME, names are generated
+                assert dt.replace(tzinfo=new).tzname() == (
+                    dt.replace(tzinfo=old).tzname()
+                )
+            assert dt.replace(tzinfo=new).dst() == dt.replace(tzinfo=old).dst()
+
+
+def test_utc_round_trip(vtimezone):
+    """Converting from UTC and back gives the same time."""
+    tz = vtimezone.to_tz(lookup_tzid=False)
+    for utc_time in local_times_to_check(vtimezone):
+        utc = utc_time.replace(tzinfo=UTC)
+        local = utc.astimezone(tz)
+        assert local.astimezone(UTC) == utc
+
+
+def test_pickle(vtimezone):
+    """The timezones can be pickled."""
+    tz = vtimezone.to_tz(lookup_tzid=False)
+    copy = pickle.loads(pickle.dumps(tz))  # noqa: S301
+    for dt in local_times_to_check(vtimezone):
+        assert dt.replace(tzinfo=copy).utcoffset() == dt.replace(tzinfo=tz).utcoffset()
+
+
+def test_all_rrules_are_used(calendars):
+    """STANDARD and DAYLIGHT components can have several RRULE properties."""
+    calendar = calendars.vtimezone_with_two_rrules
+    assert [event.start.utcoffset() for event in calendar.events] == [
+        timedelta(hours=1),
+        timedelta(hours=2),
+    ]
+
+
+@pytest.fixture
+def berlin():
+    """A table with one summer time."""
+    return TransitionTimezone(
+        "Custom/Berlin",
+        [datetime(2025, 3, 30, 1), datetime(2025, 10, 26, 1)],
+        [
+            (timedelta(hours=2), timedelta(hours=1), "CEST"),
+            (timedelta(hours=1), timedelta(0), "CET"),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    ("dt", "tzname"),
+    [
+        (datetime(2024, 1, 1), "CET"),
+        (datetime(2025, 3, 30, 1, 59), "CET"),
+        (datetime(2025, 3, 30, 2), "CEST"),
+        (datetime(2025, 10, 26, 2, 30), "CEST"),
+        (datetime(2025, 10, 26, 2, 30, fold=1), "CET"),
+        (datetime(2025, 10, 26, 3), "CET"),
+        (datetime(2030, 1, 1), "CET"),
+    ],
+)
+def test_local_time(berlin, dt, tzname):
+    """The name of the timezone depends on the local time and fold."""
+    assert dt.replace(tzinfo=berlin).tzname() == tzname
+
+
+def test_fold_from_utc(berlin):
+    """The second of two equal local times has fold=1."""
+    first = datetime(2025, 10, 26, 0, 30, tzinfo=UTC).astimezone(berlin)
+    second = datetime(2025, 10, 26, 1, 30, tzinfo=UTC).astimezone(berlin)
+    assert first.replace(tzinfo=None) == second.replace(tzinfo=None)
+    assert (first.fold, first.tzname()) == (0, "CEST")
+    assert (second.fold, second.tzname()) == (1, "CET")
+
+
+def test_later_timezone_is_created_on_first_use(berlin):
+    """The timezone after the last transition is created once and when needed."""
+    calls = []
+
+    def later():
+        calls.append(1)
+        return timezone(timedelta(hours=5), "LATER")
+
+    tz = TransitionTimezone(berlin.key, berlin._utc_times, berlin._info, later)
+    assert datetime(2025, 7, 1, tzinfo=tz).tzname() == "CEST"
+    assert calls == []
+    assert datetime(2026, 7, 1, tzinfo=tz).tzname() == "LATER"
+    assert datetime(2026, 1, 1, tzinfo=UTC).astimezone(tz).hour == 5
+    assert calls == [1]
+
+
+def test_empty_table():
+    """A timezone without transitions has no offset."""
+    tz = TransitionTimezone("Empty", [], [])
+    assert datetime(2025, 1, 1, tzinfo=tz).utcoffset() == timedelta(0)
+    assert str(tz) == "Empty"
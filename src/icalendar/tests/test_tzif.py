@@ -0,0 +1,110 @@
+"""Read the transitions of timezones from the TZif files."""
+
+import zoneinfo
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from icalendar.timezone.tzif import (
+    parse_tzif,
+    posix_transitions,
+    read_tzif,
+    utc_transition_times,
+)
+
+EPOCH = datetime(1970, 1, 1)
+# Some TZif files contain a transition here without a change.
+END_OF_32_BIT = datetime(2038, 1, 19, 3, 14, 7)
+
+
+@pytest.mark.parametrize(
+    ("rule", "year", "expected"),
+    [
+        ("UTC0", 2025, []),
+        ("<+0530>-5:30", 2025, []),
+        (
+            "CET-1CEST,M3.5.0,M10.5.0/3",
+            2025,
+            [datetime(2025, 3, 30, 1), datetime(2025, 10, 26, 1)],
+        ),
+        (
+            "EST5EDT,M3.2.0,M11.1.0",
+            2025,
+            [datetime(2025, 3, 9, 7), datetime(2025, 11, 2, 6)],
+        ),
+        (
+            "AEST-10AEDT,M10.1.0,M4.1.0/3",
+            2025,
+            [datetime(2025, 4, 5, 16), datetime(2025, 10, 4, 16)],
+        ),
+        (
+            "<-02>2<-01>,M3.5.0/-1,M10.5.0/0",
+            2025,
+            [datetime(2025, 3, 30, 1), datetime(2025, 10, 26, 1)],
+        ),
+        (
+            "<+1030>-10:30<+11>-11,M10.1.0,M4.1.0",
+            2025,
+            [datetime(2025, 4, 5, 15), datetime(2025, 10, 4, 15, 30)],
+        ),
+        (
+            "XXX3EDT4,J60/2,59/2",
+            2024,
+            [datetime(2024, 2, 29, 6), datetime(2024, 3, 1, 5)],
+        ),
+    ],
+)
+def test_posix_transitions(rule, year, expected):
+    """The rules of the POSIX TZ strings are computed."""
+    assert [
+        EPOCH + timedelta(seconds=seconds)
+        for seconds in posix_transitions(rule, year, year)
+    ] == expected
+
+
+@pytest.mark.parametrize("rule", ["", "CET", "CET-1CEST,M3.5.0", "1CET"])
+def test_invalid_posix_rule(rule):
+    """Invalid rules cannot be computed."""
+    with pytest.raises(ValueError):
+        posix_transitions(rule, 2025, 2025)
+
+
+@pytest.mark.parametrize("data", [b"", b"TZ", b"NOTZ" + b"\0" * 40])
+def test_invalid_tzif(data):
+    """We only parse TZif files."""
+    with pytest.raises(ValueError):
+        parse_tzif(data)
+
+
+@pytest.mark.parametrize("key", ["", "Unknown/Zone", "../passwd", "/etc/passwd"])
+def test_unknown_timezone(key):
+    """Timezones that do not exist have no transitions."""
+    assert read_tzif(key) is None
+    assert utc_transition_times(key, datetime(2025, 1, 1)) is None
+
+
+@pytest.mark.parametrize(
+    "key", ["Europe/Berlin", "America/Sao_Paulo", "Pacific/Chatham", "Asia/Tehran"]
+)
+def test_offsets_change_at_the_transitions(key):
+    """zoneinfo changes the offset, the DST or the name at each transition."""
+    tz = zoneinfo.ZoneInfo(key)
+    times = utc_transition_times(key, datetime(2040, 1, 1))
+    assert times == sorted(times)
+    for time in times:
+        if time.year < 1900 or time == END_OF_32_BIT:
+            continue
+        after = time.replace(tzinfo=timezone.utc).astimezone(tz)
+        before = (time - timedelta(seconds=1)).replace(tzinfo=timezone.utc)
+        before = before.astimezone(tz)
+        assert (before.utcoffset(), before.dst(), before.tzname()) != (
+            after.utcoffset(),
+            after.dst(),
+            after.tzname(),
+        ), time
+
+
+def test_rule_of_the_footer_is_used():
+    """Transitions after the table are computed until the end."""
+    times = utc_transition_times("Europe/Berlin", datetime(2100, 1, 1))
+    assert times[-1] == datetime(2100, 10, 31, 1)
@@ -0,0 +1,73 @@
+"""VTIMEZONE components with the same content share one timezone."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from icalendar import Timezone
+from icalendar.timezone import tzinfo_cache
+
+
+@pytest.fixture(autouse=True)
+def cache():
+    """An empty cache."""
+    tzinfo_cache.clear()
+    yield tzinfo_cache
+    tzinfo_cache.clear()
+    tzinfo_cache.maxsize = 1024
+
+
+@pytest.fixture
+def fiji():
+    """A custom timezone that no provider knows."""
+    component = Timezone.example("pacific_fiji")
+    component["TZID"] = "Tenant/Fiji"
+    return component
+
+
+def test_same_content_shares_the_timezone(tzp, fiji):
+    """Other components with the same content use the same timezone."""
+    copy = Timezone.from_ical(fiji.to_ical())
+    assert tzp.create_timezone(fiji) is tzp.create_timezone(copy)
+
+
+def test_scopes_share_the_timezone(tzp, fiji):
+    """Each tenant may parse the same timezone."""
+    with tzp.scope():
+        tzp.cache_timezone_component(fiji)
+        tz1 = tzp.timezone("Tenant/Fiji")
+    with tzp.scope():
+        tzp.cache_timezone_component(Timezone.from_ical(fiji.to_ical()))
+        tz2 = tzp.timezone("Tenant/Fiji")
+    assert tz1 is tz2
+
+
+def test_other_content_creates_another_timezone(tzp, fiji):
+    """A changed component is not the same timezone."""
+    tz1 = tzp.create_timezone(fiji)
+    fiji.standard[0].TZOFFSETTO = timedelta(hours=11)
+    assert tzp.create_timezone(fiji) is not tz1
+
+
+def test_providers_do_not_share_timezones(tzp, other_tzp, fiji):
+    """The key contains the name of the provider."""
+    shared = tzp.create_timezone(fiji) is other_tzp.create_timezone(fiji)
+    assert shared == (tzp.name == other_tzp.name)
+
+
+def test_key_contains_the_provider_name(tzp, fiji, cache):
+    """The cache does not keep the provider alive after switching it."""
+    cache.clear()  # parsing the example can cache its timezone
+    tzp.create_timezone(fiji)
+    ((provider, _),) = cache._values
+    assert provider == tzp.name
+
+
+def test_cache_can_be_disabled(tzp, fiji, cache):
+    """Without the cache, timezones are created again."""
+    cache.maxsize = 0
+    tz1 = tzp.create_timezone(fiji)
+    tz2 = tzp.create_timezone(fiji)
+    assert tz1 is not tz2
+    dt = datetime(2025, 1, 1, 12)
+    assert tzp.localize(dt, tz1).utcoffset() == tzp.localize(dt, tz2).utcoffset()
@@ -0,0 +1,95 @@
+"""Localize many datetimes at once.
+
+Recurring events can have thousands of RDATE and EXDATE values.
+TZP.localize_many looks up the timezone only once.
+"""
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from icalendar import Event
+from icalendar.prop import vDDDLists, vDDDTypes
+from icalendar.tools import to_datetime
+
+DTS = [
+    datetime(2025, 1, 1, 12),
+    datetime(2025, 3, 30, 2, 30),  # does not exist in Berlin
+    datetime(2025, 10, 26, 2, 30),  # exists twice in Berlin
+    date(2025, 7, 1),
+]
+
+
+@pytest.mark.parametrize("tz", ["Europe/Berlin", "UTC", "Unknown/Timezone", None])
+def test_localize_many_is_the_same_as_localize(tzp, tz):
+    """The result is the same as calling localize for each datetime."""
+    assert tzp.localize_many(DTS, tz) == [
+        tzp.localize(to_datetime(dt), tz) for dt in DTS
+    ]
+
+
+def test_localize_many_with_tzinfo(tzp):
+    """The timezone can be a tzinfo object."""
+    berlin = tzp.timezone("Europe/Berlin")
+    localized = tzp.localize_many(DTS, berlin)
+    assert [dt.utcoffset() for dt in localized] == [
+        tzp.localize(dt, berlin).utcoffset() for dt in DTS
+    ]
+
+
+def test_localize_many_looks_up_the_timezone_once(tzp, monkeypatch):
+    """The timezone is looked up once and not for every datetime."""
+    calls = []
+    timezone = tzp.timezone
+    monkeypatch.setattr(
+        tzp, "timezone", lambda tzid: calls.append(tzid) or timezone(tzid)
+    )
+    tzp.localize_many(DTS, "Europe/Berlin")
+    assert calls == ["Europe/Berlin"]
+
+
+def test_localize_utc_many(tzp):
+    """Naive datetimes are in UTC and others are converted to UTC."""
+    dts = DTS + [tzp.localize(datetime(2025, 1, 1, 12), "Europe/Berlin")]
+    localized = tzp.localize_utc_many(dts)
+    assert localized == [tzp.localize_utc(dt) for dt in dts]
+    assert all(dt.utcoffset() == timezone.utc.utcoffset(None) for dt in localized)
+
+
+def test_empty(tzp):
+    """Nothing to localize."""
+    assert tzp.localize_many([], "Europe/Berlin") == []
+    assert tzp.localize_utc_many([]) == []
+
+
+@pytest.mark.parametrize(
+    "ical",
+    [
+        "20250101T120000,20250330T023000,20251026T023000",
+        "20250101T120000Z,20250330T023000",
+        "20250101,20250102",
+        "20250101T120000/PT1H,20250330T023000",
+    ],
+)
+@pytest.mark.parametrize("tz", ["Europe/Berlin", "Unknown/Timezone", None])
+def test_lists_are_localized_as_before(tzp, ical, tz):
+    """The values are the same as when we parse them one by one."""
+    assert vDDDLists.from_ical(ical, timezone=tz) == [
+        vDDDTypes.from_ical(value, timezone=tz) for value in ical.split(",")
+    ]
+
+
+def test_many_exdates(tzp):
+    """EXDATE values with a TZID are localized."""
+    exdates = ",".join(
+        f"2025{month:02}{day:02}T100000"
+        for month in range(1, 13)
+        for day in range(1, 29)
+    )
+    event = Event.from_ical(
+        f"BEGIN:VEVENT\r\nEXDATE;TZID=Europe/Berlin:{exdates}\r\nEND:VEVENT\r\n"
+    )
+    dts = [exdate.dt for exdate in event["EXDATE"].dts]
+    assert len(dts) == 12 * 28
+    assert dts[0] == tzp.localize(datetime(2025, 1, 1, 10), "Europe/Berlin")
+    assert dts[0].utcoffset() != dts[-100].utcoffset()
@@ -0,0 +1,127 @@
+"""Timezones of VTIMEZONE components can be cached for a context only."""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from icalendar import Calendar, Timezone
+from icalendar.error import GloballyUniqueTZIDGuessed
+
+
+@pytest.fixture
+def fiji():
+    """A custom timezone that no provider knows."""
+    component = Timezone.example("pacific_fiji")
+    component["TZID"] = "Tenant/Fiji"
+    return component
+
+
+def test_custom_timezone_is_only_known_in_the_scope(tzp, fiji):
+    """The shared cache does not change."""
+    with tzp.scope():
+        tzp.cache_timezone_component(fiji)
+        assert tzp.timezone("Tenant/Fiji") is not None
+    assert tzp.timezone("Tenant/Fiji") is None
+
+
+def test_iana_timezones_are_known_in_the_scope(tzp):
+    """The scope falls back to the shared cache and the provider."""
+    berlin = tzp.timezone("Europe/Berlin")
+    with tzp.scope() as cache:
+        assert tzp.timezone("Europe/Berlin") is berlin
+        assert tzp.timezone("Unknown/Zone") is None
+    assert len(cache) == 0
+
+
+def test_iana_timezones_are_not_cached_in_the_scope(tzp, fiji):
+    """Only custom timezones use the space of the scope."""
+    fiji["TZID"] = "Europe/Berlin"
+    with tzp.scope() as cache:
+        tzp.cache_timezone_component(fiji)
+        assert len(cache) == 0
+
+
+def test_parsed_timezones_are_only_known_in_the_scope(tzp, fiji):
+    """Calendars of one scope do not influence others."""
+    calendar = Calendar()
+    calendar.add_component(fiji)
+    data = calendar.to_ical()
+    with tzp.scope():
+        Calendar.from_ical(data)
+        assert tzp.timezone("Tenant/Fiji") is not None
+    with tzp.scope():
+        assert tzp.timezone("Tenant/Fiji") is None
+
+
+def test_scope_hides_the_shared_custom_timezone(tzp, fiji):
+    """Each scope has its own version of a custom timezone."""
+    fiji["TZID"] = "Shared/Fiji"
+    tzp.cache_timezone_component(fiji)
+    shared = tzp.timezone("Shared/Fiji")
+    with tzp.scope():
+        assert tzp.timezone("Shared/Fiji") is shared
+        fiji.add("TZURL", "https://example.com/tenant/fiji")
+        tzp.cache_timezone_component(fiji)
+        assert tzp.timezone("Shared/Fiji") is not shared
+    assert tzp.timezone("Shared/Fiji") is shared
+
+
+def test_scope_shares_timezones_with_the_same_content(tzp, fiji):
+    """The same VTIMEZONE component creates the same timezone."""
+    fiji["TZID"] = "Shared/Fiji"
+    tzp.cache_timezone_component(fiji)
+    shared = tzp.timezone("Shared/Fiji")
+    with tzp.scope():
+        tzp.cache_timezone_component(fiji)
+        assert tzp.timezone("Shared/Fiji") is shared
+
+
+def test_size_is_limited(tzp, fiji):
+    """The least recently used timezones are removed."""
+    with tzp.scope(maxsize=2) as cache:
+        for tzid in ("A", "B", "C"):
+            fiji["TZID"] = tzid
+            tzp.cache_timezone_component(fiji)
+        assert len(cache) == 2
+        assert tzp.timezone("A") is None
+        assert tzp.timezone("C") is not None
+
+
+def test_unknown_tzid_can_be_found_in_the_scope(tzp, fiji):
+    """The shared unknown IDs do not hide the scope."""
+    assert tzp.timezone("Tenant/Fiji") is None
+    with tzp.scope():
+        tzp.cache_timezone_component(fiji)
+        assert tzp.timezone("Tenant/Fiji") is not None
+    assert tzp.timezone("Tenant/Fiji") is None
+
+
+def test_globally_unique_tzid_in_the_scope(tzp, fiji):
+    """The vendor prefix is removed for the scope, too."""
+    with tzp.scope():
+        tzp.cache_timezone_component(fiji)
+        with pytest.warns(GloballyUniqueTZIDGuessed):
+            tz = tzp.timezone("/vendor.example/Tenant/Fiji")
+        assert tz is tzp.timezone("Tenant/Fiji")
+
+
+def test_nested_scopes(tzp, fiji):
+    """The inner scope starts empty."""
+    with tzp.scope():
+        tzp.cache_timezone_component(fiji)
+        with tzp.scope():
+            assert tzp.timezone("Tenant/Fiji") is None
+        assert tzp.timezone("Tenant/Fiji") is not None
+
+
+def test_threads_do_not_share_the_scope(tzp, fiji):
+    """Other threads start without the scope."""
+    with tzp.scope(), ThreadPoolExecutor(1) as executor:
+        tzp.cache_timezone_component(fiji)
+        assert executor.submit(tzp.timezone, "Tenant/Fiji").result() is None
+        context = contextvars.copy_context()
+        assert (
+            executor.submit(context.run, tzp.timezone, "Tenant/Fiji").result()
+            is not None
+        )
@@ -0,0 +1,78 @@
+"""TZP remembers the timezone IDs that it cannot find."""
+
+import pytest
+
+from icalendar.timezone import TZP
+from icalendar.timezone.zoneinfo import ZONEINFO
+
+
+class CountingProvider(ZONEINFO):
+    """Count the lookups of the provider."""
+
+    def __init__(self):
+        self.lookups = []
+
+    def timezone(self, name):
+        self.lookups.append(name)
+        return super().timezone(name)
+
+
+@pytest.fixture
+def provider():
+    """A provider that counts its lookups."""
+    return CountingProvider()
+
+
+@pytest.fixture
+def counting_tzp(provider):
+    """A timezone provider proxy that uses the counting provider."""
+    return TZP(provider)
+
+
+UNKNOWN = "/vendor.example/20250101_1/Custom/Zone"
+
+
+def test_unknown_tzid_is_looked_up_once(counting_tzp, provider):
+    """The second lookup does not ask the provider."""
+    assert counting_tzp.timezone(UNKNOWN) is None
+    lookups = len(provider.lookups)
+    assert lookups > 1, "all the ids are tried"
+    assert counting_tzp.timezone(UNKNOWN) is None
+    assert len(provider.lookups) == lookups
+
+
+def test_known_tzid_is_not_affected(counting_tzp, provider):
+    """Known timezones are still found."""
+    counting_tzp.timezone(UNKNOWN)
+    assert counting_tzp.timezone("Europe/Berlin").key == "Europe/Berlin"
+
+
+def test_new_timezone_component_makes_tzid_known(counting_tzp, timezones):
+    """Caching a timezone component clears the unknown IDs."""
+    component = timezones.pacific_fiji.copy(recursive=True)
+    component["TZID"] = "Custom/Zone"
+    assert counting_tzp.timezone(UNKNOWN) is None
+    counting_tzp.cache_timezone_component(component)
+    assert counting_tzp.timezone(UNKNOWN) is not None
+
+
+def test_changing_the_provider_clears_the_unknown_tzids(counting_tzp, provider):
+    """Another provider may know the timezone."""
+    counting_tzp.timezone(UNKNOWN)
+    counting_tzp.use(provider)
+    provider.lookups.clear()
+    counting_tzp.timezone(UNKNOWN)
+    assert provider.lookups != []
+
+
+def test_size_is_limited(counting_tzp, provider, monkeypatch):
+    """Only the last unknown IDs are remembered."""
+    monkeypatch.setattr(TZP, "unknown_tzid_cache_size", 2)
+    counting_tzp.use(provider)
+    for tzid in ["A", "B", "C"]:
+        counting_tzp.timezone(tzid)
+    provider.lookups.clear()
+    counting_tzp.timezone("C")
+    assert provider.lookups == []
+    counting_tzp.timezone("A")
+    assert provider.lookups != []
@@ -184,6 +184,29 @@ def test_flat_property_items_2(filled_event_component):
     ]
 
 
+@pytest.mark.parametrize("recursive", [True, False])
+@pytest.mark.parametrize("sort", [True, False])
+def test_iter_property_items(
+    calendar_component, filled_event_component, recursive, sort
+):
+    """iter_property_items yields the same items as property_items."""
+    calendar_component.add("attendee", "Max M")
+    items = calendar_component.iter_property_items(recursive=recursive, sorted=sort)
+    assert not isinstance(items, list)
+    assert list(items) == calendar_component.property_items(
+        recursive=recursive, sorted=sort
+    )
+
+
+def test_iter_property_items_is_lazy(calendar_component, filled_event_component):
+    """The properties of subcomponents are only visited when needed."""
+    items = calendar_component.iter_property_items()
+    assert next(items) == ("BEGIN", b"VCALENDAR")
+    assert next(items) == ("BEGIN", b"VEVENT")
+    filled_event_component["SUMMARY"] = "changed"
+    assert ("SUMMARY", "changed") in list(items)
+
+
 def test_indent():
     """Text fields which span multiple mulitple lines require proper indenting"""
     c = Calendar()
@@ -0,0 +1,164 @@
+"""Generated VTIMEZONE components are cached."""
+
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from icalendar import Calendar, Event, Timezone
+from icalendar.timezone import vtimezone_cache
+from icalendar.timezone.cache import LRUCache
+
+
+@pytest.fixture(autouse=True)
+def cache():
+    """An empty cache."""
+    vtimezone_cache.clear()
+    yield vtimezone_cache
+    vtimezone_cache.clear()
+    vtimezone_cache.maxsize = 128
+
+
+def test_same_timezone_is_cached(cache, tzp):
+    """The second call uses the cache."""
+    tz1 = Timezone.from_tzid("Europe/Berlin")
+    tz2 = Timezone.from_tzid("Europe/Berlin")
+    assert tz1 == tz2
+    assert tz1 is not tz2
+    assert cache.cache_info() == (1, 1, 128, 1)
+
+
+def test_changing_the_copy_does_not_change_the_cache(cache, tzp):
+    """We can change what we get, also the property values in place."""
+    expected = Timezone.from_tzinfo(tzp.timezone("Europe/Berlin"))
+    tz1 = Timezone.from_tzid("Europe/Berlin")
+    tz1.standard[0]["DTSTART"].params["X-Z"] = "2"
+    tz1.standard[0]["TZNAME"].params["LANGUAGE"] = "de"
+    tz1.daylight[0]["RDATE"].dts.pop()
+    tz1.daylight[0]["RDATE"].dts[0].params["X-Y"] = "1"
+    tz1["TZID"] = "changed"
+    tz1.subcomponents[-1].add("RDATE", datetime(2040, 1, 1))
+    tz1.subcomponents.pop(0)
+    tz2 = Timezone.from_tzid("Europe/Berlin")
+    assert tz2 != tz1
+    assert tz2 == expected
+    assert tz2.to_ical() == expected.to_ical()
+
+
+@pytest.mark.parametrize(
+    "kw",
+    [
+        {"tzid": "America/New_York"},
+        {"first_date": date(2000, 1, 1)},
+        {"last_date": date(2030, 1, 1)},
+    ],
+)
+def test_key(cache, kw):
+    """Other arguments create other components."""
+    arguments = {"tzid": "Europe/Berlin"}
+    Timezone.from_tzid(**arguments)
+    arguments.update(kw)
+    tz = Timezone.from_tzid(**arguments)
+    assert cache.cache_info() == (0, 2, 128, 2)
+    assert tz == Timezone.from_tzinfo(
+        Timezone.from_tzid(arguments.pop("tzid")).to_tz(), tz.tz_name, **arguments
+    )
+
+
+def test_provider_is_part_of_the_key(cache, tzp, other_tzp):
+    """pytz and zoneinfo timezones are cached separately."""
+    Timezone.from_tzid("Europe/Berlin", tzp)
+    Timezone.from_tzid("Europe/Berlin", other_tzp)
+    assert cache.cache_info().hits == (tzp.name == other_tzp.name)
+
+
+def test_add_missing_timezones_uses_the_cache(cache, tzp):
+    """Calendars share the timezone components."""
+    for _ in range(3):
+        calendar = Calendar()
+        event = Event()
+        event.start = tzp.localize(datetime(2025, 1, 1), "Europe/Berlin")
+        calendar.add_component(event)
+        calendar.add_missing_timezones()
+        assert [tz.tz_name for tz in calendar.timezones] == ["Europe/Berlin"]
+    assert cache.cache_info().misses == 1
+    assert calendar.timezones[0] is not Timezone.from_tzid("Europe/Berlin")
+
+
+def test_unknown_timezone_is_not_cached(cache):
+    """Unknown timezones raise an error."""
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            Timezone.from_tzid("Unknown/Zone")
+    assert cache.cache_info() == (0, 0, 128, 0)
+
+
+def test_other_timezone_replaces_the_cached_component(cache):
+    """A different timezone for the same key is not taken from the cache."""
+
+    def get(tz, tzid):
+        return cache.get_timezone(
+            "X",
+            tz,
+            date(2025, 1, 1),
+            date(2026, 1, 1),
+            "test",
+            lambda: Timezone(TZID=tzid),
+        )["TZID"]
+
+    tz1 = timezone(timedelta(hours=1))
+    tz2 = timezone(timedelta(hours=2))
+    assert get(tz1, "1") == "1"
+    assert get(tz2, "2") == "2"
+    assert get(tz2, "3") == "2"
+    assert cache.cache_info() == (1, 2, 128, 1)
+
+
+def test_disable_the_cache(cache):
+    """With a size of 0, nothing is cached."""
+    cache.maxsize = 0
+    Timezone.from_tzid("Europe/Berlin")
+    Timezone.from_tzid("Europe/Berlin")
+    assert cache.cache_info() == (0, 2, 0, 0)
+
+
+def test_least_recently_used_values_are_removed():
+    """The size of the cache is limited."""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    cache.maxsize = 1
+    assert len(cache) == 1
+    assert cache.get("c") == 3
+    cache.discard("c")
+    assert cache.get("c", 0) == 0
+
+
+def test_threads(cache):
+    """The cache can be used by several threads."""
+    tzids = ["Europe/Berlin", "America/New_York", "Asia/Tokyo", "UTC"] * 50
+    cache.maxsize = 3
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(Timezone.from_tzid, tzids))
+    assert [tz.tz_name for tz in results] == tzids
+    info = cache.cache_info()
+    assert info.hits + info.misses == len(tzids)
+    assert info.currsize == 3
+
+
+def test_copy_the_cache():
+    """Copies have their own values and lock."""
+    cache = LRUCache()
+    cache.set("a", [1])
+    copied = copy.deepcopy(cache)
+    copied.set("b", 2)
+    assert copied.get("a") == [1]
+    assert cache.get("b") is None
+    assert pickle.loads(pickle.dumps(cache)).get("a") == [1]  # noqa: S301
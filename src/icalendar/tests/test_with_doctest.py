@@ -46,8 +46,8 @@ def test_docstring_of_python_file(module_name: str, env_for_doctest) -> None:
     try:
         module = importlib.import_module(module_name)
     except ModuleNotFoundError as e:
-        if e.name == "pytz":
-            pytest.skip("pytz is not installed, skipping this module.")
+        if e.name in ("pytz", "numpy"):
+            pytest.skip(f"{e.name} is not installed, skipping this module.")
         raise
     test_result = doctest.testmod(module, name=module_name, globs=env_for_doctest)
     assert test_result.failed == 0, f"{test_result.failed} errors in {module_name}"
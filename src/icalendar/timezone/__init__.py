@@ -1,5 +1,6 @@
 """This package contains all functionality for timezones."""
 
+from .cache import tzinfo_cache, vtimezone_cache
 from .tzid import is_utc, tzid_from_dt, tzid_from_tzinfo, tzids_from_tzinfo
 from .tzp import TZP
 
@@ -22,7 +23,9 @@ __all__ = [
     "tzid_from_dt",
     "tzid_from_tzinfo",
     "tzids_from_tzinfo",
+    "tzinfo_cache",
     "tzp",
     "use_pytz",
     "use_zoneinfo",
+    "vtimezone_cache",
 ]
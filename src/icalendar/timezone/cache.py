@@ -0,0 +1,323 @@
+"""Caches for timezone information.
+
+Creating VTIMEZONE components takes time.
+Calendars usually use only few timezones,
+so that the components can be created once and then reused.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Generic, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+    from datetime import date, tzinfo
+
+    from icalendar.cal.component import Component
+    from icalendar.cal.timezone import Timezone
+    from icalendar.parser import Parameters
+
+K = TypeVar("K", bound="Hashable")
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache like :func:`functools.lru_cache` has them."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """A bounded cache that forgets the least recently used values first.
+
+    All methods can be used from several threads at the same time.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from icalendar.timezone.cache import LRUCache
+            >>> cache = LRUCache(maxsize=2)
+            >>> cache.get_or_create("a", lambda: 1)
+            1
+            >>> cache.get_or_create("a", lambda: 2)
+            1
+            >>> cache.cache_info()
+            CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """Create an empty cache.
+
+        Parameters:
+            maxsize: The number of values to keep.
+                ``0`` disables the cache.
+        """
+        self._maxsize = maxsize
+        self._values: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """The number of values to keep at most.
+
+        Setting it removes the least recently used values that do not fit.
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._shrink()
+
+    def _shrink(self) -> None:
+        """Remove values until the size fits. Call this with the lock."""
+        while len(self._values) > max(self._maxsize, 0):
+            self._values.popitem(last=False)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the value for the key or the default.
+
+        This counts as a hit or a miss.
+        """
+        with self._lock:
+            try:
+                value = self._values[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._values.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store the value for the key."""
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            self._shrink()
+
+    def get_or_create(self, key: K, create: Callable[[], V]) -> V:
+        """Return the value for the key and create it if it is missing.
+
+        ``create`` is called without holding the lock.
+        If several threads miss at the same time, each creates the value.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = create()
+            self.set(key, value)
+        return value
+
+    def discard(self, key: K) -> None:
+        """Remove the value for the key if it is cached."""
+        with self._lock:
+            self._values.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values and reset the statistics."""
+        with self._lock:
+            self._values.clear()
+            self._hits = self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._values))
+
+    def __len__(self) -> int:
+        """The number of cached values."""
+        return len(self._values)
+
+    def __getstate__(self) -> dict:
+        """Copy and pickle the cache without the lock."""
+        with self._lock:
+            state = self.__dict__.copy()
+            state["_values"] = self._values.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the cache with a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.cache_info()}>"
+
+
+def _copy_parameters(params: Parameters) -> Parameters:
+    """Copy the parameters of a property value."""
+    result = params.copy()
+    for key, value in result.items():
+        if isinstance(value, list):
+            result[key] = list(value)
+    return result
+
+
+def _copy_value(value):
+    """Copy a property value so that it can be changed in place.
+
+    Dates, times and strings cannot be changed and are shared.
+    Other types of values are copied with :func:`copy.deepcopy`.
+    """
+    from icalendar.prop import vDDDLists, vDDDTypes, vText, vUTCOffset
+
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    if not isinstance(value, (vDDDLists, vDDDTypes, vText, vUTCOffset)):
+        return copy.deepcopy(value)
+    result = copy.copy(value)
+    result.params = _copy_parameters(value.params)
+    if isinstance(value, vDDDLists):
+        result.dts = [_copy_value(dt) for dt in value.dts]
+    return result
+
+
+def copy_component(component: Component) -> Component:
+    """Copy a component, its subcomponents and their property values.
+
+    Changing the copy does not change the original.
+    The property values of VTIMEZONE components are copied
+    faster than with :func:`copy.deepcopy`.
+    """
+    result = component.copy()
+    for name, value in result.items():
+        result[name] = _copy_value(value)
+    result.subcomponents = [copy_component(sub) for sub in component.subcomponents]
+    return result
+
+
+class VTimezoneCache(LRUCache[tuple, tuple]):
+    """The cache of :meth:`Timezone.from_tzid`.
+
+    The key is ``(tzid, first_date, last_date, provider)``
+    where ``provider`` is the name of the timezone provider.
+    The components are copied so that they can be changed.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from icalendar import Timezone
+            >>> from icalendar.timezone import vtimezone_cache
+            >>> vtimezone_cache.clear()
+            >>> berlin = Timezone.from_tzid("Europe/Berlin")
+            >>> berlin == Timezone.from_tzid("Europe/Berlin")
+            True
+            >>> vtimezone_cache.cache_info()
+            CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+
+        Disable the cache:
+
+        .. code-block:: pycon
+
+            >>> vtimezone_cache.maxsize = 0
+            >>> vtimezone_cache.maxsize = 128
+    """
+
+    def get_timezone(
+        self,
+        tzid: str,
+        tz: tzinfo,
+        first_date: date,
+        last_date: date,
+        provider: str,
+        create: Callable[[], Timezone],
+    ) -> Timezone:
+        """Return a copy of the cached component or create it.
+
+        Parameters:
+            tzid: The TZID of the component.
+            tz: The timezone that the component is created from.
+                If the provider returns another timezone for the ``tzid``,
+                the cached component is replaced.
+            first_date: The first date of the component.
+            last_date: The last date of the component.
+            provider: The name of the timezone provider.
+            create: Create the component if it is not cached.
+        """
+        key = (tzid, first_date, last_date, provider)
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is not None and cached[0] is tz:
+                self._values.move_to_end(key)
+                self._hits += 1
+                component = cached[1]
+            else:
+                self._misses += 1
+                component = None
+        if component is None:
+            component = create()
+            self.set(key, (tz, component))
+        return copy_component(component)
+
+
+vtimezone_cache = VTimezoneCache()
+
+
+class TzinfoCache(LRUCache[tuple, "tzinfo"]):
+    """The timezones created from VTIMEZONE components.
+
+    Many calendars contain the same VTIMEZONE components.
+    :meth:`TZP.create_timezone() <icalendar.timezone.tzp.TZP.create_timezone>`
+    creates one timezone for each content and provider
+    and all calendars share it.
+    The key is ``(provider, digest)`` where ``provider`` is the name of the
+    :class:`~icalendar.timezone.provider.TZProvider` that creates the timezone
+    and ``digest`` is the SHA-256 hash of the component.
+    :meth:`TZP.use() <icalendar.timezone.tzp.TZP.use>` clears the cache,
+    so that the timezones are created again with the new provider.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from icalendar import Timezone
+            >>> from icalendar.timezone import tzinfo_cache, tzp
+            >>> fiji_1 = Timezone.example("pacific_fiji")
+            >>> fiji_2 = Timezone.example("pacific_fiji")
+            >>> tzinfo_cache.clear()
+            >>> tzp.create_timezone(fiji_1) is tzp.create_timezone(fiji_2)
+            True
+            >>> tzinfo_cache.cache_info()
+            CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+    """
+
+    def get_tzinfo(
+        self, component: Timezone, provider: str, create: Callable[[], tzinfo]
+    ) -> tzinfo:
+        """Return the timezone of the component and create it if it is missing.
+
+        Parameters:
+            component: The VTIMEZONE component.
+            provider: The name of the timezone provider.
+            create: Create the timezone if it is not cached.
+        """
+        digest = hashlib.sha256(component.to_ical()).digest()
+        return self.get_or_create((provider, digest), create)
+
+
+tzinfo_cache = TzinfoCache(maxsize=1024)
+
+
+__all__ = [
+    "CacheInfo",
+    "LRUCache",
+    "TzinfoCache",
+    "VTimezoneCache",
+    "copy_component",
+    "tzinfo_cache",
+    "vtimezone_cache",
+]
@@ -0,0 +1,163 @@
+"""Keep compiled timezones on disk for other processes.
+
+This cache is disabled by default.
+It is used if :data:`icalendar.config.TIMEZONE_CACHE_DIRECTORY` is set.
+Each entry is a file named by the hash of everything that it depends on:
+the version of icalendar, the timezone provider
+and the VTIMEZONE component or the timezone data.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import zoneinfo
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from icalendar import config
+from icalendar.version import __version__
+
+from .tzif import read_tzif
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import date, tzinfo
+
+    from icalendar.cal.timezone import Timezone
+
+
+def get_path(key: tuple[str | bytes, ...], suffix: str) -> Path | None:
+    """Return the path of the file for the key.
+
+    Returns:
+        ``None`` if the cache is disabled.
+    """
+    directory = config.TIMEZONE_CACHE_DIRECTORY
+    if directory is None:
+        return None
+    digest = hashlib.sha256()
+    for part in (__version__, *key):
+        digest.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+        digest.update(b"\0")
+    return Path(directory) / f"{digest.hexdigest()}{suffix}"
+
+
+def read(path: Path) -> bytes | None:
+    """Return the content of a cache file or ``None`` if it does not exist."""
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def write(path: Path, data: bytes) -> None:
+    """Write a cache file so that other processes never read half of it.
+
+    Errors are ignored because the cache is only an optimization.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file, name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(file, "wb") as f:
+            f.write(data)
+        Path(name).replace(path)
+    except OSError:
+        return
+
+
+def timezone_data_fingerprint(tz: tzinfo) -> bytes | None:
+    """Return what identifies the data of an IANA timezone.
+
+    Returns:
+        ``None`` if the timezone is not from :mod:`zoneinfo` or :mod:`pytz`.
+    """
+    if isinstance(tz, zoneinfo.ZoneInfo) and tz.key is not None:
+        return read_tzif(tz.key)
+    pytz = sys.modules.get("pytz")
+    if pytz is not None and type(tz).__module__.startswith("pytz"):
+        return f"pytz {pytz.OLSON_VERSION} {tz.zone}".encode()
+    return None
+
+
+def get_tzinfo(
+    component: Timezone, provider: str, create: Callable[[], tzinfo]
+) -> tzinfo:
+    """Load the timezone of a component or create and store it.
+
+    Parameters:
+        component: The VTIMEZONE component.
+        provider: The name of the timezone provider.
+        create: Create the timezone if it is not stored.
+    """
+    path = get_path(("tzinfo", provider, component.to_ical()), ".pickle")
+    if path is None:
+        return create()
+    data = read(path)
+    if data is not None:
+        # The file may be written by another version of a library.
+        with contextlib.suppress(Exception):
+            return pickle.loads(data)  # noqa: S301
+    tz = create()
+    try:
+        data = pickle.dumps(tz)
+        # Some timezones can be pickled but not loaded.
+        pickle.loads(data)  # noqa: S301
+    except Exception:  # noqa: BLE001
+        return tz
+    write(path, data)
+    return tz
+
+
+def get_vtimezone(
+    timezone_class: type[Timezone],
+    tz: tzinfo,
+    tzid: str,
+    first_date: date,
+    last_date: date,
+    provider: str,
+    create: Callable[[], Timezone],
+) -> Timezone:
+    """Load a generated VTIMEZONE component or create and store it.
+
+    The component is stored as iCalendar.
+    Only components of IANA timezones are stored
+    because their data can be identified.
+    """
+    if config.TIMEZONE_CACHE_DIRECTORY is None:
+        return create()
+    fingerprint = timezone_data_fingerprint(tz)
+    if fingerprint is None:
+        return create()
+    key = (
+        "vtimezone",
+        provider,
+        tzid,
+        first_date.isoformat(),
+        last_date.isoformat(),
+        fingerprint,
+    )
+    path = get_path(key, ".ics")
+    if path is None:
+        return create()
+    data = read(path)
+    if data is not None:
+        with contextlib.suppress(ValueError):
+            return timezone_class.from_ical(data)
+    component = create()
+    write(path, component.to_ical())
+    return component
+
+
+__all__ = [
+    "get_path",
+    "get_tzinfo",
+    "get_vtimezone",
+    "read",
+    "timezone_data_fingerprint",
+    "write",
+]
@@ -21,7 +21,6 @@ from __future__ import annotations
 from collections import defaultdict
 from datetime import datetime, timedelta, tzinfo
 from pathlib import Path
-from pprint import pprint
 from typing import TYPE_CHECKING, NamedTuple
 from zoneinfo import ZoneInfo, available_timezones
 
@@ -116,21 +115,57 @@ def main(
         return result
 
     lookup = generate_tree(tzs, step=timedelta(hours=33))
+    write_groups(lookup, Path(__file__).parent / f"equivalent_timezone_ids_{name}.py")
+    return lookup
 
-    file = Path(__file__).parent / f"equivalent_timezone_ids_{name}.py"
-    with file.open("w") as f:
-        f.write(
-            f"'''This file is automatically generated by {Path(__file__).name}'''\n"
-        )
-        f.write("import datetime\n\n")
-        f.write("\nlookup = ")
-        pprint(lookup, stream=f)
-        f.write("\n\n__all__ = ['lookup']\n")
 
-    return lookup
+def get_groups(lookup: tuple | dict | set) -> list[list[str]]:
+    """Return the sorted groups of equivalent ids in the leaves of a lookup tree.
+
+    As soon as one timezone implementation used claims their equivalence,
+    they are considered equivalent.
+    Only these groups are needed to identify timezones.
+    """
+    groups = set()
+
+    def add(value: tuple | dict | set) -> None:
+        if isinstance(value, set):
+            groups.add(tuple(sorted(value)))
+        elif isinstance(value, tuple):
+            add(value[1])
+        elif isinstance(value, dict):
+            for value2 in value.values():
+                add(value2)
+        else:
+            raise TypeError(
+                f"Expected tuple, dict or set, not {value.__class__.__name__}: "
+                f"{value!r}"
+            )
+
+    add(lookup)
+    return [list(group) for group in sorted(groups)]
+
+
+def write_groups(lookup: tuple | dict | set, file: Path) -> None:
+    """Write the groups of equivalent ids to a Python module.
+
+    The groups are stored in one string with one group per line
+    because this loads a lot faster than the lookup tree.
+    """
+    lines = "".join(" ".join(group) + "\n" for group in get_groups(lookup))
+    file.write_text(
+        f'"""This file is automatically generated by {Path(__file__).name}\n'
+        "\n"
+        "Each line contains timezone ids that are equivalent.\n"
+        '"""\n'
+        "\n"
+        f'groups = """\\\n{lines}"""\n'
+        "\n"
+        '__all__ = ["groups"]\n'
+    )
 
 
-__all__ = ["main"]
+__all__ = ["get_groups", "main", "write_groups"]
 
 if __name__ == "__main__":
     from zoneinfo import ZoneInfo
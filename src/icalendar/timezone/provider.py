@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from datetime import datetime, tzinfo
 
     from dateutil.rrule import rrule
@@ -29,6 +30,22 @@ class TZProvider(ABC):
     def localize(self, dt: datetime, tz: tzinfo) -> datetime:
         """Localize a datetime to a timezone."""
 
+    def localize_utc_many(self, dts: Iterable[datetime]) -> list[datetime]:
+        """Return the datetimes in UTC.
+
+        Override this if your implementation can do this faster
+        than calling :meth:`localize_utc` for each datetime.
+        """
+        return [self.localize_utc(dt) for dt in dts]
+
+    def localize_many(self, dts: Iterable[datetime], tz: tzinfo) -> list[datetime]:
+        """Localize datetimes to a timezone.
+
+        Override this if your implementation can do this faster
+        than calling :meth:`localize` for each datetime.
+        """
+        return [self.localize(dt, tz) for dt in dts]
+
     @abstractmethod
     def knows_timezone_id(self, tzid: str) -> bool:
         """Whether the timezone is already cached by the implementation."""
@@ -11,6 +11,8 @@ from pytz.tzinfo import DstTzInfo
 from .provider import TZProvider
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from dateutil.rrule import rrule
 
     from icalendar import prop
@@ -33,6 +35,17 @@ class PYTZ(TZProvider):
         """Localize a datetime to a timezone."""
         return tz.localize(dt)
 
+    def localize_many(self, dts: Iterable[datetime], tz: tzinfo) -> list[datetime]:
+        """Localize datetimes to a timezone."""
+        localize = tz.localize
+        return [localize(dt) for dt in dts]
+
+    def localize_utc_many(self, dts: Iterable[datetime]) -> list[datetime]:
+        """Return the datetimes in UTC."""
+        utc = pytz.utc
+        localize = utc.localize
+        return [localize(dt) if dt.tzinfo is None else dt.astimezone(utc) for dt in dts]
+
     def knows_timezone_id(self, tzid: str) -> bool:
         """Whether the timezone is already cached by the implementation."""
         return tzid in pytz.all_timezones
@@ -0,0 +1,170 @@
+"""Find IANA timezones that are equivalent to VTIMEZONE components.
+
+Many calendars, for example those of Outlook and Exchange,
+define their timezones in VTIMEZONE components with custom TZIDs.
+If such a component has the same transitions as an IANA timezone,
+the IANA timezone can be used instead.
+This is enabled by :data:`icalendar.config.SUBSTITUTE_TIMEZONES_SINCE`.
+
+Two timezones are equivalent if they have the same UTC offset
+at the start of the year and the same changes of the UTC offset after that
+until :attr:`Timezone.DEFAULT_LAST_DATE
+<icalendar.cal.timezone.Timezone.DEFAULT_LAST_DATE>`.
+The names of the offsets are not compared.
+
+The comparison does not use the date range of the calendar.
+Components are substituted while they are parsed,
+before the events of the calendar are known,
+and the IANA timezone is then used for all times in the calendar,
+including recurrences that are computed later.
+Thus, the offsets are compared for all years
+from :data:`~icalendar.config.SUBSTITUTE_TIMEZONES_SINCE` until 2038.
+"""
+
+from __future__ import annotations
+
+import functools
+import zoneinfo
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from .tzif import utc_transition_times
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from icalendar.cal.timezone import Timezone
+
+    Fingerprint = tuple[timedelta, tuple[tuple[datetime, timedelta], ...]]
+
+LAST = datetime(2038, 1, 1)  # noqa: DTZ001
+"""Compare the offsets until this time."""
+
+# these files are not timezones of their own
+IGNORED_TZIDS = {"Factory", "localtime", "posixrules"}
+
+
+def get_fingerprint(
+    transitions: Iterable[tuple[datetime, timedelta]], first: datetime
+) -> Fingerprint | None:
+    """Return what identifies the UTC offsets of a timezone from ``first`` on.
+
+    Parameters:
+        transitions: The sorted transition times in UTC without ``tzinfo``
+            and the UTC offsets after them.
+        first: The first time to compare.
+
+    Returns:
+        The offset at ``first`` and the changes of the offset after that
+        or ``None`` if the offset at ``first`` is not known.
+    """
+    offset = None
+    changes = []
+    for time, new_offset in transitions:
+        if time >= LAST:
+            break
+        if time <= first:
+            offset = new_offset
+        elif offset is not None and new_offset != (
+            changes[-1][1] if changes else offset
+        ):
+            changes.append((time, new_offset))
+    if offset is None:
+        return None
+    return offset, tuple(changes)
+
+
+def component_fingerprint(component: Timezone, first_year: int) -> Fingerprint | None:
+    """Return the fingerprint of a VTIMEZONE component."""
+    transition_times, transition_info = component.get_transitions()
+    return get_fingerprint(
+        (
+            (time, info[0])
+            for time, info in zip(transition_times, transition_info, strict=True)
+        ),
+        datetime(first_year, 1, 1),  # noqa: DTZ001
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def iana_fingerprint(key: str, first_year: int) -> Fingerprint | None:
+    """Return the fingerprint of an IANA timezone.
+
+    Returns:
+        ``None`` if the timezone cannot be found.
+    """
+    times = utc_transition_times(key, LAST)
+    if times is None:
+        return None
+    try:
+        tz = zoneinfo.ZoneInfo(key)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        return None
+    first = datetime(first_year, 1, 1)  # noqa: DTZ001
+
+    def offset(time: datetime) -> timedelta:
+        return time.replace(tzinfo=timezone.utc).astimezone(tz).utcoffset()
+
+    return get_fingerprint(
+        [(first, offset(first))]
+        + [(time, offset(time)) for time in times if time > first],
+        first,
+    )
+
+
+@functools.cache
+def _iana_tzids(first_year: int) -> dict[Fingerprint, str]:
+    """Map the fingerprints of all IANA timezones to their IDs.
+
+    If timezones are equivalent, the first ID in sorted order is used.
+    """
+    result = {}
+    for key in sorted(zoneinfo.available_timezones() - IGNORED_TZIDS):
+        fingerprint = iana_fingerprint(key, first_year)
+        if fingerprint is not None:
+            result.setdefault(fingerprint, key)
+    return result
+
+
+def find_equivalent_tzid(
+    component: Timezone, first_year: int, hints: Iterable[str] = ()
+) -> str | None:
+    """Return the ID of an IANA timezone that is equivalent to the component.
+
+    Parameters:
+        component: The VTIMEZONE component.
+        first_year: The transitions are compared from the start of this year on.
+        hints: IDs of IANA timezones to try first,
+            for example from the TZID of the component.
+
+    Returns:
+        ``None`` if no IANA timezone is equivalent.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from icalendar import Calendar
+            >>> from icalendar.timezone.substitution import find_equivalent_tzid
+            >>> calendar = Calendar.example("timezone_same_start")
+            >>> component = calendar.timezones[0]
+            >>> component.tz_name
+            'Pacific Standard Time'
+            >>> find_equivalent_tzid(component, 2010, ["America/Los_Angeles"])
+            'America/Los_Angeles'
+    """
+    fingerprint = component_fingerprint(component, first_year)
+    if fingerprint is None:
+        return None
+    for hint in hints:
+        if iana_fingerprint(hint, first_year) == fingerprint:
+            return hint
+    return _iana_tzids(first_year).get(fingerprint)
+
+
+__all__ = [
+    "component_fingerprint",
+    "find_equivalent_tzid",
+    "get_fingerprint",
+    "iana_fingerprint",
+]
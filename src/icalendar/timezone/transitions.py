@@ -0,0 +1,202 @@
+"""Tables of the transitions of timezones."""
+
+from __future__ import annotations
+
+import zoneinfo
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import TYPE_CHECKING
+
+from .tzif import utc_transition_times
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from icalendar.compatibility import Self
+
+ZERO = timedelta(0)
+
+
+class TransitionTimezone(tzinfo):
+    """A timezone with a sorted table of UTC transitions.
+
+    The table is the result of :meth:`Timezone.get_transitions()
+    <icalendar.cal.timezone.Timezone.get_transitions>`.
+    :meth:`utcoffset`, :meth:`dst`, :meth:`tzname` and :meth:`fromutc`
+    find the transition with :func:`bisect.bisect_right`.
+    Local times are interpreted like :mod:`dateutil.tz` interprets
+    VTIMEZONE components: a transition happens at the local time before it.
+    Local times that are repeated are resolved with the ``fold``
+    attribute, see :pep:`495`.
+
+    Before the first transition, the first standard time is used.
+    After the last transition, the last offset applies,
+    unless a timezone for later times is given.
+    That is needed for rules without an end,
+    as the table can only have a limited number of transitions.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from datetime import datetime, timedelta
+            >>> from icalendar.timezone.transitions import TransitionTimezone
+            >>> tz = TransitionTimezone(
+            ...     "Custom/Zone",
+            ...     [datetime(2025, 3, 30, 1), datetime(2025, 10, 26, 1)],
+            ...     [
+            ...         (timedelta(hours=2), timedelta(hours=1), "CEST"),
+            ...         (timedelta(hours=1), timedelta(0), "CET"),
+            ...     ],
+            ... )
+            >>> datetime(2025, 7, 1, 12, tzinfo=tz).tzname()
+            'CEST'
+            >>> datetime(2025, 12, 1, 12, tzinfo=tz).utcoffset()
+            datetime.timedelta(seconds=3600)
+
+    """
+
+    def __init__(
+        self,
+        key: str,
+        transition_times: list[datetime],
+        transition_info: list[tuple[timedelta, timedelta, str]],
+        later: Callable[[], tzinfo] | None = None,
+    ) -> None:
+        """Create a timezone from its transitions.
+
+        Parameters:
+            key: The ID of the timezone.
+            transition_times: The sorted times of the transitions in UTC
+                without ``tzinfo``.
+            transition_info: For each transition, a tuple of the UTC offset,
+                the DST offset and the name of the timezone after it.
+            later: A function that creates the timezone to use after the last
+                transition. It is called on first use.
+        """
+        self.key = key
+        self._utc_times = transition_times
+        self._info = transition_info
+        self._later = later
+        self._later_tz: tzinfo | None = None
+        # before the first transition, use the first standard time
+        self._first = next(
+            (info for info in transition_info if not info[1]),
+            transition_info[0] if transition_info else (ZERO, ZERO, key),
+        )
+        # local times of the transitions, for fold=0 and fold=1
+        self._local_times: tuple[list[datetime], list[datetime]] = ([], [])
+        previous = self._first[0]
+        for utc_time, (offset, _, _) in zip(
+            transition_times, transition_info, strict=False
+        ):
+            self._local_times[0].append(utc_time + previous)
+            self._local_times[1].append(utc_time + min(previous, offset))
+            previous = offset
+
+    def __reduce__(self) -> tuple[type[Self], tuple]:
+        """Pickle the timezone."""
+        return self.__class__, (self.key, self._utc_times, self._info, self._later)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.key!r})"
+
+    def __str__(self) -> str:
+        return self.key
+
+    def _get_later_tz(self) -> tzinfo:
+        """Return the timezone after the last transition."""
+        if self._later_tz is None:
+            self._later_tz = self._later()
+        return self._later_tz
+
+    def _find(self, dt: datetime | None) -> tuple[timedelta, timedelta, str] | None:
+        """Return the transition info for a local time.
+
+        Returns:
+            ``None`` if the timezone for later times has to be used.
+        """
+        if dt is None:
+            return self._first
+        local_times = self._local_times[dt.fold]
+        index = bisect_right(local_times, dt.replace(tzinfo=None))
+        if index == 0:
+            return self._first
+        if index == len(local_times) and self._later is not None:
+            return None
+        return self._info[index - 1]
+
+    def utcoffset(self, dt: datetime | None) -> timedelta:
+        """The offset to UTC at the local time."""
+        info = self._find(dt)
+        if info is None:
+            return self._get_later_tz().utcoffset(dt)
+        return info[0]
+
+    def dst(self, dt: datetime | None) -> timedelta:
+        """The DST offset at the local time."""
+        info = self._find(dt)
+        if info is None:
+            return self._get_later_tz().dst(dt)
+        return info[1]
+
+    def tzname(self, dt: datetime | None) -> str:
+        """The name of the timezone at the local time."""
+        info = self._find(dt)
+        if info is None:
+            return self._get_later_tz().tzname(dt)
+        return info[2]
+
+    def fromutc(self, dt: datetime) -> datetime:
+        """Convert a UTC time with this timezone to the local time."""
+        if not isinstance(dt, datetime):
+            raise TypeError("fromutc() requires a datetime argument")
+        if dt.tzinfo is not self:
+            raise ValueError("dt.tzinfo is not self")
+        utc = dt.replace(tzinfo=None)
+        index = bisect_right(self._utc_times, utc)
+        if index == 0:
+            return dt + self._first[0]
+        if index == len(self._utc_times) and self._later is not None:
+            later_tz = self._get_later_tz()
+            local = later_tz.fromutc(dt.replace(tzinfo=later_tz))
+            return local.replace(tzinfo=self)
+        offset = self._info[index - 1][0]
+        previous = self._info[index - 2][0] if index > 1 else self._first[0]
+        local = dt + offset
+        if previous > offset and utc - self._utc_times[index - 1] < previous - offset:
+            # The local time is repeated after the clock is set back.
+            local = local.replace(fold=1)
+        return local
+
+
+def get_utc_transition_times(tz: tzinfo, until: datetime) -> list[datetime] | None:
+    """Return the times when the offsets of a timezone can change.
+
+    This reads the data of :class:`zoneinfo.ZoneInfo`, :mod:`pytz`
+    and :class:`TransitionTimezone` timezones.
+
+    Parameters:
+        tz: The timezone.
+        until: The last time the transitions are needed for.
+
+    Returns:
+        The sorted transition times in UTC without ``tzinfo``
+        or ``None`` if the timezone does not reveal them.
+    """
+    if isinstance(tz, timezone):
+        return []
+    if isinstance(tz, TransitionTimezone):
+        return None if tz._later is not None else tz._utc_times  # noqa: SLF001
+    pytz_transition_times = getattr(tz, "_utc_transition_times", None)
+    if pytz_transition_times is not None:
+        return pytz_transition_times
+    if hasattr(tz, "localize") and hasattr(tz, "_utcoffset"):
+        # pytz timezones with a fixed offset
+        return []
+    if isinstance(tz, zoneinfo.ZoneInfo) and tz.key is not None:
+        return utc_transition_times(tz.key, until)
+    return None
+
+
+__all__ = ["TransitionTimezone", "get_utc_transition_times"]
@@ -7,6 +7,7 @@ datetime.tzinfo object.
 
 from __future__ import annotations
 
+import functools
 from collections import defaultdict
 from datetime import date, time, timezone
 from pathlib import Path
@@ -14,7 +15,6 @@ from typing import TYPE_CHECKING
 
 from dateutil.tz import tz
 
-from icalendar.timezone import equivalent_timezone_ids_result
 from icalendar.timezone.windows_to_olson import WINDOWS_TO_OLSON
 from icalendar.tools import is_date
 
@@ -26,11 +26,26 @@ except ImportError:
 if TYPE_CHECKING:
     from datetime import datetime, tzinfo
 
-DATEUTIL_UTC = tz.gettz("UTC")
-DATEUTIL_UTC_PATH: str | None = getattr(DATEUTIL_UTC, "_filename", None)
-DATEUTIL_ZONEINFO_PATH = (
-    None if DATEUTIL_UTC_PATH is None else Path(DATEUTIL_UTC_PATH).parent
-)
+
+@functools.cache
+def _dateutil_zoneinfo_path() -> Path | None:
+    """The directory of the timezone files that dateutil uses.
+
+    :meta private:
+    """
+    path = getattr(tz.gettz("UTC"), "_filename", None)
+    return None if path is None else Path(path).parent
+
+
+def __getattr__(name: str):
+    """Compute the dateutil constants when they are first used."""
+    if name == "DATEUTIL_UTC":
+        return tz.gettz("UTC")
+    if name == "DATEUTIL_UTC_PATH":
+        return getattr(tz.gettz("UTC"), "_filename", None)
+    if name == "DATEUTIL_ZONEINFO_PATH":
+        return _dateutil_zoneinfo_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def tzids_from_tzinfo(tzinfo: tzinfo | None) -> tuple[str]:
@@ -63,12 +78,13 @@ def tzids_from_tzinfo(tzinfo: tzinfo | None) -> tuple[str]:
         if olson is not None:
             return _get_equivalent_tzids(olson)
         return _get_equivalent_tzids(tzinfo._name)  # noqa: SLF001
-    if hasattr(tzinfo, "_filename"):  # dateutil.tz.tzfile  # noqa: SIM102
-        if DATEUTIL_ZONEINFO_PATH is not None:
+    if hasattr(tzinfo, "_filename"):  # dateutil.tz.tzfile
+        zoneinfo_path = _dateutil_zoneinfo_path()
+        if zoneinfo_path is not None:
             # tzfile('/usr/share/zoneinfo/Europe/Berlin')
             path = tzinfo._filename  # noqa: SLF001
-            if path.startswith(str(DATEUTIL_ZONEINFO_PATH)):
-                tzid = str(Path(path).relative_to(DATEUTIL_ZONEINFO_PATH))
+            if path.startswith(str(zoneinfo_path)):
+                tzid = str(Path(path).relative_to(zoneinfo_path))
                 return _get_equivalent_tzids(tzid)
             return _get_equivalent_tzids(path)
     if isinstance(tzinfo, tz.tzutc):
@@ -98,39 +114,33 @@ def tzid_from_dt(dt: datetime) -> str | None:
     return tzid
 
 
-_EQUIVALENT_IDS: dict[str, set[str]] = defaultdict(set)
-
-
-def _add_equivalent_ids(value: tuple | dict | set):
-    """This adds equivalent ids/
+@functools.cache
+def _equivalent_ids() -> dict[str, set[str]]:
+    """Load the equivalent ids when they are first needed.
 
     As soon as one timezone implementation used claims their equivalence,
     they are considered equivalent.
     Have a look at icalendar.timezone.equivalent_timezone_ids.
-    """
-    if isinstance(value, set):
-        for tzid in value:
-            _EQUIVALENT_IDS[tzid].update(value)
-    elif isinstance(value, tuple):
-        _add_equivalent_ids(value[1])
-    elif isinstance(value, dict):
-        for value2 in value.values():
-            _add_equivalent_ids(value2)
-    else:
-        raise TypeError(
-            f"Expected tuple, dict or set, not {value.__class__.__name__}: {value!r}"
-        )
 
+    :meta private:
+    """
+    from .equivalent_timezone_ids_result import groups
 
-_add_equivalent_ids(equivalent_timezone_ids_result.lookup)
+    result: dict[str, set[str]] = defaultdict(set)
+    for line in groups.splitlines():
+        group = line.split()
+        for tzid in group:
+            result[tzid].update(group)
+    return result
 
 
+@functools.lru_cache(maxsize=1024)
 def _get_equivalent_tzids(tzid: str) -> tuple[str]:
     """This returns the tzids which are equivalent to this one.
 
     :meta private:
     """
-    ids = _EQUIVALENT_IDS.get(tzid, set())
+    ids = _equivalent_ids().get(tzid, set())
     return (tzid,) + tuple(sorted(ids - {tzid}))
 
 
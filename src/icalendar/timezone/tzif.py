@@ -0,0 +1,241 @@
+"""Read the transition times of IANA timezones from their TZif files.
+
+The format is described in :rfc:`8536`.
+The files are looked up like :class:`zoneinfo.ZoneInfo` does:
+first in :data:`zoneinfo.TZPATH`, then in the :mod:`tzdata` package.
+
+Recent versions of the timezone database only list the transitions
+until the rules stop changing.
+After that, the rule in the footer of the file applies.
+It is written like the ``TZ`` environment variable of POSIX.
+"""
+
+from __future__ import annotations
+
+import calendar
+import re
+import struct
+import zoneinfo
+from datetime import date, datetime, timedelta
+from importlib import resources
+from pathlib import Path
+
+HEADER = struct.Struct(">4sc15x6l")
+EPOCH = datetime(1970, 1, 1)  # noqa: DTZ001
+# the seconds since the epoch that datetime can represent
+MIN_SECONDS = -62135596800
+MAX_SECONDS = 253402300799
+
+POSIX_NAME = r"(?:[A-Za-z]{3,}|<[A-Za-z0-9+-]+>)"
+POSIX_OFFSET = r"[+-]?\d{1,3}(?::\d{1,2}(?::\d{1,2})?)?"
+POSIX_DATE = r"(?:M\d{1,2}\.\d\.\d|J\d{1,3}|\d{1,3})"
+POSIX_TZ = re.compile(
+    rf"^(?P<std>{POSIX_NAME})(?P<std_offset>{POSIX_OFFSET})"
+    rf"(?:(?P<dst>{POSIX_NAME})(?P<dst_offset>{POSIX_OFFSET})?"
+    rf",(?P<start>{POSIX_DATE})(?:/(?P<start_time>{POSIX_OFFSET}))?"
+    rf",(?P<end>{POSIX_DATE})(?:/(?P<end_time>{POSIX_OFFSET}))?)?$"
+)
+
+
+def read_tzif(key: str) -> bytes | None:
+    """Return the content of the TZif file of a timezone.
+
+    Returns:
+        ``None`` if the file cannot be found.
+    """
+    parts = key.split("/")
+    if not key or Path(key).is_absolute() or ".." in parts:
+        return None
+    for path in zoneinfo.TZPATH:
+        file_path = Path(path).joinpath(*parts)
+        if file_path.is_file():
+            return file_path.read_bytes()
+    try:
+        return resources.files("tzdata.zoneinfo").joinpath(*parts).read_bytes()
+    except (ImportError, OSError, UnicodeEncodeError):
+        return None
+
+
+def parse_tzif(data: bytes) -> tuple[list[int], str]:
+    """Return the transition times and the footer of a TZif file.
+
+    Returns:
+        The transition times in seconds since the epoch
+        and the ``TZ`` string of the footer, if the file has one.
+
+    Raises:
+        ValueError: if the data is not in the TZif format.
+    """
+    try:
+        magic, version, *counts = HEADER.unpack_from(data)
+    except struct.error as error:
+        raise ValueError("The TZif data is too short.") from error
+    if magic != b"TZif":
+        raise ValueError("The data is not in the TZif format.")
+    time_size = 4
+    position = HEADER.size
+    if version != b"\x00":
+        # skip the data of version 1 and use the 64 bit times of version 2+
+        position += _data_size(counts, time_size)
+        magic, version, *counts = HEADER.unpack_from(data, position)
+        position += HEADER.size
+        time_size = 8
+    _, _, _, timecnt, _, _ = counts
+    times = list(
+        struct.unpack_from(
+            f">{timecnt}{'q' if time_size == 8 else 'l'}", data, position
+        )
+    )
+    footer = ""
+    if time_size == 8:
+        position += _data_size(counts, time_size)
+        footer = data[position:].strip(b"\n").decode("ascii")
+    return times, footer
+
+
+def _data_size(counts: list[int], time_size: int) -> int:
+    """The size of the data block after the header."""
+    isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+    return (
+        timecnt * (time_size + 1)
+        + typecnt * 6
+        + charcnt
+        + leapcnt * (time_size + 4)
+        + isstdcnt
+        + isutcnt
+    )
+
+
+def _parse_seconds(value: str | None, default: int = 0) -> int:
+    """Parse [+-]hh[:mm[:ss]] to seconds."""
+    if value is None:
+        return default
+    sign = -1 if value.startswith("-") else 1
+    hours, minutes, seconds, *_ = [
+        int(part) for part in value.lstrip("+-").split(":")
+    ] + [0, 0]
+    return sign * (hours * 3600 + minutes * 60 + seconds)
+
+
+def _rule_date(rule: str, year: int) -> date:
+    """The date of a POSIX rule like ``M3.5.0``, ``J60`` or ``59`` in a year."""
+    if rule.startswith("M"):
+        month, week, weekday = (int(part) for part in rule[1:].split("."))
+        # POSIX weeks start on Sunday with 0, Python weeks on Monday
+        first_weekday, days_in_month = calendar.monthrange(year, month)
+        day = 1 + ((weekday - 1) % 7 - first_weekday) % 7 + (week - 1) * 7
+        while day > days_in_month:
+            day -= 7
+        return date(year, month, day)
+    if rule.startswith("J"):
+        # 1 to 365, February 29 is never counted
+        day = int(rule[1:])
+        if calendar.isleap(year) and day >= 60:
+            day += 1
+        return date(year, 1, 1) + timedelta(days=day - 1)
+    return date(year, 1, 1) + timedelta(days=int(rule))
+
+
+def posix_transitions(tz_string: str, first_year: int, last_year: int) -> list[int]:
+    """Return the transition times of a POSIX ``TZ`` string.
+
+    Parameters:
+        tz_string: The rule, for example ``"CET-1CEST,M3.5.0,M10.5.0/3"``.
+        first_year: The first year to compute the transitions for.
+        last_year: The last year to compute the transitions for.
+
+    Returns:
+        The sorted transition times in seconds since the epoch.
+
+    Raises:
+        ValueError: if the rule cannot be parsed.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from datetime import datetime, timedelta
+            >>> from icalendar.timezone.tzif import posix_transitions
+            >>> rule = "CET-1CEST,M3.5.0,M10.5.0/3"
+            >>> for seconds in posix_transitions(rule, 2025, 2025):
+            ...     print(datetime(1970, 1, 1) + timedelta(seconds=seconds))
+            2025-03-30 01:00:00
+            2025-10-26 01:00:00
+    """
+    match = POSIX_TZ.match(tz_string)
+    if match is None:
+        raise ValueError(f"Cannot parse the timezone rule {tz_string!r}.")
+    if match.group("dst") is None:
+        return []
+    # POSIX offsets are positive west of Greenwich
+    std_offset = -_parse_seconds(match.group("std_offset"))
+    dst_offset = -_parse_seconds(match.group("dst_offset"), -std_offset - 3600)
+    result = []
+    for year in range(first_year, last_year + 1):
+        # the start is in standard time, the end in daylight saving time
+        for rule, time, offset in (
+            (match.group("start"), match.group("start_time"), std_offset),
+            (match.group("end"), match.group("end_time"), dst_offset),
+        ):
+            day = _rule_date(rule, year) - EPOCH.date()
+            result.append(day.days * 86400 + _parse_seconds(time, 7200) - offset)
+    result.sort()
+    return result
+
+
+def utc_transition_times(key: str, until: datetime) -> list[datetime] | None:
+    """Return the transition times of an IANA timezone.
+
+    Parameters:
+        key: The ID of the timezone, e.g. ``"Europe/Berlin"``.
+        until: The transitions of the rule in the footer are computed
+            until the end of this year.
+
+    Returns:
+        The sorted transition times in UTC without ``tzinfo``
+        or ``None`` if the data cannot be read.
+
+    Example:
+
+        .. code-block:: pycon
+
+            >>> from datetime import datetime
+            >>> from icalendar.timezone.tzif import utc_transition_times
+            >>> times = utc_transition_times("Europe/Berlin", datetime(2026, 1, 1))
+            >>> for dt in times:
+            ...     if dt.year == 2026:
+            ...         print(dt)
+            2026-03-29 01:00:00
+            2026-10-25 01:00:00
+    """
+    data = read_tzif(key)
+    if data is None:
+        return None
+    try:
+        times, footer = parse_tzif(data)
+        if footer:
+            last = times[-1] if times else None
+            first_year = (
+                1970 if last is None else (EPOCH + timedelta(seconds=last)).year
+            )
+            times.extend(
+                time
+                for time in posix_transitions(footer, first_year, until.year)
+                if last is None or time > last
+            )
+    except ValueError:
+        return None
+    # the first transition can be long before year 1
+    return [
+        EPOCH + timedelta(seconds=time)
+        for time in times
+        if MIN_SECONDS <= time <= MAX_SECONDS
+    ]
+
+
+__all__ = [
+    "parse_tzif",
+    "posix_transitions",
+    "read_tzif",
+    "utc_transition_times",
+]
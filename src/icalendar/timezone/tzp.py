@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, time
+from types import MappingProxyType
 from typing import TYPE_CHECKING, overload
 
+from icalendar import config
 from icalendar.tools import to_datetime
 
+from . import disk_cache
+from .cache import LRUCache, tzinfo_cache
+from .substitution import find_equivalent_tzid
 from .windows_to_olson import WINDOWS_TO_OLSON
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterable, Iterator, Mapping
 
     from dateutil.rrule import rrule
 
@@ -20,6 +27,11 @@ if TYPE_CHECKING:
 
 DEFAULT_TIMEZONE_PROVIDER = "zoneinfo"
 
+# the caches of TZP.scope() in the current context
+_scopes: ContextVar[Mapping[TZP, LRUCache[str, datetime.tzinfo]]] = ContextVar(
+    "icalendar_tzp_scopes", default=MappingProxyType({})
+)
+
 
 class TZP:
     """This is the timezone provider proxy.
@@ -29,6 +41,9 @@ class TZP:
     All of icalendar will then use this timezone implementation.
     """
 
+    unknown_tzid_cache_size: int = 1024
+    """The number of timezone IDs that are remembered as unknown."""
+
     def __init__(self, provider: str | TZProvider = DEFAULT_TIMEZONE_PROVIDER) -> None:
         """Create a new timezone implementation proxy."""
         self.use(provider)
@@ -48,7 +63,12 @@ class TZP:
     def _use(self, provider: TZProvider) -> None:
         """Use a timezone implementation."""
         self.__tz_cache = {}
+        self.__unknown_tzids: LRUCache[str, bool] = LRUCache(
+            self.unknown_tzid_cache_size
+        )
         self.__provider = provider
+        # timezones are created again with the new provider
+        tzinfo_cache.clear()
 
     def use(self, provider: str | TZProvider):
         """Switch to a different timezone provider."""
@@ -62,6 +82,45 @@ class TZP:
         else:
             self._use(provider)
 
+    @contextmanager
+    def scope(self, maxsize: int = 128) -> Iterator[LRUCache[str, datetime.tzinfo]]:
+        """Cache timezones of VTIMEZONE components only in this context.
+
+        By default, the timezones of all parsed VTIMEZONE components
+        are cached for the whole process.
+        Inside of the ``with`` block, they are cached separately
+        and the shared cache is not changed.
+        Timezones that are not in the scope are looked up as usual.
+        The scope belongs to the current :mod:`contextvars` context,
+        so that threads and :mod:`asyncio` tasks do not share it.
+
+        Parameters:
+            maxsize: The number of timezones to cache in the scope.
+
+        Example:
+
+            A custom timezone is only known inside of the scope.
+
+            .. code-block:: pycon
+
+                >>> from icalendar import Timezone
+                >>> from icalendar.timezone import tzp
+                >>> fiji = Timezone.example("pacific_fiji")
+                >>> fiji["TZID"] = "Tenant/Fiji"
+                >>> with tzp.scope():
+                ...     tzp.cache_timezone_component(fiji)
+                ...     tzp.timezone("Tenant/Fiji") is not None
+                True
+                >>> tzp.timezone("Tenant/Fiji") is None
+                True
+        """
+        cache: LRUCache[str, datetime.tzinfo] = LRUCache(maxsize)
+        token = _scopes.set({**_scopes.get(), self: cache})
+        try:
+            yield cache
+        finally:
+            _scopes.reset(token)
+
     def use_default(self) -> None:
         """Use the default timezone provider."""
         self.use(DEFAULT_TIMEZONE_PROVIDER)
@@ -104,21 +163,86 @@ class TZP:
             return localized.timetz()
         return self.__provider.localize(to_datetime(dt), tz)
 
+    def localize_utc_many(
+        self, dts: Iterable[datetime.date]
+    ) -> list[datetime.datetime]:
+        """Return the datetimes in UTC.
+
+        This is the same as calling :meth:`localize_utc` for each datetime
+        but faster for many datetimes.
+        """
+        return self.__provider.localize_utc_many(map(to_datetime, dts))
+
+    def localize_many(
+        self, dts: Iterable[datetime.date], tz: datetime.tzinfo | str | None
+    ) -> list[datetime.datetime]:
+        """Localize datetimes to a timezone.
+
+        This is the same as calling :meth:`localize` for each datetime
+        but the timezone is looked up only once.
+        Dates are converted to datetimes at midnight.
+        This is faster for many datetimes, for example,
+        the values of RDATE and EXDATE.
+
+        Example:
+
+            .. code-block:: pycon
+
+                >>> from datetime import datetime
+                >>> from icalendar.timezone import tzp
+                >>> dts = [datetime(2025, 3, 30, 1), datetime(2025, 3, 30, 3)]
+                >>> for dt in tzp.localize_many(dts, "Europe/Berlin"):
+                ...     print(dt.isoformat())
+                2025-03-30T01:00:00+01:00
+                2025-03-30T03:00:00+02:00
+        """
+        if isinstance(tz, str):
+            tz = self.timezone(tz)
+        if tz is None:
+            return [to_datetime(dt).replace(tzinfo=None) for dt in dts]
+        return self.__provider.localize_many(map(to_datetime, dts), tz)
+
     def cache_timezone_component(self, timezone_component: Timezone.Timezone) -> None:
         """Cache the timezone that is created from a timezone component
         if it is not already known.
 
         This can influence the result from timezone(): Once cached, the
         custom timezone is returned from timezone().
+        Inside of :meth:`scope`, the timezone is only cached for the scope.
+        If :data:`icalendar.config.SUBSTITUTE_TIMEZONES_SINCE` is set,
+        an equivalent IANA timezone may be cached instead.
         """
         _unclean_id = timezone_component["TZID"]
         _id = self.clean_timezone_id(_unclean_id)
-        if (
-            not self.__provider.knows_timezone_id(_id)
-            and not self.__provider.knows_timezone_id(_unclean_id)
-            and _id not in self.__tz_cache
+        if self.__provider.knows_timezone_id(_id) or self.__provider.knows_timezone_id(
+            _unclean_id
         ):
-            self.__tz_cache[_id] = timezone_component.to_tz(self, lookup_tzid=False)
+            return
+        scope = _scopes.get().get(self)
+        if scope is not None:
+            if scope.get(_id) is None:
+                scope.set(_id, self.__timezone_of_component(timezone_component))
+        elif _id not in self.__tz_cache:
+            self.__tz_cache[_id] = self.__timezone_of_component(timezone_component)
+            # Unknown IDs may be found now.
+            self.__unknown_tzids.clear()
+
+    def __timezone_of_component(self, timezone_component: Timezone) -> datetime.tzinfo:
+        """Return the timezone for a component with an unknown TZID.
+
+        If :data:`icalendar.config.SUBSTITUTE_TIMEZONES_SINCE` is set,
+        an equivalent IANA timezone is used if there is one.
+        """
+        first_year = config.SUBSTITUTE_TIMEZONES_SINCE
+        if first_year is not None:
+            hints = [tzid for tzid, _ in self._lookup_ids(timezone_component["TZID"])]
+            if "X-LIC-LOCATION" in timezone_component:
+                hints.insert(0, str(timezone_component["X-LIC-LOCATION"]))
+            tzid = find_equivalent_tzid(timezone_component, first_year, hints)
+            tz = None if tzid is None else self.__provider.timezone(tzid)
+            if tz is not None:
+                return tz
+        return timezone_component.to_tz(self, lookup_tzid=False)
 
     def fix_rrule_until(self, rrule: rrule, ical_rrule: prop.vRecur) -> None:
         """Make sure the until value works."""
@@ -127,9 +251,21 @@ class TZP:
     def create_timezone(self, timezone_component: Timezone.Timezone) -> datetime.tzinfo:
         """Create a timezone from a timezone component.
 
-        This component will not be cached.
+        Components with the same content share one timezone,
+        see :data:`~icalendar.timezone.cache.tzinfo_cache`.
+        The timezone is not returned by :meth:`timezone`.
+        If :data:`icalendar.config.TIMEZONE_CACHE_DIRECTORY` is set,
+        the timezone is stored there and loaded by other processes.
         """
-        return self.__provider.create_timezone(timezone_component)
+        return tzinfo_cache.get_tzinfo(
+            timezone_component,
+            self.name,
+            lambda: disk_cache.get_tzinfo(
+                timezone_component,
+                self.name,
+                lambda: self.__provider.create_timezone(timezone_component),
+            ),
+        )
 
     def clean_timezone_id(self, tzid: str) -> str:
         """Return a clean version of the timezone id.
@@ -149,12 +285,38 @@ class TZP:
         candidate IDs from :meth:`_lookup_ids` in order, checking the cache
         before the provider for each one, and cache the first match under the
         primary ID so the next lookup is fast.
+        IDs that cannot be found are remembered, too.
         """
+        scope = _scopes.get().get(self)
+        if scope:
+            tz = self.__find_timezone(tz_id, scope.get, scope.set)
+            if tz is not None:
+                return tz
+        if self.__unknown_tzids.get(tz_id):
+            return None
+        tz = self.__find_timezone(
+            tz_id, self.__shared_timezone, self.__tz_cache.__setitem__
+        )
+        if tz is None:
+            self.__unknown_tzids.set(tz_id, True)
+        return tz
+
+    def __shared_timezone(self, tz_id: str) -> datetime.tzinfo | None:
+        """Return a timezone from the shared cache or the provider."""
+        return self.__tz_cache.get(tz_id) or self.__provider.timezone(tz_id)
+
+    def __find_timezone(
+        self,
+        tz_id: str,
+        get: Callable[[str], datetime.tzinfo | None],
+        cache: Callable[[str, datetime.tzinfo], None],
+    ) -> datetime.tzinfo | None:
+        """Try the IDs of :meth:`_lookup_ids` and cache the first match."""
         primary = None
         for lookup_id, is_global_guess in self._lookup_ids(tz_id):
             if primary is None:
                 primary = lookup_id
-            tz = self.__tz_cache.get(lookup_id) or self.__provider.timezone(lookup_id)
+            tz = get(lookup_id)
             if tz is not None:
                 if is_global_guess:
                     from icalendar.error import GloballyUniqueTZIDGuessed
@@ -164,9 +326,9 @@ class TZP:
                         f"guessing it means {lookup_id!r} by stripping the vendor "
                         "prefix. This may be wrong. See RFC 5545 section 3.2.19.",
                         GloballyUniqueTZIDGuessed,
-                        stacklevel=3,
+                        stacklevel=4,
                     )
-                self.__tz_cache[primary] = tz
+                cache(primary, tz)
                 return tz
         return None
 
@@ -18,8 +18,11 @@ from dateutil.tz.tz import _tzicalvtz
 from icalendar.tools import is_date, to_datetime
 
 from .provider import TZProvider
+from .transitions import TransitionTimezone
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from icalendar import prop
     from icalendar.cal import Timezone
     from icalendar.prop import vDDDTypes
@@ -67,6 +70,20 @@ class ZONEINFO(TZProvider):
             return dt.astimezone(self.utc)
         return self.localize(dt, self.utc)
 
+    def localize_many(
+        self, dts: Iterable[datetime], tz: zoneinfo.ZoneInfo
+    ) -> list[datetime]:
+        """Localize datetimes to a timezone."""
+        return [dt.replace(tzinfo=tz) for dt in dts]
+
+    def localize_utc_many(self, dts: Iterable[datetime]) -> list[datetime]:
+        """Return the datetimes in UTC."""
+        utc = self.utc
+        return [
+            dt.replace(tzinfo=utc) if dt.tzinfo is None else dt.astimezone(utc)
+            for dt in dts
+        ]
+
     def timezone(self, name: str) -> tzinfo | None:
         """Return a timezone with a name or None if we cannot find it."""
         try:
@@ -88,28 +105,19 @@ class ZONEINFO(TZProvider):
             rrule._until = datetime(2038, 12, 31, tzinfo=self.utc)  # noqa: SLF001
 
     def create_timezone(self, tz: Timezone.Timezone) -> tzinfo:
-        """Create a timezone from the given information."""
-        try:
-            return self._create_timezone(tz)
-        except ValueError:
-            # We might have a custom component in there.
-            # see https://github.com/python/cpython/issues/120217
-            tz = copy.deepcopy(tz)
-            for sub in tz.walk():
-                for attr in list(sub.keys()):
-                    if attr.lower().startswith("x-"):
-                        sub.pop(attr)
-            for sub in tz.subcomponents:
-                start: vDDDTypes = sub.get("DTSTART")
-                if start and hasattr(start, "dt") and is_date(start.dt):
-                    # ValueError: Unsupported DTSTART param in VTIMEZONE: VALUE=DATE
-                    sub.DTSTART = to_datetime(start.dt)
-            return self._create_timezone(tz)
-
-    def _create_timezone(self, tz: Timezone.Timezone) -> tzinfo:
-        """Create a timezone and maybe fail"""
-        file = StringIO(tz.to_ical().decode("UTF-8", "replace"))
-        return tzical(file).get()
+        """Create a timezone from the given information.
+
+        The offsets are looked up in the transitions of the timezone
+        component. Rules without an end are only expanded for a limited
+        time. After that, :mod:`dateutil` computes the offsets.
+        """
+        transition_times, transition_info = tz.get_transitions()
+        later = (
+            functools.partial(create_tzical_timezone, tz)
+            if has_open_ended_rules(tz)
+            else None
+        )
+        return TransitionTimezone(tz.tz_name, transition_times, transition_info, later)
 
     def uses_pytz(self) -> bool:
         """Whether we use pytz."""
@@ -120,6 +128,41 @@ class ZONEINFO(TZProvider):
         return True
 
 
+def has_open_ended_rules(tz: Timezone.Timezone) -> bool:
+    """Whether the timezone has transitions that repeat forever."""
+    return any(
+        not {"UNTIL", "COUNT"}.intersection(rrule.keys())
+        for sub in tz.subcomponents
+        for rrule in sub.rrules
+    )
+
+
+def create_tzical_timezone(tz: Timezone.Timezone) -> tzinfo:
+    """Create a timezone from the component with :class:`dateutil.tz.tzical`."""
+    try:
+        return _create_tzical_timezone(tz)
+    except ValueError:
+        # We might have a custom component in there.
+        # see https://github.com/python/cpython/issues/120217
+        tz = copy.deepcopy(tz)
+        for sub in tz.walk():
+            for attr in list(sub.keys()):
+                if attr.lower().startswith("x-"):
+                    sub.pop(attr)
+        for sub in tz.subcomponents:
+            start: vDDDTypes = sub.get("DTSTART")
+            if start and hasattr(start, "dt") and is_date(start.dt):
+                # ValueError: Unsupported DTSTART param in VTIMEZONE: VALUE=DATE
+                sub.DTSTART = to_datetime(start.dt)
+        return _create_tzical_timezone(tz)
+
+
+def _create_tzical_timezone(tz: Timezone.Timezone) -> tzinfo:
+    """Create a timezone and maybe fail"""
+    file = StringIO(tz.to_ical().decode("UTF-8", "replace"))
+    return tzical(file).get()
+
+
 def pickle_tzicalvtz(tzicalvtz: _tzicalvtz):
     """Because we use dateutil.tzical, we need to make it pickle-able."""
     return _tzicalvtz, (tzicalvtz._tzid, tzicalvtz._comps)  # noqa: SLF001